@@ -1,57 +1,40 @@
-
-
 import os
+import sys
 import pickle
-import mediapipe as mp
-import cv2
 
-# MediaPipe setup
-mp_hands = mp.solutions.hands
-hands = mp_hands.Hands(static_image_mode=True, min_detection_confidence=0.3)
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from sayable.dataset import IMAGES, extract_all, list_samples, parse_build_args
 
 # Data directory
 DATA_DIR = './data'
 
-data = []
-labels = []
-
 # Only consider folders with alphabet names (A-Z)
 alphabet_classes = [chr(i) for i in range(ord('A'), ord('Z') + 1)]
 
-for dir_ in sorted(os.listdir(DATA_DIR)):
-    if dir_ not in alphabet_classes:
-        continue  # Skip any non-alphabet folders
-
-    print(f'Processing folder: {dir_}')
-    dir_path = os.path.join(DATA_DIR, dir_)
 
-    for img_path in os.listdir(dir_path):
-        data_aux = []
-        x_ = []
-        y_ = []
+def main():
+    args = parse_build_args("Build data.pickle from ./data")
 
-        img = cv2.imread(os.path.join(dir_path, img_path))
-        if img is None:
-            continue  # skip unreadable images
+    samples = list_samples(DATA_DIR, alphabet_classes)
+    features = extract_all(
+        samples, IMAGES, workers=args.workers,
+        cache_dir=None if args.no_cache else args.cache_dir
+    )
 
-        img_rgb = cv2.cvtColor(img, cv2.COLOR_BGR2RGB)
-        results = hands.process(img_rgb)
-
-        if results.multi_hand_landmarks:
-            for hand_landmarks in results.multi_hand_landmarks:
-                for lm in hand_landmarks.landmark:
-                    x_.append(lm.x)
-                    y_.append(lm.y)
+    data = []
+    labels = []
+    for (label, _), data_aux in zip(samples, features):
+        # Same features as live inference: first hand, min-normalized
+        if data_aux is not None:
+            data.append(data_aux)
+            labels.append(label)  # A-Z label
 
-                for lm in hand_landmarks.landmark:
-                    data_aux.append(lm.x - min(x_))
-                    data_aux.append(lm.y - min(y_))
+    # Save as pickle
+    with open('data.pickle', 'wb') as f:
+        pickle.dump({'data': data, 'labels': labels}, f)
 
-            data.append(data_aux)
-            labels.append(dir_)  # A-Z label
+    print("✅ Dataset saved as 'data.pickle'")
 
-# Save as pickle
-with open('data.pickle', 'wb') as f:
-    pickle.dump({'data': data, 'labels': labels}, f)
 
-print("✅ Dataset saved as 'data.pickle'")
+if __name__ == "__main__":
+    main()
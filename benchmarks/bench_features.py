@@ -0,0 +1,123 @@
+# benchmarks/bench_features.py
+#
+# Per-frame cost of turning MediaPipe hand landmarks into classifier features:
+# the original nested Python loops (min() recomputed inside the loop) against
+# sayable.features.FeatureExtractor.
+#
+#   python benchmarks/bench_features.py [--frames 20000]
+#
+# Uses synthetic landmark objects with the same .landmark / .x / .y / handedness
+# shape as MediaPipe results, so no camera or model is needed.
+
+import argparse
+import os
+import random
+import sys
+import time
+from types import SimpleNamespace
+
+import numpy as np
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from sayable.features import FeatureExtractor
+
+
+def fake_results(num_hands, rng):
+    hands, handedness = [], []
+    for i in range(num_hands):
+        # MediaPipe stores landmarks as float32; mimic that precision
+        landmark = [
+            SimpleNamespace(x=float(np.float32(rng.uniform(0.2, 0.8))),
+                            y=float(np.float32(rng.uniform(0.2, 0.8))),
+                            z=0.0)
+            for _ in range(21)
+        ]
+        hands.append(SimpleNamespace(landmark=landmark))
+        label = "Left" if i == 0 else "Right"
+        handedness.append(SimpleNamespace(classification=[SimpleNamespace(label=label)]))
+    return SimpleNamespace(multi_hand_landmarks=hands or None, multi_handedness=handedness or None)
+
+
+# === Original implementations (as they were in the mode scripts) ===
+def legacy_single_hand(results):
+    data_aux = []
+    x_, y_ = [], []
+    if results.multi_hand_landmarks:
+        for hand_landmarks in results.multi_hand_landmarks:
+            for lm in hand_landmarks.landmark:
+                x_.append(lm.x)
+                y_.append(lm.y)
+
+            for lm in hand_landmarks.landmark:
+                data_aux.append(lm.x - min(x_))
+                data_aux.append(lm.y - min(y_))
+            return np.asarray(data_aux)
+    return None
+
+
+def legacy_two_hands(results):
+    left_hand = [0.0] * 42
+    right_hand = [0.0] * 42
+
+    if results.multi_hand_landmarks:
+        for hand_landmarks, handedness in zip(results.multi_hand_landmarks, results.multi_handedness):
+            coords = []
+            x_vals = [lm.x for lm in hand_landmarks.landmark]
+            y_vals = [lm.y for lm in hand_landmarks.landmark]
+            for lm in hand_landmarks.landmark:
+                coords.append(lm.x - min(x_vals))
+                coords.append(lm.y - min(y_vals))
+            if handedness.classification[0].label == "Left":
+                left_hand = coords
+            else:
+                right_hand = coords
+
+    return left_hand + right_hand
+
+
+def time_per_call(fn, samples, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for results in samples:
+            fn(results)
+    return (time.perf_counter() - start) / (repeat * len(samples)) * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Landmark-to-feature micro-benchmark")
+    parser.add_argument("--frames", type=int, default=20000, help="calls timed per case")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    extractor = FeatureExtractor()
+    samples_1 = [fake_results(1, rng) for _ in range(200)]
+    samples_2 = [fake_results(2, rng) for _ in range(200)]
+    repeat = max(1, args.frames // 200)
+
+    # The models cast inputs to float32, so that is the comparison that matters
+    max_diff = 0.0
+    for results in samples_1:
+        old = legacy_single_hand(results).astype(np.float32)
+        max_diff = max(max_diff, float(np.abs(old - extractor.single_hand(results)).max()))
+    for results in samples_2:
+        old = np.asarray(legacy_two_hands(results), dtype=np.float32)
+        new = extractor.two_hands(results).astype(np.float32)
+        max_diff = max(max_diff, float(np.abs(old - new).max()))
+
+    cases = [
+        ("static, 1 hand (42)", legacy_single_hand, extractor.single_hand, samples_1),
+        ("word, 1 hand (84)", legacy_two_hands, extractor.two_hands, samples_1),
+        ("word, 2 hands (84)", legacy_two_hands, extractor.two_hands, samples_2),
+    ]
+
+    print(f"{'case':<22}{'before µs':>12}{'after µs':>12}{'speed-up':>10}")
+    for name, before_fn, after_fn, samples in cases:
+        before = time_per_call(before_fn, samples, repeat)
+        after = time_per_call(after_fn, samples, repeat)
+        print(f"{name:<22}{before:>12.2f}{after:>12.2f}{before / after:>9.1f}x")
+    print(f"\nmax |before - after| as float32: {max_diff:.3g}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+# benchmarks/bench_forest.py
+#
+# Single-sample classifier latency: sklearn RandomForestClassifier.predict_proba
+# against the flat-array CompiledForest (sayable/forest.py) for every mode's model.
+#
+#   python -m sayable.forest               # export the models first
+#   python benchmarks/bench_forest.py [--calls 500]
+
+import argparse
+import os
+import pickle
+import sys
+import time
+import warnings
+
+import numpy as np
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from sayable.forest import compile_forest, load_compiled
+from sayable.modes import MODES
+
+
+def latencies_us(fn, rows):
+    times = []
+    for row in rows:
+        start = time.perf_counter()
+        fn(row)
+        times.append((time.perf_counter() - start) * 1e6)
+    return np.percentile(times, [50, 99])
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compiled forest vs sklearn latency at batch size 1")
+    parser.add_argument("--calls", type=int, default=500, help="single-row calls per model")
+    args = parser.parse_args()
+
+    warnings.filterwarnings("ignore")  # sklearn version mismatch warnings on unpickle
+    rng = np.random.default_rng(0)
+
+    print(f"{'mode':<11}{'sklearn p50/p99 µs':>22}{'compiled p50/p99 µs':>24}{'speed-up':>10}{'identical':>11}")
+    for spec in MODES.values():
+        with open(spec.model_path, 'rb') as f:
+            model = pickle.load(f)['model']
+        compiled = load_compiled(spec.model_path) or compile_forest(model)
+
+        rows = [rng.random((1, model.n_features_in_)) for _ in range(args.calls)]
+        identical = all(np.array_equal(model.predict_proba(r), compiled.predict_proba(r)) for r in rows[:100])
+
+        before = latencies_us(model.predict_proba, rows)
+        after = latencies_us(compiled.predict_proba, rows)
+        print(
+            f"{spec.key:<11}{before[0]:>12.0f} / {before[1]:<8.0f}{after[0]:>13.0f} / {after[1]:<9.0f}"
+            f"{before[0] / after[0]:>9.1f}x{str(identical):>11}"
+        )
+
+
+if __name__ == "__main__":
+    main()
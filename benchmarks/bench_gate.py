@@ -0,0 +1,98 @@
+# benchmarks/bench_gate.py
+#
+# What idling the detector saves on an empty scene, and how fast it wakes up.
+#
+#   empty scene   a still frame with camera-like noise, played at 30 fps through
+#                 the live pipeline (capture + inference threads) with the gate off
+#                 and on; reports CPU use (process CPU seconds per wall second)
+#   wake-up       after the gate has gone idle, motion frames are fed in; reports
+#                 how many motion frames pass before the detector runs again
+#
+#   python benchmarks/bench_gate.py --source clip.avi
+
+import argparse
+import os
+import sys
+import time
+
+import cv2
+import numpy as np
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from sayable.gate import MotionGate
+from sayable.modes import MODES
+from sayable.pipeline import RecognitionPipeline
+from sayable.runtime import SharedRuntime
+from sayable.sources import ArraySource, open_source
+from sayable.speech import SilentSpeaker
+
+
+def noisy_still(frame, count, sigma, seed=0):
+    rng = np.random.default_rng(seed)
+    base = frame.astype(np.int16)
+    return [np.clip(base + rng.normal(0, sigma, frame.shape), 0, 255).astype(np.uint8) for _ in range(count)]
+
+
+def empty_scene_cpu(mode, frames, fps, duration, idle_after):
+    source = ArraySource(frames, fps=fps, realtime=True, loop=True, name="empty scene")
+    runtime = SharedRuntime(mode, source=source, speaker=SilentSpeaker(), verbose=False, idle_after=idle_after)
+    pipeline = RecognitionPipeline(runtime, runtime.open_source())
+    pipeline.start()
+    time.sleep(idle_after + 1.0)  # let the gate settle into idle
+    cpu, wall = time.process_time(), time.perf_counter()
+    time.sleep(duration)
+    cpu, wall = time.process_time() - cpu, time.perf_counter() - wall
+    pipeline.stop()
+    return cpu / wall, runtime.gate.stats() if runtime.gate else None
+
+
+def wake_up(mode, still, motion, idle_after):
+    clock = [0.0]
+    runtime = SharedRuntime(mode, speaker=SilentSpeaker(), verbose=False)
+    runtime.gate = MotionGate(idle_after, clock=lambda: clock[0])
+    for frame in still:
+        clock[0] += 1 / 30
+        runtime.process_frame(frame)
+    assert runtime.gate.idle, "gate did not go idle on the still frames"
+    runs = runtime.gate.detector_runs
+    for waited, frame in enumerate(motion):
+        clock[0] += 1 / 30
+        runtime.process_frame(frame)
+        if runtime.gate.detector_runs > runs:
+            return waited
+    return None
+
+
+def main():
+    parser = argparse.ArgumentParser(description="CPU saved by idling the hand detector on an empty scene")
+    parser.add_argument("--source", required=True, help="video or folder; its first frame is the empty scene")
+    parser.add_argument("--mode", choices=list(MODES), default="travel")
+    parser.add_argument("--fps", type=float, default=30.0)
+    parser.add_argument("--duration", type=float, default=5.0)
+    parser.add_argument("--idle-after", type=float, default=1.0)
+    parser.add_argument("--noise", type=float, default=3.0, help="sensor noise sigma in grey levels")
+    args = parser.parse_args()
+
+    source = open_source(args.source, realtime=False)
+    frames = [cv2.flip(f, 1) for f in source]
+    source.release()
+    if len(frames) < 2:
+        raise SystemExit(f"❌ Need at least two frames from {args.source}")
+    still = noisy_still(frames[0], 60, args.noise)
+
+    off, _ = empty_scene_cpu(args.mode, still, args.fps, args.duration, 0)
+    on, stats = empty_scene_cpu(args.mode, still, args.fps, args.duration, args.idle_after)
+    print(f"🔇 Empty scene at {args.fps:.0f} fps, {args.duration:.0f}s:")
+    print(f"  gate off  {off:6.1%} of a core")
+    print(f"  gate on   {on:6.1%} of a core  ({stats['skipped_share']:.0%} of frames skipped the detector)")
+    print(f"  saving    {1 - on / off if off else 0:6.0%}")
+
+    # Motion: the clip itself, shifted so consecutive frames always differ
+    motion = [np.roll(f, 8 * (i + 1), axis=1) for i, f in enumerate(frames[:10])]
+    waited = wake_up(args.mode, noisy_still(frames[0], int(30 * (args.idle_after + 1)), args.noise, seed=1),
+                     motion, args.idle_after)
+    print(f"⏰ Detector ran again {waited} frame(s) after motion started" if waited is not None else "⏰ Never woke up")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,121 @@
+# benchmarks/bench_governor.py
+#
+# What each rung of the adaptive quality ladder costs, and how --adaptive moves
+# along it when the machine gets busy.
+#
+#   ladder    every frame of the clip at each fixed level: detect and classify ms
+#             per frame, and the frame rate that allows
+#   adaptive  the clip replayed in real time through the live pipeline with the
+#             governor on; for the middle third, busy-loop processes steal the CPU
+#             (a slow laptop, or a video call starting). Prints the level and the
+#             inference fps every second: it should step down under load and back
+#             up once the load is gone
+#
+#   python benchmarks/bench_governor.py --source clip.avi
+#   python benchmarks/bench_governor.py --source clip.avi --target-fps 40 --hogs 2
+
+import argparse
+import multiprocessing
+import os
+import sys
+import time
+
+import cv2
+import numpy as np
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from sayable.governor import LADDER
+from sayable.modes import MODES
+from sayable.pipeline import RecognitionPipeline
+from sayable.runtime import SharedRuntime
+from sayable.sources import ArraySource, open_source
+from sayable.speech import SilentSpeaker
+
+
+def time_level(mode, frames, level):
+    runtime = SharedRuntime(mode, speaker=SilentSpeaker(), verbose=False, adaptive=True)
+    runtime.apply_quality(LADDER[level])
+    runtime.governor.level = level
+    detect, classify = [], []
+
+    def record(detect_ms, classify_ms):  # instead of letting the governor move
+        detect.append(detect_ms)
+        classify.append(classify_ms)
+
+    runtime.observe_quality = record
+    runtime.process_frame(frames[0])  # build the tracker outside the timings
+    detect.clear()
+    classify.clear()
+    for frame in frames:
+        runtime.process_frame(frame)
+    runtime.close()
+    return np.mean(detect), np.mean(classify)
+
+
+def hog():
+    while True:
+        pass
+
+
+def adaptive_run(mode, frames, fps, duration, target_fps, hogs):
+    source = ArraySource(frames, fps=fps, realtime=True, loop=True, name="clip")
+    runtime = SharedRuntime(mode, source=source, speaker=SilentSpeaker(), verbose=False,
+                            adaptive=True, target_fps=target_fps)
+    pipeline = RecognitionPipeline(runtime, runtime.open_source())
+    pipeline.start()
+    workers = []
+    start = time.perf_counter()
+    for second in range(int(duration)):
+        loaded = duration / 3 <= second < 2 * duration / 3
+        if loaded and not workers:
+            workers = [multiprocessing.Process(target=hog, daemon=True) for _ in range(hogs)]
+            for worker in workers:
+                worker.start()
+        elif not loaded and workers:
+            for worker in workers:
+                worker.terminate()
+            workers = []
+        time.sleep(max(0.0, start + second + 1 - time.perf_counter()))
+        print(f"  {second + 1:>4}s  {'busy' if loaded else '':<5}  level {runtime.governor.level} "
+              f"{runtime.governor.quality.name:<16} {pipeline.inference_fps.fps:5.1f} fps")
+    for worker in workers:
+        worker.terminate()
+    pipeline.stop()
+    return runtime.governor.stats()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Adaptive quality ladder costs and behaviour under load")
+    parser.add_argument("--source", required=True, help="video file or folder")
+    parser.add_argument("--mode", choices=list(MODES), default="travel")
+    parser.add_argument("--max-frames", type=int, default=150)
+    parser.add_argument("--fps", type=float, default=30.0, help="replay rate of the adaptive run")
+    parser.add_argument("--duration", type=float, default=30.0)
+    parser.add_argument("--target-fps", type=float, help="default: the mode's own")
+    parser.add_argument("--hogs", type=int, default=os.cpu_count() or 1, help="busy processes during the load")
+    args = parser.parse_args()
+
+    source = open_source(args.source, realtime=False)
+    frames = []
+    for frame in source:
+        frames.append(cv2.flip(frame, 1))
+        if len(frames) >= args.max_frames:
+            break
+    source.release()
+    if not frames:
+        raise SystemExit(f"❌ No frames in {args.source}")
+
+    target = args.target_fps or MODES[args.mode].target_fps
+    print(f"🪜 Ladder on {len(frames)} frames of {args.source} (budget {1000 / target:.0f} ms at {target:.0f} fps)")
+    print(f"  {'level':<22}{'detect ms':>10}{'classify ms':>13}{'max fps':>9}")
+    for level, quality in enumerate(LADDER):
+        detect, classify = time_level(args.mode, frames, level)
+        print(f"  {level} {quality.name:<20}{detect:>10.2f}{classify:>13.2f}{1000 / (detect + classify):>9.0f}")
+
+    print(f"\n⚙️ Adaptive, {args.fps:.0f} fps replay, {args.hogs} busy process(es) in the middle third:")
+    stats = adaptive_run(args.mode, frames, args.fps, args.duration, args.target_fps, args.hogs)
+    print(f"  {stats['changes']} level changes, ended on {stats['quality']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+# benchmarks/bench_multicam.py
+#
+# How recognition scales with the number of cameras. Each "camera" replays the
+# same clip in a loop, as fast as it decodes, through its own capture thread,
+# inference thread and Hands tracker, with one shared (batched) classifier — the
+# same setup `python -m sayable.app --source 0 --source 1` uses. Reports per-camera
+# inference fps and latency, and how close the total gets to linear scaling.
+#
+#   python benchmarks/bench_multicam.py --source clip.avi --cameras 1,2,4
+
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from sayable.modes import MODES
+from sayable.multicam import create_runtimes
+from sayable.pipeline import RecognitionPipeline
+from sayable.speech import SilentSpeaker
+
+
+def run(mode, source, cameras, duration, warmup):
+    runtimes = create_runtimes(mode, [source] * cameras, speaker=SilentSpeaker(), verbose=False,
+                               realtime=False, loop=True)
+    latencies = [[] for _ in runtimes]
+    counts = [0] * cameras
+    measuring = [False]
+
+    def recorder(i):
+        def on_result(prediction, timestamp, captured_at):
+            if measuring[0]:
+                counts[i] += 1
+                latencies[i].append(time.perf_counter() - captured_at)
+        return on_result
+
+    pipelines = [RecognitionPipeline(r, r.open_source(), on_result=recorder(i)) for i, r in enumerate(runtimes)]
+    for pipeline in pipelines:
+        pipeline.start()
+    time.sleep(warmup)
+    model = runtimes[0].model
+    batches_before, rows_before = model.batches, model.rows
+    measuring[0] = True
+    time.sleep(duration)
+    measuring[0] = False
+    batches, rows = model.batches - batches_before, model.rows - rows_before
+    for pipeline in pipelines:
+        pipeline.stop()
+    for runtime in runtimes:
+        runtime.release()
+
+    return {
+        "fps": [c / duration for c in counts],
+        "p50": [np.percentile(l, 50) * 1000 if l else 0.0 for l in latencies],
+        "p95": [np.percentile(l, 95) * 1000 if l else 0.0 for l in latencies],
+        "mean_batch": rows / batches if batches else 0.0,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Per-camera fps and latency with 1..N cameras")
+    parser.add_argument("--mode", choices=list(MODES), default="travel")
+    parser.add_argument("--source", required=True, help="video file or folder each camera replays")
+    parser.add_argument("--cameras", type=lambda s: [int(n) for n in s.split(",")], default=[1, 2, 4])
+    parser.add_argument("--duration", type=float, default=5.0)
+    parser.add_argument("--warmup", type=float, default=1.0)
+    args = parser.parse_args()
+
+    print(f"🖥️ {os.cpu_count()} CPU cores")
+    print(f"  {'cameras':>7}{'fps/camera':>12}{'total fps':>11}{'scaling':>9}{'p50 ms':>9}{'p95 ms':>9}{'batch':>7}")
+    single = None
+    for cameras in args.cameras:
+        r = run(args.mode, args.source, cameras, args.duration, args.warmup)
+        total = sum(r["fps"])
+        if single is None:
+            single = total / cameras
+        scaling = total / (single * cameras) if single else 0.0
+        print(f"  {cameras:>7}{np.mean(r['fps']):>12.1f}{total:>11.1f}{scaling:>8.0%} "
+              f"{np.mean(r['p50']):>8.1f}{np.mean(r['p95']):>9.1f}{r['mean_batch']:>7.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+# benchmarks/bench_pacing.py
+#
+# Render-loop wakeups and frame pacing: the old fixed 10 ms polling versus waking
+# up when the pipeline reports a new frame (what FrameWaker does in the GUI).
+# A stand-in render thread plays the Tk loop without a display: on each wakeup it
+# takes the newest result and preview frame and prepares it with PreviewRenderer.
+# The clip is replayed at its own fps like a camera. Reports wakeups per second,
+# the share that found nothing new, rendered fps, the spread (jitter) of the
+# intervals between rendered frames, and frames that were never shown.
+#
+#   python benchmarks/bench_pacing.py --source clip.avi --fps 30
+
+import argparse
+import os
+import sys
+import threading
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from sayable.modes import MODES
+from sayable.pipeline import JitterMeter, RecognitionPipeline
+from sayable.preview import PreviewRenderer
+from sayable.runtime import SharedRuntime
+from sayable.sources import ArraySource, open_source
+from sayable.speech import SilentSpeaker
+
+
+def run(mode, frames, fps, duration, event_driven):
+    source = ArraySource(frames, fps=fps, realtime=True, loop=True, name="clip")
+    runtime = SharedRuntime(mode, source=source, speaker=SilentSpeaker(), verbose=False)
+    pipeline = RecognitionPipeline(runtime, runtime.open_source())
+    renderer = PreviewRenderer(None, max_fps=0)
+    jitter = JitterMeter(size=100000)
+    wake = threading.Event()
+    if event_driven:
+        pipeline.on_update = wake.set
+
+    pipeline.start()
+    time.sleep(1.0)  # warm up the tracker
+    dropped = pipeline.dropped_previews
+    wakeups = empty = rendered = 0
+    end = time.perf_counter() + duration
+    while time.perf_counter() < end:
+        if event_driven:
+            if not wake.wait(0.5):
+                continue
+            wake.clear()
+        else:
+            time.sleep(0.01)
+        wakeups += 1
+        updated = pipeline.next_result() is not None
+        frame = pipeline.next_preview_frame()
+        if frame is not None:
+            renderer.prepare(frame)
+            jitter.tick()
+            rendered += 1
+            updated = True
+        empty += not updated
+    dropped = pipeline.dropped_previews - dropped
+    pipeline.stop()
+    return {
+        "wakeups": wakeups / duration,
+        "empty": empty / wakeups if wakeups else 0.0,
+        "fps": rendered / duration,
+        "interval": jitter.mean_ms,
+        "jitter": jitter.jitter_ms,
+        "dropped": dropped,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Polling vs event-driven render wakeups and pacing")
+    parser.add_argument("--source", required=True, help="video file or folder, replayed like a camera")
+    parser.add_argument("--mode", choices=list(MODES), default="travel")
+    parser.add_argument("--fps", type=float, default=30.0)
+    parser.add_argument("--duration", type=float, default=5.0)
+    args = parser.parse_args()
+
+    source = open_source(args.source, realtime=False)
+    frames = list(source)
+    source.release()
+    if not frames:
+        raise SystemExit(f"❌ No frames in {args.source}")
+
+    print(f"🎞️ {args.fps:.0f} fps source, {args.duration:.0f}s each")
+    print(f"  {'loop':<14}{'wakeups/s':>10}{'empty':>8}{'shown fps':>11}{'every ms':>10}{'jitter ms':>11}{'dropped':>9}")
+    for name, event_driven in (("poll 10 ms", False), ("frame events", True)):
+        r = run(args.mode, frames, args.fps, args.duration, event_driven)
+        print(f"  {name:<14}{r['wakeups']:>10.1f}{r['empty']:>8.0%}{r['fps']:>11.1f}"
+              f"{r['interval']:>10.1f}{r['jitter']:>11.2f}{r['dropped']:>9}")
+
+
+if __name__ == "__main__":
+    main()
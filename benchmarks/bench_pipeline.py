@@ -0,0 +1,234 @@
+# benchmarks/bench_pipeline.py
+#
+# Headless replay benchmark for the full recognition pipeline. Recorded clips (or
+# any video / image folder) are pushed through the same steps as a live frame:
+#
+#   flip -> cvtColor -> hands.process -> features -> classifier -> stability
+#
+# and every stage is timed. Per mode it reports p50/p95/p99 latency per stage,
+# end-to-end throughput and peak RSS, and can write JSON so two runs can be compared.
+#
+#   python benchmarks/bench_pipeline.py                           # every mode, its data_* folder
+#   python benchmarks/bench_pipeline.py --mode travel --source clip.avi --json after.json
+#   python benchmarks/bench_pipeline.py --mode travel --source clip.avi --baseline before.json
+#
+# With several modes each one runs in its own process so peak RSS is per mode.
+
+import argparse
+import itertools
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from sayable.frame import FramePool
+from sayable.modes import MODES, STATIC, get_mode
+from sayable.runtime import SharedRuntime
+from sayable.sources import FolderSource, open_source
+from sayable.speech import SilentSpeaker
+
+STAGES = ("flip", "cvtColor", "hands", "features", "classifier", "stability", "total")
+
+
+def peak_rss_mb():
+    try:
+        import resource
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # kilobytes on Linux, bytes on macOS
+        return peak / 1e6 if sys.platform == "darwin" else peak / 1024
+    except ImportError:
+        try:
+            import psutil
+            return psutil.Process().memory_info().peak_wset / 1e6
+        except (ImportError, AttributeError):
+            return None
+
+
+def replay(runtime, frames, warmup):
+    """Push frames through the pipeline stage by stage; returns per-stage timings in ms."""
+    timings = {stage: [] for stage in STAGES}
+    static = runtime.spec.kind == STATIC
+    confirmed = 0
+    hands_seen = 0
+    frames_done = 0
+    perf = time.perf_counter
+    pool = FramePool()
+
+    wall_start = None
+    for index, frame in enumerate(frames):
+        if index == warmup:
+            wall_start = perf()
+        keep = index >= warmup
+        ran_classifier = False
+
+        t0 = perf()
+        frame = pool.mirror(frame)
+        t1 = perf()
+        frame_rgb = frame.rgb
+        t2 = perf()
+        results = runtime.hands.process(frame_rgb)
+        t3 = perf()
+
+        runtime.landmark_queue.append(runtime.landmarks_from_results(results))
+        if static:
+            data_aux = runtime.features.single_hand(results)
+            t4 = perf()
+            if data_aux is None:
+                runtime.reset_stability()
+                prediction = None
+                t5 = t4
+            else:
+                label = runtime.classify_static(data_aux)
+                t5 = perf()
+                ran_classifier = True
+                prediction = runtime.confirm_static(label)
+        else:
+            t4 = perf()
+            prediction = None
+            t5 = t4
+            if len(runtime.landmark_queue) >= runtime.spec.sequence_length:
+                label, confidence = runtime.classify_sequence(runtime.landmark_queue.mean())
+                t5 = perf()
+                ran_classifier = True
+                prediction = runtime.confirm_sequence(label, confidence)
+        t6 = perf()
+
+        if not keep:
+            continue
+        frames_done += 1
+        hands_seen += bool(results.multi_hand_landmarks)
+        confirmed += prediction is not None
+        timings["flip"].append(t1 - t0)
+        timings["cvtColor"].append(t2 - t1)
+        timings["hands"].append(t3 - t2)
+        timings["features"].append(t4 - t3)
+        if ran_classifier:
+            timings["classifier"].append(t5 - t4)
+            timings["stability"].append(t6 - t5)
+        timings["total"].append(t6 - t0)
+
+    wall = perf() - wall_start if wall_start is not None else 0.0
+    return timings, frames_done, wall, hands_seen, confirmed
+
+
+def summarize(values):
+    if not values:
+        return None
+    ms = np.asarray(values) * 1000
+    p50, p95, p99 = np.percentile(ms, [50, 95, 99])
+    return {"p50": p50, "p95": p95, "p99": p99, "mean": float(ms.mean()), "count": len(ms)}
+
+
+def run_mode(mode, source, max_frames, warmup):
+    spec = get_mode(mode)
+    source = source or spec.data_path
+    if not os.path.exists(source):
+        raise SystemExit(f"❌ No replay source for '{mode}': {source} does not exist (use --source)")
+    # Decode as fast as possible: the benchmark measures the pipeline, not the clip's fps
+    frames_in = open_source(source, realtime=False)
+    if not frames_in.isOpened():
+        raise SystemExit(f"❌ No videos or images found under {source}")
+    files = len(frames_in.files) if isinstance(frames_in, FolderSource) else 1
+
+    runtime = SharedRuntime(mode, speaker=SilentSpeaker(), verbose=False)
+    frames_iter = itertools.islice(frames_in, max_frames or None)
+    timings, frames, wall, hands_seen, confirmed = replay(runtime, frames_iter, warmup)
+    frames_in.release()
+
+    return {
+        "mode": mode,
+        "source": os.path.abspath(source),
+        "files": files,
+        "frames": frames,
+        "throughput_fps": frames / wall if wall > 0 else 0.0,
+        "hand_frames": hands_seen,
+        "confirmed_frames": confirmed,
+        "peak_rss_mb": peak_rss_mb(),
+        "stages_ms": {stage: summarize(values) for stage, values in timings.items()},
+    }
+
+
+def run_in_subprocess(mode, args):
+    with tempfile.TemporaryDirectory() as tmp:
+        out = os.path.join(tmp, f"{mode}.json")
+        cmd = [sys.executable, os.path.abspath(__file__), "--mode", mode, "--json", out,
+               "--max-frames", str(args.max_frames), "--warmup", str(args.warmup), "--quiet"]
+        if args.source:
+            cmd += ["--source", args.source]
+        subprocess.run(cmd, check=True)
+        with open(out) as f:
+            return json.load(f)["results"][0]
+
+
+def print_report(result, baseline=None):
+    print(f"\n📊 {result['mode']}: {result['frames']} frames from {result['files']} file(s), "
+          f"{result['throughput_fps']:.1f} fps, peak RSS "
+          + (f"{result['peak_rss_mb']:.0f} MB" if result['peak_rss_mb'] is not None else "n/a"))
+    header = f"  {'stage':<11}{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}"
+    if baseline:
+        header += f"{'Δp50':>9}{'Δp95':>9}"
+    print(header)
+    for stage in STAGES:
+        stats = result["stages_ms"].get(stage)
+        if not stats:
+            continue
+        line = f"  {stage:<11}{stats['p50']:>9.2f}{stats['p95']:>9.2f}{stats['p99']:>9.2f}"
+        before = (baseline or {}).get("stages_ms", {}).get(stage)
+        if before:
+            line += f"{_change(before['p50'], stats['p50']):>9}{_change(before['p95'], stats['p95']):>9}"
+        print(line)
+    if baseline:
+        print(f"  throughput {_change(baseline['throughput_fps'], result['throughput_fps'])}")
+
+
+def _change(before, after):
+    if not before:
+        return "n/a"
+    return f"{(after - before) / before * 100:+.0f}%"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Replay recorded frames through the recognition pipeline")
+    parser.add_argument("--mode", choices=list(MODES), action="append",
+                        help="mode to benchmark (repeatable, default: all)")
+    parser.add_argument("--source", help="video file, image or folder to replay (default: the mode's data folder)")
+    parser.add_argument("--max-frames", type=int, default=0, help="stop after this many frames (0 = all)")
+    parser.add_argument("--warmup", type=int, default=10, help="frames excluded from the statistics")
+    parser.add_argument("--json", help="write results to this JSON file")
+    parser.add_argument("--baseline", help="JSON from an earlier run to compare against")
+    parser.add_argument("--quiet", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    modes = args.mode or list(MODES)
+    if len(modes) == 1:
+        results = [run_mode(modes[0], args.source, args.max_frames, args.warmup)]
+    else:
+        results = [run_in_subprocess(mode, args) for mode in modes]
+
+    baseline = {}
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = {r["mode"]: r for r in json.load(f)["results"]}
+
+    if not args.quiet:
+        for result in results:
+            print_report(result, baseline.get(result["mode"]))
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump({
+                "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+                "python": platform.python_version(),
+                "platform": platform.platform(),
+                "results": results,
+            }, f, indent=2, default=float)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+# benchmarks/bench_preview.py
+#
+# Time and memory churn per rendered preview frame, the old way versus
+# PreviewRenderer:
+#
+#   before  cvtColor -> Image.fromarray -> new ImageTk.PhotoImage (+ a resize for
+#           multi-camera tiles), which is what update_video used to do
+#   after   PreviewRenderer: resize/convert into preallocated buffers and paste into
+#           one PhotoImage
+#
+# Allocations are the bytes Python-side allocations peak above the steady state
+# while one frame is rendered (tracemalloc; numpy buffers included, PIL and Tk
+# internals not), plus the number of Tk images alive at the end. Without a
+# display only the buffer stage (everything up to the PIL image) can be timed.
+#
+#   python benchmarks/bench_preview.py --source clip.avi
+#   python benchmarks/bench_preview.py --source clip.avi --width 440   # a multi-camera tile
+
+import argparse
+import os
+import sys
+import time
+import tkinter as tk
+import tracemalloc
+
+import cv2
+import numpy as np
+from PIL import Image, ImageTk
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from sayable.preview import PreviewRenderer
+from sayable.sources import open_source
+
+
+def old_prepare(frame, width):
+    if width:
+        height = frame.shape[0] * width // frame.shape[1]
+        frame = cv2.resize(frame, (width, height), interpolation=cv2.INTER_AREA)
+    return Image.fromarray(cv2.cvtColor(frame, cv2.COLOR_BGR2RGB))
+
+
+def old_render(frame, width, label):
+    imgtk = ImageTk.PhotoImage(image=old_prepare(frame, width))
+    label.imgtk = imgtk
+    label.configure(image=imgtk)
+
+
+def measure(render, frames, root):
+    for frame in frames[:5]:  # warm up: first-frame allocations are not churn
+        render(frame)
+    timings, churn = [], []
+    tracemalloc.start()
+    for frame in frames:
+        base = tracemalloc.get_traced_memory()[0]
+        tracemalloc.reset_peak()
+        start = time.perf_counter()
+        render(frame)
+        if root is not None:
+            root.update_idletasks()
+        timings.append(time.perf_counter() - start)
+        churn.append(tracemalloc.get_traced_memory()[1] - base)
+    tracemalloc.stop()
+    return np.median(timings) * 1000, np.median(churn) / 1024
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Preview render cost before/after buffer reuse")
+    parser.add_argument("--source", required=True, help="video file, image or folder")
+    parser.add_argument("--max-frames", type=int, default=200)
+    parser.add_argument("--width", type=int, default=0, help="display width (0 = frame size)")
+    args = parser.parse_args()
+
+    source = open_source(args.source, realtime=False)
+    frames = []
+    for frame in source:
+        frames.append(cv2.flip(frame, 1))
+        if len(frames) >= args.max_frames:
+            break
+    source.release()
+    if not frames:
+        raise SystemExit(f"❌ No frames in {args.source}")
+
+    try:
+        root = tk.Tk()
+    except tk.TclError:
+        root = None
+        print("⚠️ No display: timing the buffer stage only (no PhotoImage)")
+
+    if root is not None:
+        old_label, new_label = tk.Label(root), tk.Label(root)
+        old_label.pack()
+        new_label.pack()
+        renderer = PreviewRenderer(new_label, width=args.width or None, max_fps=0)
+        before = measure(lambda f: old_render(f, args.width, old_label), frames, root)
+        after = measure(renderer.render, frames, root)
+    else:
+        renderer = PreviewRenderer(None, width=args.width or None, max_fps=0)
+        before = measure(lambda f: old_prepare(f, args.width), frames, None)
+        after = measure(renderer.prepare, frames, None)
+
+    height, width = frames[0].shape[:2]
+    print(f"🖼️ {len(frames)} frames, {width}x{height} -> {'x'.join(map(str, renderer.size))}")
+    print(f"  {'':<8}{'ms/frame':>10}{'KiB churn/frame':>18}")
+    print(f"  {'before':<8}{before[0]:>10.2f}{before[1]:>18.1f}")
+    print(f"  {'after':<8}{after[0]:>10.2f}{after[1]:>18.1f}")
+    if root is not None:
+        print(f"  Tk images alive: {len(root.image_names())}")
+        root.destroy()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,126 @@
+# benchmarks/bench_roi.py
+#
+# Per-frame cost of hand tracking on the full frame versus a hand ROI, at 720p and
+# 1080p (the source frames are resized to each resolution). Three variants:
+#
+#   full       cvtColor + hands.process on the whole frame (what --roi turns off)
+#   fixed ROI  the same on a centred crop the size of a hand plus margin, downsized
+#              like HandRoi does: the saving the ROI buys whenever it is in use,
+#              measurable on any footage
+#   tracking   HandRoi itself, including its fallbacks; needs footage with hands to
+#              engage, and then also reports how far its landmarks are from the
+#              full-frame ones (in the 84 features, full-frame normalized units)
+#
+#   python benchmarks/bench_roi.py --source clip.avi
+
+import argparse
+import os
+import sys
+import time
+
+import cv2
+import mediapipe as mp
+import numpy as np
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from sayable.features import FeatureExtractor
+from sayable.recognizer import TRACKER_SETTINGS
+from sayable.roi import HandRoi
+from sayable.sources import open_source
+
+RESOLUTIONS = {"720p": (1280, 720), "1080p": (1920, 1080)}
+
+
+def time_full(frames):
+    hands = mp.solutions.hands.Hands(**TRACKER_SETTINGS)
+    features = FeatureExtractor()
+    timings, vectors = [], []
+    for frame in frames:
+        start = time.perf_counter()
+        results = hands.process(cv2.cvtColor(frame, cv2.COLOR_BGR2RGB))
+        timings.append(time.perf_counter() - start)
+        vectors.append(features.two_hands(results).copy())
+    hands.close()
+    return timings, vectors
+
+
+def time_fixed_roi(frames, box_fraction, max_side):
+    hands = mp.solutions.hands.Hands(**TRACKER_SETTINGS)
+    height, width = frames[0].shape[:2]
+    side = int(height * box_fraction)
+    x0, y0 = (width - side) // 2, (height - side) // 2
+    scale = min(1.0, max_side / side)
+    timings = []
+    for frame in frames:
+        start = time.perf_counter()
+        crop = frame[y0:y0 + side, x0:x0 + side]
+        if scale < 1.0:
+            crop = cv2.resize(crop, None, fx=scale, fy=scale, interpolation=cv2.INTER_AREA)
+        hands.process(cv2.cvtColor(crop, cv2.COLOR_BGR2RGB))
+        timings.append(time.perf_counter() - start)
+    hands.close()
+    return timings
+
+
+def time_tracking(frames, max_side):
+    hands = mp.solutions.hands.Hands(**TRACKER_SETTINGS)
+    features = FeatureExtractor()
+    roi = HandRoi(max_side=max_side)
+    timings, vectors = [], []
+    for frame in frames:
+        start = time.perf_counter()
+        results = roi.process(hands, cv2.cvtColor(frame, cv2.COLOR_BGR2RGB))
+        timings.append(time.perf_counter() - start)
+        vectors.append(features.two_hands(results).copy())
+    hands.close()
+    return timings, vectors, roi.stats()
+
+
+def ms(timings, q):
+    return np.percentile(np.asarray(timings) * 1000, q)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Full-frame vs hand-ROI tracking cost at 720p and 1080p")
+    parser.add_argument("--source", required=True, help="video file, image or folder (footage with hands is best)")
+    parser.add_argument("--max-frames", type=int, default=150)
+    parser.add_argument("--box", type=float, default=0.4, help="fixed ROI side as a fraction of frame height")
+    parser.add_argument("--max-side", type=int, default=320, help="ROI crops are downsized to this many pixels")
+    args = parser.parse_args()
+
+    source = open_source(args.source, realtime=False)
+    base = []
+    for frame in source:
+        base.append(cv2.flip(frame, 1))
+        if len(base) >= args.max_frames:
+            break
+    source.release()
+    if not base:
+        raise SystemExit(f"❌ No frames in {args.source}")
+
+    print(f"🎞️ {len(base)} frames from {args.source}")
+    print(f"  {'':<7}{'variant':<11}{'p50 ms':>9}{'p95 ms':>9}{'saving':>9}   notes")
+    for name, size in RESOLUTIONS.items():
+        frames = [cv2.resize(f, size, interpolation=cv2.INTER_LINEAR) for f in base]
+        full, full_vectors = time_full(frames)
+        fixed = time_fixed_roi(frames, args.box, args.max_side)
+        tracking, roi_vectors, stats = time_tracking(frames, args.max_side)
+
+        base_p50 = ms(full, 50)
+        print(f"  {name:<7}{'full':<11}{base_p50:>9.2f}{ms(full, 95):>9.2f}")
+        print(f"  {'':<7}{'fixed ROI':<11}{ms(fixed, 50):>9.2f}{ms(fixed, 95):>9.2f}"
+              f"{1 - ms(fixed, 50) / base_p50:>9.0%}")
+
+        hand_frames = [i for i, v in enumerate(full_vectors) if v.any()]
+        if hand_frames and stats["roi_frames"]:
+            diff = np.mean([np.abs(full_vectors[i] - roi_vectors[i]).max() for i in hand_frames])
+            note = (f"ROI on {stats['roi_share']:.0%} of frames, {stats['fallbacks']} fallbacks, "
+                    f"{stats['resets']} tracker resets, feature Δ {diff:.4f}")
+        else:
+            note = "no hands found: ROI never engaged"
+        print(f"  {'':<7}{'tracking':<11}{ms(tracking, 50):>9.2f}{ms(tracking, 95):>9.2f}"
+              f"{1 - ms(tracking, 50) / base_p50:>9.0%}   {note}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,139 @@
+# benchmarks/bench_server.py
+#
+# Load generator for sayable.server. Starts the server in its own process (or uses
+# one already running with --port), then opens 1, 10 and 100 concurrent WebSocket
+# streams that each send landmark vectors as fast as replies come back, and reports
+# aggregate throughput, per-message latency and the server's mean batch size.
+#
+#   python benchmarks/bench_server.py
+#   python benchmarks/bench_server.py --streams 1,10,100 --duration 5 --compare-unbatched
+
+import argparse
+import asyncio
+import json
+import os
+import subprocess
+import sys
+import time
+
+import numpy as np
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from sayable.features import HAND_SIZE, TWO_HAND_SIZE
+from sayable.modes import MODES, STATIC, get_mode
+from sayable.websocket import connect, read_http_head
+
+HOST = "127.0.0.1"
+
+
+async def fetch_stats(port):
+    reader, writer = await asyncio.open_connection(HOST, port)
+    writer.write(f"GET /stats HTTP/1.1\r\nHost: {HOST}\r\n\r\n".encode())
+    await writer.drain()
+    _, headers = await read_http_head(reader)
+    body = await reader.readexactly(int(headers["content-length"]))
+    writer.close()
+    return json.loads(body)
+
+
+async def wait_for_server(port, timeout=60.0):
+    deadline = time.perf_counter() + timeout
+    while True:
+        try:
+            return await fetch_stats(port)
+        except (OSError, asyncio.IncompleteReadError):
+            if time.perf_counter() > deadline:
+                raise SystemExit(f"❌ Server on port {port} did not come up")
+            await asyncio.sleep(0.2)
+
+
+async def stream(port, mode, payloads, stop_at, warmup_until, latencies):
+    ws = await connect(HOST, port, f"/{mode}")
+    sent = 0
+    perf = time.perf_counter
+    try:
+        while perf() < stop_at:
+            start = perf()
+            await ws.send(payloads[sent % len(payloads)])
+            reply = await ws.recv()
+            if reply is None:
+                break
+            if start >= warmup_until:
+                latencies.append(perf() - start)
+            sent += 1
+    finally:
+        await ws.close()
+
+
+async def run_level(port, mode, streams, duration, warmup, seed):
+    spec = get_mode(mode)
+    n_features = HAND_SIZE if spec.kind == STATIC else TWO_HAND_SIZE
+    rng = np.random.default_rng(seed)
+    # A few hundred distinct vectors per stream so the forest does not see one input only
+    payloads = [rng.random(n_features, dtype=np.float32).tobytes() for _ in range(256)]
+
+    before = await fetch_stats(port)
+    now = time.perf_counter()
+    warmup_until = now + warmup
+    stop_at = warmup_until + duration
+    latencies = []
+    await asyncio.gather(*(stream(port, mode, payloads, stop_at, warmup_until, latencies) for _ in range(streams)))
+    after = await fetch_stats(port)
+
+    batches = after["batches"] - before["batches"]
+    rows = after["rows"] - before["rows"]
+    ms = np.asarray(latencies) * 1000 if latencies else np.zeros(1)
+    p50, p95, p99 = np.percentile(ms, [50, 95, 99])
+    return {
+        "streams": streams,
+        "throughput": len(latencies) / duration,
+        "per_stream": len(latencies) / duration / streams,
+        "p50": p50, "p95": p95, "p99": p99,
+        "mean_batch": rows / batches if batches else 0.0,
+    }
+
+
+def start_server(port, max_batch):
+    cmd = [sys.executable, "-m", "sayable.server", "--port", str(port), "--max-batch", str(max_batch)]
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    return subprocess.Popen(cmd, cwd=root, stdout=subprocess.DEVNULL)
+
+
+async def bench(args, max_batch, label):
+    server = None
+    if not args.external:
+        server = start_server(args.port, max_batch)
+    try:
+        await wait_for_server(args.port)
+        print(f"\n📡 {args.mode}, {label}")
+        print(f"  {'streams':>7}{'msg/s':>10}{'per stream':>12}{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}{'batch':>8}")
+        for streams in args.streams:
+            r = await run_level(args.port, args.mode, streams, args.duration, args.warmup, args.seed)
+            print(f"  {r['streams']:>7}{r['throughput']:>10.0f}{r['per_stream']:>12.1f}"
+                  f"{r['p50']:>9.2f}{r['p95']:>9.2f}{r['p99']:>9.2f}{r['mean_batch']:>8.1f}")
+    finally:
+        if server is not None:
+            server.terminate()
+            server.wait()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Throughput of the recognition server under concurrent streams")
+    parser.add_argument("--mode", choices=list(MODES), default="travel")
+    parser.add_argument("--streams", type=lambda s: [int(n) for n in s.split(",")], default=[1, 10, 100],
+                        help="comma-separated concurrency levels (default: 1,10,100)")
+    parser.add_argument("--duration", type=float, default=5.0, help="measured seconds per level")
+    parser.add_argument("--warmup", type=float, default=1.0, help="seconds per level before measuring")
+    parser.add_argument("--port", type=int, default=8799)
+    parser.add_argument("--external", action="store_true", help="use a server already running on --port")
+    parser.add_argument("--compare-unbatched", action="store_true", help="also run with --max-batch 1")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    asyncio.run(bench(args, 64, "micro-batched (max 64)"))
+    if args.compare_unbatched and not args.external:
+        asyncio.run(bench(args, 1, "unbatched"))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,200 @@
+# benchmarks/bench_speech.py
+#
+# How speech keeps up with a fast signer: the old thread-per-utterance Speaker
+# (every speak() starts a thread that waits its turn for runAndWait) versus the
+# single TTS worker. A burst of confirmed signs arrives every --interval seconds,
+# some confirmed twice by a second camera right after; each utterance takes about
+# as long as real pyttsx3 speech would at the current rate.
+#
+# Runs against a simulated engine by default, so it works without speakers or
+# pyttsx3 and is repeatable; --real uses pyttsx3. Reports how many utterances
+# were spoken, the delay from confirmation to audio start (p50/p95), the deepest
+# backlog and how long speech ran on after the last sign.
+#
+#   python benchmarks/bench_speech.py --signs 20 --interval 0.4
+
+import argparse
+import os
+import random
+import statistics
+import sys
+import threading
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from sayable.modes import TRAVEL_EMERGENCY_WORDS
+from sayable.speech import Speaker
+
+
+class SimulatedVoice:
+    def __init__(self, id):
+        self.id = id
+
+
+class SimulatedEngine:
+    """pyttsx3's Engine interface, speaking in silence for as long as the words would take.
+
+    latency is how long synthesis takes before the first sound of an utterance;
+    with busy it is spent computing in Python, the way in-process synthesis
+    competes with everything else in the interpreter.
+    """
+
+    def __init__(self, seconds_per_char=0.06, overhead=0.15, latency=0.0, busy=False):
+        self.seconds_per_char = seconds_per_char
+        self.overhead = overhead
+        self.latency = latency
+        self.busy = busy
+        self.properties = {"rate": 150, "volume": 1.0, "voices": [SimulatedVoice("male"), SimulatedVoice("female")]}
+        self.callbacks = {}
+        self.queue = []
+        self.speaking = None    # [name, starts_at, ends_at, started]
+
+    def setProperty(self, name, value):
+        self.properties[name] = value
+
+    def getProperty(self, name):
+        return self.properties[name]
+
+    def connect(self, topic, callback):
+        self.callbacks[topic] = callback
+
+    def duration(self, text):
+        return self.overhead + len(text) * self.seconds_per_char * 150 / self.properties["rate"]
+
+    def say(self, text, name=None):
+        self.queue.append((name, self.duration(text)))
+
+    def startLoop(self, use_driver_loop=True):
+        pass
+
+    def endLoop(self):
+        pass
+
+    def iterate(self):
+        now = time.perf_counter()
+        if self.speaking is not None and now >= self.speaking[2]:
+            name, self.speaking = self.speaking[0], None
+            self.callbacks["finished-utterance"](name, True)
+        if self.speaking is None and self.queue:
+            name, duration = self.queue.pop(0)
+            self.speaking = [name, now + self.latency, now + self.latency + duration, False]
+            while self.busy and time.perf_counter() < self.speaking[1]:
+                pass
+            now = time.perf_counter()
+        if self.speaking is not None and not self.speaking[3] and now >= self.speaking[1]:
+            self.speaking[3] = True
+            self.callbacks["started-utterance"](self.speaking[0])
+
+    def stop(self):
+        self.queue.clear()
+        if self.speaking is not None:
+            name, self.speaking = self.speaking[0], None
+            self.callbacks["finished-utterance"](name, False)
+
+    def runAndWait(self):
+        while self.queue or self.speaking is not None:
+            self.iterate()
+            time.sleep(0.005)
+
+
+class ThreadPerUtterance:
+    """The previous Speaker: a thread per speak(), taking turns on runAndWait."""
+
+    def __init__(self, engine):
+        self.engine = engine
+        self._lock = threading.Lock()
+        self._queued = {}
+        self.delays = []
+        self.spoken = 0
+        self.waiting = 0
+        self.max_depth = 0
+        engine.connect("started-utterance", self._on_started)
+        engine.connect("finished-utterance", lambda name, completed: None)
+
+    def speak(self, text):
+        name = f"{text}@{time.perf_counter()}"
+        self._queued[name] = time.perf_counter()
+        threading.Thread(target=self._speak_thread, args=(str(text), name), daemon=True).start()
+
+    def _speak_thread(self, text, name):
+        self.waiting += 1
+        self.max_depth = max(self.max_depth, self.waiting)
+        with self._lock:
+            self.waiting -= 1
+            self.engine.say(text, name=name)
+            self.engine.runAndWait()
+
+    def _on_started(self, name):
+        self.delays.append(time.perf_counter() - self._queued[name])
+        self.spoken += 1
+
+    def idle(self):
+        return self.waiting == 0 and not self._lock.locked()
+
+
+def script(signs, interval, duplicates, seed):
+    """(delay before, word) pairs: a sign every interval, some confirmed twice 50 ms apart."""
+    rng = random.Random(seed)
+    words = [w for w in TRAVEL_EMERGENCY_WORDS if w != "No Gesture Detected"]
+    events = []
+    for _ in range(signs):
+        word = rng.choice(words)
+        events.append((interval, word))
+        if rng.random() < duplicates:
+            events.append((0.05, word))
+    return events
+
+
+def play(speaker, events):
+    for delay, word in events:
+        time.sleep(delay)
+        speaker.speak(word)
+    return time.perf_counter()
+
+
+def percentile(values, q):
+    values = sorted(values)
+    return values[int(q * (len(values) - 1))] * 1000 if values else 0.0
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Old vs single-worker TTS under a burst of signs")
+    parser.add_argument("--signs", type=int, default=20)
+    parser.add_argument("--interval", type=float, default=0.4, help="seconds between confirmed signs")
+    parser.add_argument("--duplicates", type=float, default=0.3, help="share of signs confirmed twice")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--real", action="store_true", help="speak through pyttsx3 instead of simulating")
+    args = parser.parse_args()
+
+    events = script(args.signs, args.interval, args.duplicates, args.seed)
+    if args.real:
+        import pyttsx3
+        make_engine = pyttsx3.init
+    else:
+        make_engine = SimulatedEngine
+    print(f"🗣️ {len(events)} confirmations ({args.signs} signs every {args.interval}s, "
+          f"{len(events) - args.signs} repeated by a second camera)")
+    print(f"  {'speaker':<20}{'spoken':>7}{'p50 ms':>9}{'p95 ms':>9}{'backlog':>9}{'tail s':>8}   notes")
+
+    old = ThreadPerUtterance(make_engine())
+    last = play(old, events)
+    while not old.idle():
+        time.sleep(0.01)
+    tail = time.perf_counter() - last
+    print(f"  {'thread per speak()':<20}{old.spoken:>7}{statistics.median(old.delays) * 1000:>9.0f}"
+          f"{percentile(old.delays, 0.95):>9.0f}{old.max_depth:>9}{tail:>8.1f}")
+
+    new = Speaker(engine_factory=make_engine)
+    last = play(new, events)
+    while new.depth or new._current is not None:
+        time.sleep(0.01)
+    tail = time.perf_counter() - last
+    stats = new.stats()
+    new.close()
+    print(f"  {'single worker':<20}{stats['spoken']:>7}{stats['delay_p50_ms']:>9.0f}{stats['delay_p95_ms']:>9.0f}"
+          f"{stats['max_depth']:>9}{tail:>8.1f}   {stats['coalesced']} coalesced, "
+          f"{stats['interrupted']} interrupted, {stats['dropped']} dropped")
+
+
+if __name__ == "__main__":
+    main()
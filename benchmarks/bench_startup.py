@@ -0,0 +1,104 @@
+# benchmarks/bench_startup.py
+#
+# Start-up time: the old one-step-after-another start (import everything, start
+# TTS, load the model, open the source, build the tracker on the first frame)
+# versus sayable/startup.py, which runs those phases side by side and warms up the
+# tracker and classifier before the first frame. Each variant runs in a fresh
+# interpreter, so imports are paid every time. Reports when a window could first
+# be drawn, when everything was ready, and how long the first real frame took;
+# the concurrent runs also print their startup timeline.
+#
+# TTS start-up is simulated (an engine that takes --tts-init-ms to initialize) so
+# it runs without pyttsx3; --real uses pyttsx3. Use --source 0 to include a webcam.
+#
+#   python benchmarks/bench_startup.py --source clip.avi --mode travel
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import time
+
+START = time.perf_counter()
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def make_speaker(args):
+    from sayable.speech import Speaker
+    if args.real:
+        return Speaker()
+    from bench_speech import SimulatedEngine
+
+    def slow_engine():
+        time.sleep(args.tts_init_ms / 1000)  # what pyttsx3.init() costs, roughly
+        return SimulatedEngine()
+    return Speaker(engine_factory=slow_engine)
+
+
+def first_frame_ms(runtime):
+    from sayable.frame import FramePool
+    ret, frame = runtime.open_source().read()
+    start = time.perf_counter()
+    runtime.process_frame(FramePool().mirror(frame))
+    return (time.perf_counter() - start) * 1000
+
+
+def run_variant(args):
+    """In a child interpreter: start up one way and print the timings as JSON."""
+    report = ""
+    if args.variant == "sequential":
+        from sayable.multicam import create_runtimes
+        speaker = make_speaker(args)
+        runtimes = create_runtimes(args.mode, [args.source], speaker=speaker, verbose=False, realtime=False)
+        ready = time.perf_counter() - START
+        window = ready  # the old window only drew once mainloop ran, after all of this
+    else:
+        from sayable.startup import Startup, StartupTimeline
+        timeline = StartupTimeline()
+        timeline.started_at = START
+        startup = Startup(args.mode, [args.source], make_speaker=lambda: make_speaker(args), realtime=False,
+                          warm_up=args.variant == "concurrent", timeline=timeline, verbose=False)
+        window = time.perf_counter() - START
+        timeline.mark("window")
+        runtimes = startup.runtimes()
+        ready = time.perf_counter() - START
+    first = first_frame_ms(runtimes[0])
+    if args.variant != "sequential":
+        timeline.mark("first frame")
+        report = timeline.report()
+    runtimes[0].speaker.close()
+    print(json.dumps({"window": window * 1000, "ready": ready * 1000, "first_frame": first, "report": report}))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Sequential vs concurrent startup")
+    parser.add_argument("--source", required=True, help="video file, folder or camera index")
+    parser.add_argument("--mode", default="travel")
+    parser.add_argument("--tts-init-ms", type=float, default=300.0, help="simulated TTS engine start-up")
+    parser.add_argument("--real", action="store_true", help="start pyttsx3 instead of simulating")
+    parser.add_argument("--variant", choices=("sequential", "concurrent", "no-warm-up"), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.variant:
+        run_variant(args)
+        return
+
+    print(f"🚀 {args.mode} mode from {args.source}, each start in a fresh interpreter")
+    print(f"  {'start':<22}{'window ms':>10}{'ready ms':>10}{'1st frame ms':>14}")
+    reports = []
+    for variant, label in (("sequential", "one after another"), ("no-warm-up", "concurrent, no warm-up"),
+                           ("concurrent", "concurrent + warm-up")):
+        command = [sys.executable, os.path.abspath(__file__), "--variant", variant] + sys.argv[1:]
+        output = subprocess.run(command, capture_output=True, text=True, check=True).stdout
+        result = json.loads(output.strip().splitlines()[-1])
+        print(f"  {label:<22}{result['window']:>10.0f}{result['ready']:>10.0f}{result['first_frame']:>14.1f}")
+        if variant == "concurrent":
+            reports.append(result["report"])
+    for report in reports:
+        print(report)
+
+
+if __name__ == "__main__":
+    main()
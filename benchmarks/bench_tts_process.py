@@ -0,0 +1,105 @@
+# benchmarks/bench_tts_process.py
+#
+# Frame times while speech is active: TTS on a thread in the recognition process
+# (Speaker) versus in its own process (ProcessSpeaker, --tts-process). A clip is
+# run through the recognizer frame by frame while another thread confirms a sign
+# every --interval seconds; every frame's process_frame() time is recorded and
+# p50/p95/p99/max are reported, with a run without speech as the baseline.
+#
+# The engine is simulated by default: each utterance spends --synth-ms computing
+# in Python before it "sounds", which is how in-process synthesis competes with
+# MediaPipe for the interpreter. --real speaks through pyttsx3 instead.
+#
+#   python benchmarks/bench_tts_process.py --source clip.avi --duration 10
+
+import argparse
+import functools
+import os
+import random
+import statistics
+import sys
+import threading
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from bench_speech import SimulatedEngine, percentile
+from sayable.frame import FramePool
+from sayable.modes import MODES
+from sayable.recognizer import Recognizer
+from sayable.sources import open_source
+from sayable.speech import SilentSpeaker, Speaker
+from sayable.speech_process import ProcessSpeaker
+
+
+def confirm_signs(speaker, words, interval, stop):
+    rng = random.Random(0)
+    while not stop.wait(interval):
+        speaker.speak(rng.choice(words))
+
+
+def run(mode, frames, speaker, duration, interval):
+    recognizer = Recognizer(mode, speaker=speaker, verbose=False)
+    pool = FramePool()
+    for frame in frames[:10]:
+        recognizer.process_frame(pool.mirror(frame))  # warm up the tracker
+
+    words = [w for w in MODES[mode].vocabulary if w != "No Gesture Detected"]
+    stop = threading.Event()
+    talker = threading.Thread(target=confirm_signs, args=(speaker, words, interval, stop), daemon=True)
+    talker.start()
+    times = []
+    end = time.perf_counter() + duration
+    i = 0
+    while time.perf_counter() < end:
+        frame = pool.mirror(frames[i % len(frames)])
+        start = time.perf_counter()
+        recognizer.process_frame(frame)
+        times.append(time.perf_counter() - start)
+        i += 1
+    stop.set()
+    talker.join()
+    recognizer.close()
+    return sorted(times)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Frame times with in-process vs out-of-process speech")
+    parser.add_argument("--source", required=True, help="video file or folder to run through the recognizer")
+    parser.add_argument("--mode", choices=list(MODES), default="travel")
+    parser.add_argument("--duration", type=float, default=10.0)
+    parser.add_argument("--interval", type=float, default=0.7, help="seconds between confirmed signs")
+    parser.add_argument("--synth-ms", type=float, default=150.0, help="simulated synthesis work per utterance")
+    parser.add_argument("--real", action="store_true", help="speak through pyttsx3 instead of simulating")
+    args = parser.parse_args()
+
+    source = open_source(args.source, realtime=False)
+    frames = list(source)
+    source.release()
+    if not frames:
+        raise SystemExit(f"❌ No frames in {args.source}")
+
+    if args.real:
+        import pyttsx3
+        make_engine = pyttsx3.init
+    else:
+        # A partial (not a lambda) so it can be pickled into the TTS process
+        make_engine = functools.partial(SimulatedEngine, latency=args.synth_ms / 1000, busy=True)
+
+    print(f"🎞️ {len(frames)} frames, {args.duration:.0f}s per run, a sign every {args.interval}s")
+    print(f"  {'speech':<14}{'frames':>7}{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}{'max ms':>9}{'spoken':>8}")
+    for name in ("none", "in-process", "tts process"):
+        if name == "none":
+            speaker = SilentSpeaker()
+        elif name == "in-process":
+            speaker = Speaker(engine_factory=make_engine)
+        else:
+            speaker = ProcessSpeaker(engine_factory=make_engine)
+        times = run(args.mode, frames, speaker, args.duration, args.interval if name != "none" else 1e9)
+        spoken = speaker.stats()["spoken"] if name != "none" else 0
+        speaker.close()
+        print(f"  {name:<14}{len(times):>7}{statistics.median(times) * 1000:>9.1f}{percentile(times, 0.95):>9.1f}"
+              f"{percentile(times, 0.99):>9.1f}{times[-1] * 1000:>9.1f}{spoken:>8}")
+
+
+if __name__ == "__main__":
+    main()
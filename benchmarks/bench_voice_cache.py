@@ -0,0 +1,119 @@
+# benchmarks/bench_voice_cache.py
+#
+# Time-to-audio of a confirmed sign: synthesized live by the engine versus played
+# from a pre-synthesized clip (sayable/voice_cache.py). Each word of a mode's
+# vocabulary is spoken once, one at a time, so the delay from speak() to the first
+# sound is pure start-up cost with no queueing in it. Reports p50/p95/max per path.
+#
+# By default the engine is simulated (bench_speech.SimulatedEngine with --synth-ms
+# of synthesis before the first sound) and the clips are silent WAVs played by a
+# stand-in that only loads and parses them, so the cached path measures the
+# lookup, load and hand-off to a player. --real renders the cache with pyttsx3
+# (in parallel, as `python -m sayable.voice_cache build` does) and speaks through
+# the system's TTS and audio player.
+#
+#   python benchmarks/bench_voice_cache.py --mode travel --synth-ms 150
+
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import time
+import wave
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from bench_speech import SimulatedEngine, percentile
+from sayable.modes import MODES
+from sayable.speech import Speaker
+from sayable.voice_cache import VoiceCache, build, clip_key, phrases, voice_ids, wav_duration
+
+
+class SilentPlayer:
+    """ClipPlayer stand-in: loads and parses the clip, then 'plays' it for its duration."""
+
+    def __init__(self, cache):
+        self.cache = cache
+
+    def play(self, path):
+        duration = wav_duration(self.cache.load(path))
+        return SilentPlayback(duration)
+
+
+class SilentPlayback:
+    def __init__(self, duration):
+        self.ends_at = time.perf_counter() + duration
+
+    def is_playing(self):
+        return time.perf_counter() < self.ends_at
+
+    def stop(self):
+        self.ends_at = 0.0
+
+
+def write_silent_clips(cache_dir, texts, voices, rate):
+    """What a build would write, as silence of the length the simulated engine speaks for."""
+    engine = SimulatedEngine()
+    engine.setProperty("rate", rate)
+    cache = VoiceCache(cache_dir)
+    for voice in voices:
+        for text in texts:
+            path = cache.path(clip_key(text, voice, rate))
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with wave.open(path, "wb") as clip:
+                clip.setnchannels(1)
+                clip.setsampwidth(2)
+                clip.setframerate(22050)
+                clip.writeframes(b"\0\0" * int(engine.duration(text) * 22050))
+            cache.add(text, voice, rate)
+    cache.write_index()
+
+
+def time_to_audio(speaker, words):
+    for word in words:
+        speaker.speak(word)
+        # One at a time: wait for this word to finish before the next
+        while speaker.depth or speaker._current is not None:
+            time.sleep(0.002)
+    return sorted(speaker.delays)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Time-to-audio: live synthesis vs pre-synthesized clips")
+    parser.add_argument("--mode", choices=list(MODES), default="travel")
+    parser.add_argument("--synth-ms", type=float, default=150.0,
+                        help="simulated synthesis time before the first sound of a live utterance")
+    parser.add_argument("--cache-dir", help="voice cache to use or build (default: a temporary folder)")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="processes for --real builds")
+    parser.add_argument("--real", action="store_true", help="pyttsx3 and the system audio player")
+    args = parser.parse_args()
+
+    texts = phrases([args.mode])
+    words = [w for w in MODES[args.mode].vocabulary]
+    with tempfile.TemporaryDirectory() as tmp:
+        cache_dir = args.cache_dir or tmp
+        start = time.perf_counter()
+        if args.real:
+            import pyttsx3
+            make_engine = pyttsx3.init
+            voices = voice_ids([0])
+            build(cache_dir, texts, voices, [150], args.workers)
+        else:
+            make_engine = lambda: SimulatedEngine(latency=args.synth_ms / 1000)
+            write_silent_clips(cache_dir, texts, [SimulatedEngine().getProperty("voices")[0].id], 150)
+        print(f"🔊 {len(texts)} phrases cached in {time.perf_counter() - start:.1f}s; "
+              f"speaking {len(words)} {args.mode} words one at a time")
+        print(f"  {'path':<10}{'p50 ms':>9}{'p95 ms':>9}{'max ms':>9}")
+
+        for name, cache in (("live", None), ("cached", VoiceCache(cache_dir))):
+            player = None if cache is None or args.real else SilentPlayer(cache)
+            speaker = Speaker(engine_factory=make_engine, cache=cache, player=player)
+            delays = time_to_audio(speaker, words)
+            stats = speaker.stats()
+            speaker.close()
+            print(f"  {name:<10}{statistics.median(delays) * 1000:>9.1f}{percentile(delays, 0.95):>9.1f}"
+                  f"{delays[-1] * 1000:>9.1f}   {stats['cached']}/{stats['spoken']} from clips")
+
+
+if __name__ == "__main__":
+    main()
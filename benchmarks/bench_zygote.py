@@ -0,0 +1,91 @@
+# benchmarks/bench_zygote.py
+#
+# Launch-to-first-frame of a mode process: started cold (a fresh interpreter that
+# imports everything itself, like the old subprocess.Popen of a mode script) versus
+# forked from the preloaded zygote of sayable/zygote.py (main_window.py
+# --separate-processes). Each child builds its runtime with sayable/startup.py,
+# recognizes the first frame of --source and reports back when imports were done,
+# when it was ready and when the first frame was through, measured from the click.
+# The window itself is left out (it needs a display), so the children are
+# headless. Launching a mode that is still running is also checked: it should be
+# reused, not started twice.
+#
+#   python benchmarks/bench_zygote.py --source clip.avi --launches 3
+
+import argparse
+import os
+import statistics
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from sayable.zygote import ModeLauncher
+
+
+def headless_mode(mode, control, source, clicked_at, hold):
+    """A mode process without the window: start up, recognize one frame, report."""
+    from sayable.frame import FramePool
+    from sayable.speech import SilentSpeaker
+    from sayable.startup import Startup
+    imported = time.time()
+    runtime = Startup(mode, [source], make_speaker=SilentSpeaker, realtime=False, verbose=False).runtimes()[0]
+    ready = time.time()
+    ret, frame = runtime.open_source().read()
+    runtime.process_frame(FramePool().mirror(frame))
+    first = time.time()
+    control.send({"imports": imported - clicked_at, "ready": ready - clicked_at, "first_frame": first - clicked_at})
+    # Stay open like a window would, until the launcher says quit (or hold runs out)
+    if control.poll(hold):
+        control.recv()
+    runtime.release()
+
+
+def started(mode, control):
+    pass
+
+
+def launch_and_wait(launcher, mode, source, hold=0.0):
+    clicked_at = time.time()
+    process = launcher.launch(mode, target=headless_mode, args=(source, clicked_at, hold))
+    result = launcher.children[mode][1].recv()
+    return process, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Cold vs zygote-forked mode launch time")
+    parser.add_argument("--source", required=True, help="video file or folder the mode recognizes")
+    parser.add_argument("--mode", default="travel")
+    parser.add_argument("--launches", type=int, default=3)
+    args = parser.parse_args()
+
+    cold = ModeLauncher(method="spawn")
+
+    zygote = ModeLauncher()
+    start = time.perf_counter()
+    zygote.warm()
+    # A do-nothing child returns once the zygote has finished its imports
+    process = zygote.launch("warm-up", target=started)
+    process.join()
+    print(f"🧬 zygote ({zygote.method}) ready after {time.perf_counter() - start:.2f}s, in the background "
+          f"while the launcher window is up")
+
+    print(f"  {'launch':<10}{'imports s':>10}{'ready s':>10}{'1st frame s':>13}")
+    for name, launcher in (("cold", cold), ("zygote", zygote)):
+        results = []
+        for _ in range(args.launches):
+            process, result = launch_and_wait(launcher, args.mode, args.source)
+            process.join()
+            results.append(result)
+        print(f"  {name:<10}" + "".join(f"{statistics.median(r[key] for r in results):>{width}.2f}"
+                                       for key, width in (("imports", 10), ("ready", 10), ("first_frame", 13))))
+
+    # A second click on a running mode brings it forward instead of starting another
+    process, _ = launch_and_wait(zygote, args.mode, args.source, hold=30.0)
+    again = zygote.launch(args.mode)
+    print(f"🔁 second click on a running {args.mode}: {'reused' if again is process else 'started a duplicate'} "
+          f"({len(zygote.running())} mode process running)")
+    zygote.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,15 +1,23 @@
-import subprocess
+import argparse
 import os
-import sys
 import tkinter as tk
 import ttkbootstrap as ttk
 from ttkbootstrap.constants import *
 
 class MainLauncher:
-    def __init__(self, root):
+    def __init__(self, root, separate_processes=False):
         self.root = root
         self.root.title("SayAble - Sign Language Recognition Launcher")
         self.project_root = os.path.dirname(os.path.abspath(__file__))
+        self.runtime = None
+        self.recognizer = None
+        self.loading = None
+        # With --separate-processes every mode is forked from a preloaded zygote instead
+        self.launcher = None
+        if separate_processes:
+            from sayable.zygote import ModeLauncher
+            self.launcher = ModeLauncher()
+            self.launcher.warm()
 
         icon_path = os.path.join(self.project_root, "assets", "SayAble_Logo.ico")
         self.root.iconbitmap(icon_path)
@@ -25,6 +33,7 @@ class MainLauncher:
         self.style.configure("Light.TLabel", background="white", foreground="black", font=("Helvetica", 14))
 
         self.build_ui()
+        self.root.protocol("WM_DELETE_WINDOW", self.on_close)
 
     def center_window(self, width, height):
         screen_width = self.root.winfo_screenwidth()
@@ -162,39 +171,63 @@ class MainLauncher:
         self.apply_theme_styles()
 
     def launch_alphabet(self):
-        alphabet_path = os.path.join(self.project_root, "AlphabetDetection", "gui_app.py")
-        if not os.path.exists(alphabet_path):
-            print(f"Error: {alphabet_path} not found!")
-            return
-        subprocess.Popen([sys.executable, alphabet_path])
+        self.open_mode("alphabet")
 
     def launch_number(self):
-        number_path = os.path.join(self.project_root, "NumberDetection", "gui_app.py")
-        if not os.path.exists(number_path):
-            print(f"Error: {number_path} not found!")
-            return
-        subprocess.Popen([sys.executable, number_path])
+        self.open_mode("number")
 
     def launch_travel(self):
-        travel_path = os.path.join(self.project_root, "Travel&Emergency", "guiapp_video.py")
-        if not os.path.exists(travel_path):
-            print(f"Error: {travel_path} not found!")
-            return
-        subprocess.Popen([sys.executable, travel_path])
+        self.open_mode("travel")
 
     def launch_greetings(self):
-        greetings_path = os.path.join(self.project_root, "Greetings&Communication", "guiapp_video.py")
-        if not os.path.exists(greetings_path):
-            print(f"Error: {greetings_path} not found!")
-            return
-        subprocess.Popen([sys.executable, greetings_path])
+        self.open_mode("greetings")
 
     def launch_food(self):
-        food_path = os.path.join(self.project_root, "Food&Shopping", "guiapp_video.py")
-        if not os.path.exists(food_path):
-            print(f"Error: {food_path} not found!")
-            return
-        subprocess.Popen([sys.executable, food_path])
+        self.open_mode("food")
+
+    def open_mode(self, mode):
+        # By default every mode runs inside this process: the first click opens the window
+        # at once and builds the shared runtime (camera, Hands tracker, TTS, models) behind
+        # a loading screen, later clicks only swap the classifier. With --separate-processes
+        # each mode gets its own process, forked from the zygote (see sayable/zygote.py)
+        if self.launcher is not None:
+            self.launcher.launch(mode)
+        elif self.recognizer is not None:
+            self.recognizer.show(mode)
+        elif self.loading is None or not self.loading.root.winfo_exists():
+            from sayable.app import LoadingScreen
+            from sayable.startup import Startup
+
+            window = ttk.Toplevel(self.root)
+            startup = Startup(mode, [0])
+            self.loading = LoadingScreen(
+                window, startup, lambda runtimes: self.on_runtime_ready(window, runtimes[0], mode, startup.timeline)
+            )
+
+    def on_runtime_ready(self, window, runtime, mode, timeline):
+        from sayable.app import SignLanguageApp
+
+        self.loading = None
+        self.runtime = runtime
+        self.runtime.preload_models()
+        self.recognizer = SignLanguageApp(window, self.runtime, mode, on_close=self.on_recognizer_closed,
+                                          timeline=timeline)
+
+    def on_recognizer_closed(self):
+        self.root.lift()
+
+    def on_close(self):
+        if self.launcher is not None:
+            self.launcher.shutdown()
+        if self.loading is not None:
+            self.loading.cancel()  # still starting up: release what it has so far
+        if self.recognizer is not None:
+            # Its threads, tracker and TTS worker would outlive the window otherwise
+            self.recognizer.stop()
+            self.recognizer.release()
+        elif self.runtime is not None:
+            self.runtime.release()
+        self.root.destroy()
 
     def toggle_theme(self):
         self.dark_mode = not self.dark_mode
@@ -222,6 +255,10 @@ class MainLauncher:
                 pass
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="SayAble launcher")
+    parser.add_argument("--separate-processes", action="store_true",
+                        help="run each mode in its own process, forked from a warm preloaded interpreter")
+    args = parser.parse_args()
     root = ttk.Window(themename="darkly")  # Start with dark theme
-    app = MainLauncher(root)
+    app = MainLauncher(root, separate_processes=args.separate_processes)
     root.mainloop()
\ No newline at end of file
@@ -0,0 +1,5 @@
+# sayable/__init__.py
+#
+# Shared building blocks for the SayAble recognition modes. The per-mode folders
+# (AlphabetDetection/, Travel&Emergency/, ...) keep their scripts as entry points;
+# the heavy, reusable pieces live here so several modes can share one process.
@@ -0,0 +1,607 @@
+# sayable/app.py
+#
+# The recognition window shared by every mode. It runs on top of a SharedRuntime,
+# so the frame source, Hands tracker and TTS engine survive mode switches and the window
+# can be hidden and shown again from the launcher without tearing anything down.
+# Camera reads and inference happen on the RecognitionPipeline threads; the Tk
+# loop here only renders the newest frame and result, and only wakes up when the
+# pipeline says there is one (FrameWaker), so it paces itself on the camera.
+# The window opens on a LoadingScreen while sayable/startup.py loads the model,
+# tracker, camera and TTS side by side.
+#
+#   python -m sayable.app travel                          # webcam 0
+#   python -m sayable.app travel --source clip.avi        # replay a recording
+#   python -m sayable.app alphabet --source data/A --loop
+#   python -m sayable.app travel --source 0 --source 1    # two cameras side by side
+
+import argparse
+import datetime
+import pickle
+import threading
+import time
+from collections import deque
+
+import tkinter as tk
+import ttkbootstrap as ttk
+from ttkbootstrap.constants import *
+
+from sayable.journal import SessionJournal
+from sayable.modes import MODES, format_prediction, get_mode
+from sayable.pipeline import JitterMeter, RecognitionPipeline
+from sayable.preview import PreviewRenderer
+from sayable.speech import Speaker
+from sayable.speech_process import ProcessSpeaker
+from sayable.startup import Startup
+from sayable.voice_cache import VoiceCache
+
+# Preview width of each camera when several are shown side by side
+TILE_WIDTH = 440
+
+
+class FrameWaker:
+    """Turns "something new arrived" from any thread into one Tk virtual event.
+
+    Pipeline threads call wake(), which never blocks; a small thread of its own
+    posts the event, so a busy Tk loop can never hold up a capture. Wakes that
+    arrive while one is still pending are merged into it.
+    """
+
+    EVENT = "<<SayAbleFrame>>"
+
+    def __init__(self, widget):
+        self.widget = widget
+        self._pending = threading.Event()
+        self._stopped = True
+        self._thread = None
+        self._lock = threading.Lock()   # start() against a thread deciding to exit
+        self.posted = 0
+        # Posting from another thread needs a thread-enabled Tcl; without one, poll
+        try:
+            self.threaded = bool(int(widget.tk.eval("set tcl_platform(threaded)")))
+        except tk.TclError:
+            self.threaded = False
+
+    def start(self):
+        with self._lock:
+            self._stopped = False
+            if self._thread is not None:
+                return  # a thread that has not exited yet sees the flag and carries on
+            self._thread = threading.Thread(target=self._run, name="sayable-waker", daemon=True)
+            self._thread.start()
+
+    def wake(self):
+        self._pending.set()
+
+    def stop(self):
+        self._stopped = True
+        self._pending.set()
+
+    def _run(self):
+        while True:
+            self._pending.wait()
+            with self._lock:
+                if self._stopped:
+                    self._thread = None
+                    return
+            self._pending.clear()
+            try:
+                self.widget.event_generate(self.EVENT, when="tail")
+            except (tk.TclError, RuntimeError):
+                with self._lock:
+                    self._thread = None
+                return  # the window is gone
+            self.posted += 1
+
+
+def center_window(root, width, height):
+    screen_width = root.winfo_screenwidth()
+    screen_height = root.winfo_screenheight()
+    x = (screen_width // 2) - (width // 2)
+    y = (screen_height // 2) - (height // 2)
+    root.geometry(f"{width}x{height}+{x}+{y}")
+
+
+class LoadingScreen:
+    """Shown while a Startup runs; hands its runtimes to on_ready on the Tk thread."""
+
+    ICONS = {"running": "⏳", "done": "✅", "failed": "❌"}
+
+    def __init__(self, root, startup, on_ready, poll_ms=50):
+        self.root = root
+        self.startup = startup
+        self.on_ready = on_ready
+        self.poll_ms = poll_ms
+        spec = get_mode(startup.mode)
+        self.root.title(spec.window_title)
+        center_window(self.root, 1280, 900)
+
+        self.frame = ttk.Frame(self.root, padding=20)
+        self.frame.pack(fill=BOTH, expand=True)
+        ttk.Label(self.frame, text=spec.header_title, font=("Helvetica", 24, "bold")).pack(pady=(200, 10))
+        self.status_label = ttk.Label(self.frame, text="Starting up...", font=("Segoe UI", 13, "italic"),
+                                      bootstyle="secondary")
+        self.status_label.pack(pady=(0, 20))
+        self.progress = ttk.Progressbar(self.frame, maximum=len(startup.futures), length=420,
+                                        bootstyle="info-striped")
+        self.progress.pack(pady=10)
+        self.phase_labels = {}
+        for name in startup.futures:
+            label = ttk.Label(self.frame, font=("Segoe UI", 11))
+            label.pack()
+            self.phase_labels[name] = label
+
+        self.root.after_idle(lambda: startup.timeline.mark("window"))
+        self.root.after(self.poll_ms, self.poll)
+        self.root.protocol("WM_DELETE_WINDOW", self.cancel)
+
+    def cancel(self):
+        """Closed before the mode was ready: let go of the camera, tracker and TTS it started."""
+        self.startup.cancel()
+        if self.root.winfo_exists():
+            self.root.destroy()
+
+    def poll(self):
+        if not self.root.winfo_exists():
+            return  # closed while loading
+        finished = 0
+        for name, state, ms in self.startup.status():
+            text = f"{self.ICONS[state]} {name}" + (f"  {ms:.0f} ms" if ms is not None else "...")
+            self.phase_labels[name].config(text=text)
+            finished += state != "running"
+        self.progress.config(value=finished)
+        if not self.startup.done:
+            self.root.after(self.poll_ms, self.poll)
+            return
+        try:
+            runtimes = self.startup.runtimes()
+        except (ImportError, OSError, RuntimeError, pickle.UnpicklingError) as e:
+            print(f"❌ Startup failed: {e}")
+            print(self.startup.timeline.report())
+            self.status_label.config(text=f"❌ Could not start: {e}", bootstyle="danger")
+            return
+        self.frame.destroy()
+        self.on_ready(runtimes)
+
+
+class SignLanguageApp:
+    def __init__(self, root, runtime, mode="alphabet", on_close=None, preview_fps=30.0,
+                 history_size=500, log_interval_ms=250, journal=None, timeline=None):
+        self.root = root
+        # One runtime per camera; the first one owns the shared speaker settings
+        self.runtimes = list(runtime) if isinstance(runtime, (list, tuple)) else [runtime]
+        self.runtime = self.runtimes[0]
+        self.on_close = on_close
+        self.preview_fps = preview_fps
+        # Printed once the first frame has been through the recognizer (see sayable/startup.py)
+        self.timeline = timeline
+        self.center_window(1280, 900)
+        self.root.resizable(False, False)
+
+        # ttkbootstrap has one Style per process, so follow whatever theme is active
+        self.style = ttk.Style()
+        self.dark_mode = self.style.theme_use() == "darkly"
+
+        self.pipelines = [RecognitionPipeline(r, r.open_source()) for r in self.runtimes]
+        # The newest history_size signs, in memory and in the log widget; the journal
+        # (if any) keeps the whole session on disk
+        self.prediction_history = deque(maxlen=history_size)
+        self.log_interval_ms = log_interval_ms
+        self._log_pending = []
+        self._log_after_id = None
+        self._log_lines = 0
+        self.journal = SessionJournal(journal) if journal else None
+        self.voice_toggle_state = self.runtime.speaker.current_voice_index
+        self.running = True
+        self._after_id = None
+
+        # Rendering is driven by frame arrival; wakeups that found nothing new are counted
+        self.waker = FrameWaker(self.root)
+        self.root.bind(FrameWaker.EVENT, lambda event: self.update_video())
+        for pipeline in self.pipelines:
+            pipeline.on_update = self.waker.wake
+        self.render_jitter = [JitterMeter() for _ in self.pipelines]
+        self.wakeups = 0
+        self.empty_wakeups = 0
+
+        self.build_ui()
+        self.switch_mode(mode)
+        self.root.protocol("WM_DELETE_WINDOW", self.quit_app)
+        # Once the Tk loop runs: a thread may only post events to a loop that is running
+        self.root.after_idle(self.start_pipelines)
+
+    def center_window(self, width, height):
+        center_window(self.root, width, height)
+
+    def build_ui(self):
+        self.frame = ttk.Frame(self.root, padding=20)
+        self.frame.pack(fill=BOTH, expand=True)
+
+        # Header with title, mode picker and toggles
+        header = ttk.Frame(self.frame)
+        header.pack(fill=X, pady=10)
+
+        self.title_label = ttk.Label(header, font=("Helvetica", 24, "bold"), anchor=CENTER)
+        self.title_label.pack(side=LEFT, padx=10)
+
+        self.theme_toggle = ttk.Button(header, text=self.theme_label(), command=self.toggle_theme, bootstyle="secondary-outline")
+        self.theme_toggle.pack(side=RIGHT, padx=10)
+
+        self.voice_toggle = ttk.Button(header, text=self.voice_label(), command=self.toggle_voice, bootstyle="info-outline")
+        self.voice_toggle.pack(side=RIGHT, padx=10)
+
+        self.mode_labels = {spec.label: key for key, spec in MODES.items()}
+        self.mode_var = tk.StringVar()
+        self.mode_picker = ttk.Combobox(
+            header, textvariable=self.mode_var, values=list(self.mode_labels),
+            state="readonly", width=26
+        )
+        self.mode_picker.bind("<<ComboboxSelected>>", lambda e: self.switch_mode(self.mode_labels[self.mode_var.get()]))
+        self.mode_picker.pack(side=RIGHT, padx=10)
+
+        # Main content
+        content = ttk.Frame(self.frame)
+        content.pack(fill=BOTH, expand=True)
+
+        # Left: Webcam and Prediction
+        left_panel = ttk.Frame(content)
+        left_panel.pack(side=LEFT, fill=BOTH, expand=True, padx=10)
+
+        # One preview tile per camera, two per row
+        video_grid = ttk.Frame(left_panel)
+        video_grid.pack(pady=10, anchor=CENTER)
+        self.video_labels = []
+        self.fps_labels = []
+        self.renderers = []
+        tile_width = TILE_WIDTH if len(self.runtimes) > 1 else None
+        for i, runtime in enumerate(self.runtimes):
+            tile = ttk.Frame(video_grid)
+            tile.grid(row=i // 2, column=i % 2, padx=5, pady=5)
+            video_label = ttk.Label(tile)
+            video_label.pack(anchor=CENTER)
+            fps_label = ttk.Label(tile, text="", font=("Segoe UI", 10), bootstyle="secondary")
+            fps_label.pack(anchor=CENTER)
+            self.video_labels.append(video_label)
+            self.renderers.append(PreviewRenderer(video_label, width=tile_width, max_fps=self.preview_fps))
+            self.fps_labels.append(fps_label)
+
+        self.prediction_label = ttk.Label(left_panel, text="Awaiting gesture input...", font=("Helvetica", 20, "bold"), bootstyle="info")
+        self.prediction_label.pack(pady=10)
+
+        self.instructions = ttk.Label(
+            left_panel,
+            font=("Segoe UI", 13, "italic"),
+            bootstyle="secondary",
+            padding=8
+        )
+        self.instructions.pack(pady=(0, 10))
+
+        # Right: History and Buttons
+        right_panel = ttk.Frame(content)
+        right_panel.pack(side=RIGHT, fill=Y, padx=10, pady=10)
+
+        log_frame = ttk.Labelframe(right_panel, text="Interaction Log", padding=10)
+        log_frame.pack(fill=BOTH, expand=True, pady=(0, 15))
+
+        self.history_text = tk.Text(log_frame, height=15, font=("Segoe UI", 12), wrap=WORD)
+        scrollbar = ttk.Scrollbar(log_frame, orient="vertical", command=self.history_text.yview)
+        self.history_text.config(yscrollcommand=scrollbar.set)
+
+        scrollbar.pack(side=RIGHT, fill=Y)
+        self.history_text.pack(side=LEFT, fill=BOTH, expand=True)
+        self.history_text.config(state=DISABLED)
+
+        btn_frame = ttk.Frame(right_panel)
+        btn_frame.pack(pady=10, fill=X, side=BOTTOM)
+
+        self.speak_again_btn = ttk.Button(btn_frame, text="🔊 Repeat Last Phrase", command=self.speak_last_prediction, bootstyle="success")
+        self.speak_again_btn.pack(fill=X, pady=5)
+
+        self.clear_btn = ttk.Button(btn_frame, text="🧹 Clear Log", command=self.clear_history, bootstyle="warning")
+        self.clear_btn.pack(fill=X, pady=5)
+
+        self.quit_button = ttk.Button(btn_frame, text="🚪 Exit SayAble", command=self.quit_app, bootstyle="danger")
+        self.quit_button.pack(fill=X, pady=5)
+
+    def switch_mode(self, mode):
+        for runtime in self.runtimes:
+            spec = runtime.set_mode(mode)
+        print(f"🔁 Switched to {spec.key} mode in {self.runtime.last_switch_ms:.1f} ms")
+
+        self.root.title(spec.window_title)
+        self.title_label.config(text=spec.header_title)
+        self.instructions.config(text=spec.instructions)
+        self.prediction_label.config(text="Awaiting gesture input...")
+        self.mode_var.set(spec.label)
+
+    def show(self, mode=None):
+        if mode is not None and mode != self.runtime.spec.key:
+            self.switch_mode(mode)
+        self.root.deiconify()
+        self.root.lift()
+        if not self.running:
+            self.running = True
+            self.start_pipelines()
+
+    def start_pipelines(self):
+        self.waker.start()
+        try:
+            for pipeline in self.pipelines:
+                pipeline.start()
+        except RuntimeError as e:
+            # The camera from the last run has not let go yet
+            print(f"❌ {e}")
+            self.prediction_label.config(text="❌ Camera still busy, reopen this mode in a moment")
+            for pipeline in self.pipelines:
+                pipeline.stop()
+            self.waker.stop()
+            self.running = False
+            return
+        self.update_video()
+
+    def schedule_update(self, delay_ms):
+        # One pending timer at most: frame events keep arriving regardless
+        if self._after_id is None:
+            self._after_id = self.root.after(delay_ms, self._on_timer)
+
+    def _on_timer(self):
+        self._after_id = None
+        self.update_video()
+
+    def update_video(self):
+        # Render step only: capture and inference run on their own threads
+        if not self.running:
+            return
+
+        self.wakeups += 1
+        updated = False
+        multi = len(self.pipelines) > 1
+        for i, pipeline in enumerate(self.pipelines):
+            result = pipeline.next_result()
+            if result is not None:
+                updated = True
+                if self.timeline is not None:
+                    self.timeline.mark("first frame")
+                    print(self.timeline.report())
+                    self.timeline = None
+                prediction = result[0]
+                if prediction:
+                    display_prediction = format_prediction(prediction)
+                    if multi:
+                        display_prediction = f"{self.runtimes[i].name}: {display_prediction}"
+                    self.prediction_label.config(text=f"Detected: {display_prediction}")
+                    self.log_prediction(display_prediction, self.runtimes[i], prediction)
+                elif not multi:
+                    self.prediction_label.config(text="Awaiting gesture input...")
+
+            # Preview rate is capped on its own (lower still at the governor's cheapest
+            # level); frames that are not due stay in the slot and get replaced
+            governor = self.runtimes[i].governor
+            renderer = self.renderers[i]
+            wait = renderer.wait(governor.quality.preview_fps if governor is not None else 0)
+            if wait > 0:
+                # Come back when it is due, in case no newer frame arrives by then
+                self.schedule_update(int(wait * 1000) + 1)
+                continue
+            frame = pipeline.next_preview_frame()
+            if frame is not None:
+                renderer.render(frame)
+                self.render_jitter[i].tick(renderer.last_render)
+                updated = True
+                gate = self.runtimes[i].gate
+                self.fps_labels[i].config(
+                    text=(f"{self.runtimes[i].name}  ·  " if multi else "")
+                    + ("💤 Idle  ·  " if gate is not None and gate.idle else "")
+                    + (f"⚙️ {governor.quality.name}  ·  " if governor is not None and governor.level else "")
+                    + f"Preview {pipeline.preview_fps.fps:.1f} fps  ·  "
+                      f"Inference {pipeline.inference_fps.fps:.1f} fps "
+                      f"({pipeline.inference_ms:.0f} ms, latency {pipeline.latency_ms:.0f} ms)  ·  "
+                      f"jitter {self.render_jitter[i].jitter_ms:.1f} ms, {pipeline.dropped_previews} dropped"
+                )
+
+        if not updated:
+            self.empty_wakeups += 1
+        if not self.waker.threaded:
+            self.schedule_update(10)  # no cross-thread events with this Tcl: fall back to polling
+
+    def log_prediction(self, text, runtime=None, label=None):
+        if not self.prediction_history or self.prediction_history[-1] != text:
+            timestamp = datetime.datetime.now().strftime("%H:%M:%S")
+            self.prediction_history.append(text)
+            self._log_pending.append(f"[{timestamp}] {text}\n")
+            # Widget updates go out in batches, at most every log_interval_ms
+            if self._log_after_id is None:
+                self._log_after_id = self.root.after(self.log_interval_ms, self.flush_log)
+            if self.journal is not None and runtime is not None:
+                self.journal.append({
+                    "time": round(time.time(), 3),
+                    "mode": runtime.spec.key,
+                    "camera": runtime.name,
+                    "label": str(label),
+                    "text": format_prediction(label),
+                    "confidence": round(runtime.last_confidence, 4),
+                })
+
+    def flush_log(self):
+        self._log_after_id = None
+        if not self._log_pending:
+            return
+        entries, self._log_pending = self._log_pending[-self.prediction_history.maxlen:], []
+        self.history_text.config(state=NORMAL)
+        self.history_text.insert(END, "".join(entries))
+        self._log_lines += len(entries)
+        excess = self._log_lines - self.prediction_history.maxlen
+        if excess > 0:
+            # Keep the widget as short as the history so a day-long session stays fast
+            self.history_text.delete("1.0", f"{excess + 1}.0")
+            self._log_lines -= excess
+        self.history_text.see(END)
+        self.history_text.config(state=DISABLED)
+
+    def speak_last_prediction(self):
+        if self.prediction_history:
+            self.runtime.repeat_last()
+
+    def clear_history(self):
+        self.prediction_history.clear()
+        self._log_pending.clear()
+        self._log_lines = 0
+        self.history_text.config(state=NORMAL)
+        self.history_text.delete(1.0, END)
+        self.history_text.config(state=DISABLED)
+
+    def toggle_theme(self):
+        self.dark_mode = not self.dark_mode
+        new_theme = "darkly" if self.dark_mode else "cosmo"
+        self.style.theme_use(new_theme)
+        self.theme_toggle.config(text=self.theme_label())
+
+    def theme_label(self):
+        return "☀️ Light Mode" if self.dark_mode else "🌙 Dark Mode"
+
+    def voice_label(self):
+        return "👩 Female Voice" if self.voice_toggle_state else "👨 Male Voice"
+
+    def toggle_voice(self):
+        self.voice_toggle_state = 1 - self.voice_toggle_state  # toggle 0<->1
+        self.runtime.set_voice(self.voice_toggle_state)
+        self.voice_toggle.config(text=self.voice_label())
+
+    def report_pacing(self):
+        for i, pipeline in enumerate(self.pipelines):
+            print(
+                f"🎞️ {self.runtimes[i].name}: capture every {pipeline.capture_jitter.mean_ms:.1f} ms "
+                f"(jitter {pipeline.capture_jitter.jitter_ms:.1f} ms), preview every "
+                f"{self.render_jitter[i].mean_ms:.1f} ms (jitter {self.render_jitter[i].jitter_ms:.1f} ms), "
+                f"{pipeline.dropped_previews} frames never shown, {pipeline.read_failures} failed reads, "
+                f"{pipeline.inference_errors} frames that failed recognition"
+            )
+        print(f"   {self.wakeups} render wakeups, {self.empty_wakeups} with nothing new")
+
+    def quit_app(self):
+        self.stop()
+        if self.on_close is not None:
+            # Hosted by the launcher: keep camera, tracker and TTS warm for the next mode
+            if self.journal is not None:
+                self.journal.flush()
+            self.root.withdraw()
+            self.on_close()
+            return
+        self.release()
+        self.root.destroy()
+
+    def stop(self):
+        """Stop capture, inference and rendering; the window can be shown again."""
+        if self.running:
+            self.running = False
+            self.waker.stop()
+            if self._after_id is not None:
+                self.root.after_cancel(self._after_id)
+                self._after_id = None
+            for pipeline in self.pipelines:
+                pipeline.stop()
+            self.report_pacing()
+        if self._log_after_id is not None:
+            self.root.after_cancel(self._log_after_id)
+            self._log_after_id = None
+        self.flush_log()
+
+    def release(self):
+        """Close the journal, cameras, trackers and TTS; after stop(), for good."""
+        if self.journal is not None:
+            self.journal.close()
+            self.journal = None
+        for runtime in self.runtimes:
+            runtime.release()
+            runtime.close()
+        self.runtime.speaker.close()
+
+
+def parse_args(mode=None, argv=None):
+    parser = argparse.ArgumentParser(description="SayAble sign recognition window")
+    if mode is None:
+        parser.add_argument("mode", nargs="?", default="alphabet", choices=list(MODES))
+    parser.add_argument("--source", action="append",
+                        help="camera index, video file, image or folder of them (default: webcam 0); "
+                             "repeat for several cameras")
+    parser.add_argument("--max-speed", action="store_true",
+                        help="replay files as fast as they decode instead of at their own fps")
+    parser.add_argument("--loop", action="store_true", help="start a replayed file or folder over when it ends")
+    parser.add_argument("--roi", action="store_true",
+                        help="run the hand tracker on a crop around the hands instead of the full frame")
+    parser.add_argument("--idle-after", type=float, default=0, metavar="SECONDS",
+                        help="idle the hand tracker after this long without motion or hands (default: never)")
+    parser.add_argument("--preview-fps", type=float, default=30.0, metavar="FPS",
+                        help="cap on how often the preview is redrawn (0 = every frame)")
+    parser.add_argument("--history-size", type=int, default=500,
+                        help="signs kept in the interaction log (older ones are dropped)")
+    parser.add_argument("--log-interval-ms", type=int, default=250,
+                        help="update the interaction log at most this often")
+    parser.add_argument("--journal", metavar="FILE",
+                        help="append every confirmed sign to this session journal (see sayable/journal.py)")
+    parser.add_argument("--adaptive", action="store_true",
+                        help="lower tracker quality step by step while frames miss the mode's target fps")
+    parser.add_argument("--target-fps", type=float, metavar="FPS",
+                        help="frame rate --adaptive aims for (default: the mode's own)")
+    parser.add_argument("--voice-cache", metavar="DIR",
+                        help="play signs from clips pre-rendered by python -m sayable.voice_cache")
+    parser.add_argument("--tts-process", action="store_true",
+                        help="synthesize speech in a separate process so it never stalls recognition")
+    args = parser.parse_args(argv)
+    if mode is not None:
+        args.mode = mode
+    return args
+
+
+def create_speaker(args):
+    if args.tts_process:
+        return ProcessSpeaker(voice_cache=args.voice_cache)
+    return Speaker(cache=VoiceCache(args.voice_cache) if args.voice_cache else None)
+
+
+def watch_control(root, control, get_app, interval_ms=200):
+    """Commands from the launcher that started this process (see sayable/zygote.py)."""
+    try:
+        while control.poll():
+            command = control.recv()
+            if command == "show":
+                root.deiconify()
+                root.lift()
+                root.focus_force()
+            elif command == "quit":
+                app = get_app()
+                if app is not None:
+                    app.quit_app()
+                else:
+                    root.destroy()
+                return
+    except (EOFError, OSError):
+        return  # the launcher is gone; keep running on our own
+    except tk.TclError:
+        return  # the window is already closed
+    root.after(interval_ms, watch_control, root, control, get_app, interval_ms)
+
+
+def main(mode=None, argv=None, control=None):
+    args = parse_args(mode, argv)
+    root = ttk.Window(themename="cosmo")
+    # The window shows a loading screen at once; everything heavy loads behind it
+    startup = Startup(args.mode, args.source or ["0"], make_speaker=lambda: create_speaker(args),
+                      realtime=not args.max_speed, loop=args.loop, roi=args.roi, idle_after=args.idle_after,
+                      adaptive=args.adaptive, target_fps=args.target_fps)
+
+    apps = []
+
+    def on_ready(runtimes):
+        runtimes[0].preload_models()  # the other modes' models, in the background
+        apps.append(SignLanguageApp(root, runtimes, args.mode, preview_fps=args.preview_fps,
+                                    history_size=args.history_size, log_interval_ms=args.log_interval_ms,
+                                    journal=args.journal, timeline=startup.timeline))
+
+    LoadingScreen(root, startup, on_ready)
+    if control is not None:
+        watch_control(root, control, lambda: apps[0] if apps else None)
+    root.mainloop()
+
+
+if __name__ == "__main__":
+    main()
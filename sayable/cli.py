@@ -0,0 +1,205 @@
+# sayable/cli.py
+#
+# Headless recognizer: no Tk, no ttkbootstrap, no display. It runs one mode over a
+# frame source and writes every confirmed prediction to stdout as one JSON object
+# per line (NDJSON), so it can feed a kiosk front end, a log shipper or jq:
+#
+#   python -m sayable.cli travel                           # webcam 0
+#   python -m sayable.cli alphabet --source 1 --speak      # second camera, with TTS
+#   python -m sayable.cli food --source clip.avi --max-speed | jq .text
+#   python -m sayable.cli travel --source 0 --source 1      # two signing positions
+#
+# Each line looks like
+#   {"mode": "travel", "camera": "camera:0", "label": "help", "text": "Help", "confidence": 0.83,
+#    "t": 3.95, "time": 1760000000.12, "latency_ms": 21.4}
+# where "t" is the source timestamp (seconds into a file, or the camera's read
+# time) and latency_ms runs from the frame being read to the prediction confirming.
+# Everything that is not a prediction (warnings, the final summary) goes to stderr.
+
+import argparse
+import contextlib
+import json
+import sys
+import threading
+import time
+
+from sayable.frame import FramePool
+from sayable.journal import SessionJournal
+from sayable.modes import MODES, format_prediction
+from sayable.multicam import create_runtimes
+from sayable.pipeline import RecognitionPipeline
+from sayable.sources import CameraSource
+from sayable.speech import SilentSpeaker, Speaker
+from sayable.speech_process import ProcessSpeaker
+from sayable.voice_cache import VoiceCache
+
+
+class PredictionWriter:
+    """Turns one runtime's confirmations into NDJSON lines."""
+
+    def __init__(self, runtime, out, lock, journal=None):
+        self.runtime = runtime
+        self.out = out
+        self.lock = lock   # several cameras write to the same stdout
+        self.journal = journal
+        self.frames = 0
+        self.lines = 0
+        self.closed = False   # the reader went away (e.g. `| head`)
+        self._seen = runtime.confirmations
+
+    def on_result(self, prediction, timestamp, captured_at):
+        self.frames += 1
+        if self.runtime.confirmations == self._seen:
+            return  # nothing new confirmed on this frame
+        self._seen = self.runtime.confirmations
+        label = str(self.runtime.confirmed_prediction)
+        record = {
+            "mode": self.runtime.spec.key,
+            "camera": self.runtime.name,
+            "label": label,
+            "text": format_prediction(label),
+            "confidence": round(self.runtime.last_confidence, 4),
+            "t": round(float(timestamp), 3),
+            "time": round(time.time(), 3),
+            "latency_ms": round((time.perf_counter() - captured_at) * 1000, 2),
+        }
+        if self.journal is not None:
+            self.journal.append(record)
+        try:
+            with self.lock:
+                self.out.write(json.dumps(record) + "\n")
+                self.out.flush()
+        except BrokenPipeError:
+            self.closed = True
+            return
+        self.lines += 1
+
+
+def run_threaded(runtimes, writers):
+    """Live sources: every camera gets its own capture and inference threads, newest frame wins."""
+    pipelines = [
+        RecognitionPipeline(runtime, runtime.open_source(), on_result=writer.on_result)
+        for runtime, writer in zip(runtimes, writers)
+    ]
+    for pipeline in pipelines:
+        pipeline.start()
+    try:
+        while any(p.running for p in pipelines) and not any(w.closed for w in writers):
+            time.sleep(0.1)
+    finally:
+        for pipeline in pipelines:
+            pipeline.stop()
+    return sum(p.inference_frames.dropped for p in pipelines)
+
+
+def run_sequential(runtime, writer):
+    """A file at max speed: every frame, in order, so the output is reproducible."""
+    source = runtime.open_source()
+    pool = FramePool()
+    for frame in source:
+        if writer.closed:
+            break
+        captured_at = time.perf_counter()
+        prediction = runtime.process_frame(pool.mirror(frame))
+        writer.on_result(prediction, source.timestamp, captured_at)
+    return 0
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Stream confirmed sign predictions as JSON lines")
+    parser.add_argument("mode", choices=list(MODES))
+    parser.add_argument("--source", action="append",
+                        help="camera index, video file, image or folder of them (default: webcam 0); "
+                             "repeat for several cameras")
+    parser.add_argument("--max-speed", action="store_true",
+                        help="process every frame of a file as fast as possible instead of at its own fps")
+    parser.add_argument("--loop", action="store_true", help="start a replayed file or folder over when it ends")
+    parser.add_argument("--roi", action="store_true",
+                        help="run the hand tracker on a crop around the hands instead of the full frame")
+    parser.add_argument("--idle-after", type=float, default=0, metavar="SECONDS",
+                        help="idle the hand tracker after this long without motion or hands (default: never)")
+    parser.add_argument("--adaptive", action="store_true",
+                        help="lower tracker quality step by step while frames miss the mode's target fps")
+    parser.add_argument("--target-fps", type=float, metavar="FPS",
+                        help="frame rate --adaptive aims for (default: the mode's own)")
+    parser.add_argument("--journal", metavar="FILE",
+                        help="also append every prediction to this fsync'ed session journal")
+    parser.add_argument("--speak", action="store_true", help="also speak confirmed predictions")
+    parser.add_argument("--voice-cache", metavar="DIR",
+                        help="with --speak, play signs from clips pre-rendered by python -m sayable.voice_cache")
+    parser.add_argument("--tts-process", action="store_true",
+                        help="with --speak, synthesize speech in a separate process")
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    out = sys.stdout
+    # Only predictions go to stdout; any other print (model warnings etc.) is sent to stderr
+    with contextlib.redirect_stdout(sys.stderr):
+        if args.speak and args.tts_process:
+            speaker = ProcessSpeaker(voice_cache=args.voice_cache)
+        elif args.speak:
+            speaker = Speaker(cache=VoiceCache(args.voice_cache) if args.voice_cache else None)
+        else:
+            speaker = SilentSpeaker()
+        runtimes = []
+        try:
+            runtimes = create_runtimes(args.mode, args.source or ["0"], speaker=speaker, verbose=False,
+                                       realtime=not args.max_speed, loop=args.loop, roi=args.roi,
+                                       idle_after=args.idle_after, adaptive=args.adaptive,
+                                       target_fps=args.target_fps)
+            for runtime in runtimes:
+                if not runtime.open_source().isOpened():
+                    raise SystemExit(f"❌ Could not open frame source {runtime.name}")
+            lock = threading.Lock()
+            journal = SessionJournal(args.journal) if args.journal else None
+            writers = [PredictionWriter(runtime, out, lock, journal) for runtime in runtimes]
+
+            start = time.perf_counter()
+            dropped = 0
+            try:
+                if args.max_speed and len(runtimes) == 1 and not isinstance(runtimes[0].cap, CameraSource):
+                    dropped = run_sequential(runtimes[0], writers[0])
+                else:
+                    dropped = run_threaded(runtimes, writers)
+            except KeyboardInterrupt:
+                pass
+            finally:
+                if journal is not None:
+                    journal.close()
+
+            elapsed = time.perf_counter() - start
+            for writer in writers:
+                print(
+                    f"✅ {writer.runtime.name}: {writer.frames} frames in {elapsed:.1f}s "
+                    f"({writer.frames / elapsed if elapsed else 0:.1f} fps), {writer.lines} predictions"
+                )
+                gate = writer.runtime.gate
+                if gate is not None:
+                    stats = gate.stats()
+                    print(f"   💤 detector skipped on {stats['skipped']} frames ({stats['skipped_share']:.0%}), "
+                          f"{stats['wakeups']} wake-ups")
+                governor = writer.runtime.governor
+                if governor is not None:
+                    stats = governor.stats()
+                    print(f"   ⚙️ ended on quality level {stats['level']} ({stats['quality']}) after "
+                          f"{stats['changes']} changes: detect {stats['detect_ms']:.1f} ms + classify "
+                          f"{stats['classify_ms']:.1f} ms per frame")
+            print(f"   {dropped} frames dropped")
+            if args.speak:
+                stats = speaker.stats()
+                print(f"🗣️ {stats['spoken']} spoken ({stats['cached']} from the voice cache), {stats['coalesced']} coalesced, {stats['interrupted']} cut off, "
+                      f"{stats['dropped']} dropped; speech started {stats['delay_p50_ms']:.0f} ms "
+                      f"(p95 {stats['delay_p95_ms']:.0f} ms) after confirmation")
+                if args.tts_process:
+                    print(f"   TTS process restarted {stats['restarts']} times, {stats['lost']} utterances lost")
+        finally:
+            # Also on the error exits: a live TTS worker would keep the process up
+            for runtime in runtimes:
+                runtime.release()
+            speaker.close()
+
+
+if __name__ == "__main__":
+    main()
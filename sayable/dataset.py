@@ -0,0 +1,212 @@
+# sayable/dataset.py
+#
+# Feature extraction for the create_dataset*.py scripts. MediaPipe runs once per
+# image/clip, which is embarrassingly parallel, so the files can be spread over a
+# process pool: every worker owns its own Hands tracker and results come back in
+# input order, so a parallel build writes exactly the same pickle as a serial one.
+#
+# What MediaPipe produced for each file is also kept in a content-addressed cache
+# (see sayable/landmark_cache.py), so a rebuild only runs the tracker on new or
+# changed files and picks up where a crashed build stopped.
+
+import argparse
+import os
+import sys
+import time
+from collections import namedtuple
+from multiprocessing import Pool
+
+import cv2
+import mediapipe as mp
+import numpy as np
+
+from sayable.features import FeatureExtractor
+from sayable.landmark_cache import LandmarkCache
+
+# Tracker settings the original builders used
+IMAGE_SETTINGS = {"static_image_mode": True, "max_num_hands": 2, "min_detection_confidence": 0.3}
+VIDEO_SETTINGS = {"static_image_mode": False, "max_num_hands": 2, "min_detection_confidence": 0.5}
+
+
+def parse_build_args(description):
+    parser = argparse.ArgumentParser(description=description)
+    parser.add_argument(
+        "--workers", type=int, default=os.cpu_count() or 1,
+        help="processes running MediaPipe (default: all cores, 1 = serial)"
+    )
+    parser.add_argument(
+        "--cache-dir", default="./.landmark_cache",
+        help="where per-file landmarks are cached (default: ./.landmark_cache)"
+    )
+    parser.add_argument("--no-cache", action="store_true", help="ignore and do not write the landmark cache")
+    return parser.parse_args()
+
+
+def list_samples(data_dir, classes, extension=None):
+    """(label, path) pairs in a fixed order: classes sorted, files sorted."""
+    samples = []
+    for label in sorted(os.listdir(data_dir)):
+        if label not in classes:
+            continue
+        class_dir = os.path.join(data_dir, label)
+        for filename in sorted(os.listdir(class_dir)):
+            if extension is not None and not filename.endswith(extension):
+                continue
+            samples.append((label, os.path.join(class_dir, filename)))
+    return samples
+
+
+# === Per-process state (one tracker per worker) ===
+_hands = None
+_features = None
+
+
+def _init_worker(settings):
+    global _hands, _features
+    _hands = mp.solutions.hands.Hands(**settings)
+    _features = FeatureExtractor()
+
+
+# === Raw per-file records (what gets cached) ===
+def image_landmarks(path):
+    """{'features': 42 float32 features for the first hand or None} for one image."""
+    img = cv2.imread(path)
+    if img is None:
+        return {"features": None}  # skip unreadable images
+
+    img_rgb = cv2.cvtColor(img, cv2.COLOR_BGR2RGB)
+    results = _hands.process(img_rgb)
+    data_aux = _features.single_hand(results)
+    return {"features": None if data_aux is None else data_aux.copy()}
+
+
+def video_landmarks(path):
+    """{'frames': (n, 84) float32 per-frame features, 'hands_detected': bool} for one clip."""
+    # Each clip starts from a fresh tracker so the result does not depend on which
+    # clip the worker happened to process before
+    _hands.reset()
+    cap = cv2.VideoCapture(path)
+
+    frame_features = []
+    hands_detected = False
+
+    while True:
+        ret, frame = cap.read()
+        if not ret:
+            break
+
+        frame = cv2.flip(frame, 1)
+        frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+        results = _hands.process(frame_rgb)
+
+        if results.multi_hand_landmarks:
+            hands_detected = True
+        frame_features.append(_features.two_hands(results).copy())
+
+    cap.release()
+
+    frames = np.array(frame_features, dtype=np.float32).reshape(-1, 84)
+    return {"frames": frames, "hands_detected": hands_detected}
+
+
+# === Records -> dataset rows ===
+def image_features(record):
+    """42 features as a list, or None when no hand was found."""
+    data_aux = record["features"]
+    return None if data_aux is None else data_aux.tolist()
+
+
+def video_features(record):
+    """(mean of the per-frame 84 features or None, whether any hand was seen)."""
+    frames = record["frames"]
+    if len(frames) == 0:
+        return None, record["hands_detected"]
+
+    # Accumulate in float64 like the live SlidingWindow does
+    feature_vector = np.mean(frames, axis=0, dtype=np.float64)
+    return feature_vector.tolist(), record["hands_detected"]
+
+
+Extraction = namedtuple("Extraction", "name settings flip landmarks features")
+
+IMAGES = Extraction("image", IMAGE_SETTINGS, False, image_landmarks, image_features)
+VIDEOS = Extraction("video", VIDEO_SETTINGS, True, video_landmarks, video_features)
+_EXTRACTIONS = {IMAGES.name: IMAGES, VIDEOS.name: VIDEOS}
+
+
+def _process(task):
+    """Worker entry point: run MediaPipe over one file and cache the record."""
+    name, path, cache_path = task
+    start = time.perf_counter()
+    record = _EXTRACTIONS[name].landmarks(path)
+    elapsed = time.perf_counter() - start
+    if cache_path is not None:
+        LandmarkCache.write(cache_path, record, elapsed)
+    return record
+
+
+def extract_all(samples, extraction, workers=1, cache_dir=None):
+    """Dataset rows for every sample, in the same order as `samples`.
+
+    `extraction` is IMAGES or VIDEOS. With a cache_dir, files whose content and
+    tracker settings were seen before are read from the cache instead.
+    """
+    total = len(samples)
+    cache = None
+    if cache_dir is not None:
+        cache = LandmarkCache(cache_dir, {
+            "kind": extraction.name,
+            "flip": extraction.flip,
+            **extraction.settings,
+        })
+
+    records = [None] * total
+    tasks = []
+    for i, (_, path) in enumerate(samples):
+        cache_path = None
+        if cache is not None:
+            key = cache.key(path)
+            records[i] = cache.load(key)
+            cache_path = cache.path(key)
+        if records[i] is None:
+            tasks.append((i, (extraction.name, path, cache_path)))
+
+    workers = max(1, min(workers, len(tasks) or 1))
+    print(f"⚙️ {total} files: {total - len(tasks)} cached, {len(tasks)} to extract with {workers} worker(s)")
+
+    pool = None
+    if not tasks:
+        iterator = iter(())
+    elif workers == 1:
+        _init_worker(extraction.settings)
+        iterator = map(_process, [task for _, task in tasks])
+    else:
+        pool = Pool(workers, initializer=_init_worker, initargs=(extraction.settings,))
+        iterator = pool.imap(_process, [task for _, task in tasks], chunksize=1)
+
+    start = time.perf_counter()
+    try:
+        for done, ((i, _), record) in enumerate(zip(tasks, iterator), 1):
+            records[i] = record
+            _print_progress(done, len(tasks), start)
+    finally:
+        if pool is not None:
+            pool.close()
+            pool.join()
+
+    if tasks:
+        print()
+    if cache is not None:
+        cache.report(time.perf_counter() - start)
+
+    return [extraction.features(record) for record in records]
+
+
+def _print_progress(done, total, start):
+    elapsed = time.perf_counter() - start
+    rate = done / elapsed if elapsed > 0 else 0.0
+    eta = (total - done) / rate if rate > 0 else 0.0
+    sys.stdout.write(
+        f"\r📦 {done}/{total} ({done * 100 // total}%)  {rate:.1f} files/s  ETA {eta:.0f}s   "
+    )
+    sys.stdout.flush()
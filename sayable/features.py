@@ -0,0 +1,62 @@
+# sayable/features.py
+#
+# MediaPipe hand landmarks -> classifier features, shared by the dataset builders
+# and live inference so both always produce the same numbers.
+#
+# Each hand becomes 42 floats: (x - min(x), y - min(y)) for its 21 landmarks,
+# interleaved x0, y0, x1, y1, ... The static modes use the first detected hand; the
+# word-level modes use 84 floats, left hand then right hand, zeros for a missing hand.
+
+import numpy as np
+
+NUM_LANDMARKS = 21
+HAND_SIZE = 2 * NUM_LANDMARKS     # 42
+TWO_HAND_SIZE = 2 * HAND_SIZE     # 84
+
+
+class FeatureExtractor:
+    """Converts MediaPipe results into preallocated feature arrays.
+
+    Differences are taken in float64, as the original list-based code did. The
+    single-hand vector is stored as float32 (the classifier casts to that anyway);
+    the two-hand vector stays float64, because the word-level modes average it
+    over the window first and that mean must equal the original np.mean.
+
+    The arrays returned by single_hand() and two_hands() are reused on the next
+    call; copy them (or append them to a SlidingWindow) if you need to keep them.
+    One extractor per thread.
+    """
+
+    def __init__(self):
+        self._coords = np.empty((NUM_LANDMARKS, 2), dtype=np.float64)
+        self._min = np.empty(2, dtype=np.float64)
+        self.single = np.zeros(HAND_SIZE, dtype=np.float32)
+        self.both = np.zeros(TWO_HAND_SIZE, dtype=np.float64)
+
+    def hand_into(self, hand_landmarks, out):
+        """Write one hand's 42 min-normalized features into `out` (42 floats, its own dtype)."""
+        landmarks = hand_landmarks.landmark
+        coords = self._coords
+        coords[:, 0] = [lm.x for lm in landmarks]
+        coords[:, 1] = [lm.y for lm in landmarks]
+        coords.min(axis=0, out=self._min)
+        np.subtract(coords, self._min, out=out.reshape(NUM_LANDMARKS, 2))
+        return out
+
+    def single_hand(self, results):
+        """42 features for the first detected hand, or None when no hand is visible."""
+        if not results.multi_hand_landmarks:
+            return None
+        return self.hand_into(results.multi_hand_landmarks[0], self.single)
+
+    def two_hands(self, results):
+        """84 features: left hand then right hand, zeros where a hand is missing."""
+        both = self.both
+        both.fill(0.0)
+        if results.multi_hand_landmarks:
+            for hand_landmarks, handedness in zip(results.multi_hand_landmarks, results.multi_handedness):
+                if handedness.classification[0].label == "Left":
+                    self.hand_into(hand_landmarks, both[:HAND_SIZE])
+                else:
+                    self.hand_into(hand_landmarks, both[HAND_SIZE:])
+        return both
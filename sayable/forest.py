@@ -0,0 +1,191 @@
+# sayable/forest.py
+#
+# The RandomForestClassifier models are evaluated one frame at a time, where
+# sklearn's input validation and per-tree dispatch cost far more than the trees
+# themselves. compile_forest() flattens every tree of a fitted forest into a few
+# contiguous NumPy arrays, and CompiledForest walks all trees at once with a
+# handful of vectorized steps per tree level.
+#
+# The arithmetic mirrors sklearn: inputs are compared as float32 against the
+# float64 thresholds, each tree's leaf distribution is normalized the way
+# DecisionTreeClassifier.predict_proba does, and the trees are summed in order and
+# divided by n_estimators. predict_proba() therefore returns the same bits.
+#
+#   python -m sayable.forest            # export every mode's model next to its .p file
+
+import hashlib
+import os
+import pickle
+
+import numpy as np
+
+from sayable.modes import MODES
+
+COMPILED_SUFFIX = ".forest.npz"
+
+
+class CompiledForest:
+    """Drop-in replacement for a fitted RandomForestClassifier's predict/predict_proba."""
+
+    def __init__(self, feature, threshold, left, right, value, roots, classes, max_depth, source_sha256=""):
+        self.feature = feature
+        self.threshold = threshold
+        self.left = left
+        self.right = right
+        self.value = value
+        self.roots = roots
+        self.classes_ = classes
+        self.max_depth = int(max_depth)
+        self.n_estimators = len(roots)
+        # Hash of the pickle this was compiled from, to spot a stale export
+        self.source_sha256 = str(source_sha256)
+
+    # === Inference ===
+    def apply(self, X):
+        """Leaf node index of every tree for every row: shape (n_samples, n_estimators)."""
+        X = np.asarray(X, dtype=np.float32)
+        if X.ndim == 1:
+            X = X.reshape(1, -1)
+        rows = np.arange(X.shape[0])[:, None]
+        node = np.broadcast_to(self.roots, (X.shape[0], self.n_estimators))
+        # Leaves point to themselves, so walking max_depth levels lands every tree on a leaf
+        for _ in range(self.max_depth):
+            go_left = X[rows, self.feature[node]] <= self.threshold[node]
+            node = np.where(go_left, self.left[node], self.right[node])
+        return node
+
+    def predict_proba(self, X):
+        leaves = self.apply(X)
+        # (n_samples, n_estimators, n_classes) summed over trees in tree order
+        proba = np.add.reduce(self.value[leaves], axis=1)
+        proba /= self.n_estimators
+        return proba
+
+    def predict(self, X):
+        return self.classes_.take(np.argmax(self.predict_proba(X), axis=1), axis=0)
+
+    # === Serialization ===
+    def save(self, path):
+        np.savez_compressed(
+            path,
+            feature=self.feature, threshold=self.threshold,
+            left=self.left, right=self.right, value=self.value,
+            roots=self.roots, classes=self.classes_, max_depth=self.max_depth,
+            source_sha256=self.source_sha256,
+        )
+
+    @classmethod
+    def load(cls, path):
+        with np.load(path, allow_pickle=False) as arrays:
+            return cls(**{name: arrays[name] for name in arrays.files})
+
+
+def compile_forest(model):
+    """Flatten a fitted sklearn RandomForestClassifier into a CompiledForest."""
+    if getattr(model, "n_outputs_", 1) != 1:
+        raise ValueError("Only single-output forests can be compiled")
+
+    n_classes = len(model.classes_)
+    features, thresholds, lefts, rights, values, roots = [], [], [], [], [], []
+    offset = 0
+    max_depth = 0
+
+    for estimator in model.estimators_:
+        tree = estimator.tree_
+        n = tree.node_count
+        index = np.arange(n, dtype=np.int32) + offset
+        is_leaf = tree.children_left == -1
+
+        feature = np.where(is_leaf, 0, tree.feature).astype(np.int32)
+        threshold = np.where(is_leaf, np.inf, tree.threshold).astype(np.float64)
+        left = np.where(is_leaf, index, tree.children_left + offset).astype(np.int32)
+        right = np.where(is_leaf, index, tree.children_right + offset).astype(np.int32)
+
+        # Same normalization as DecisionTreeClassifier.predict_proba
+        proba = np.array(tree.value[:, 0, :n_classes], dtype=np.float64)
+        normalizer = proba.sum(axis=1)[:, np.newaxis]
+        normalizer[normalizer == 0.0] = 1.0
+        proba /= normalizer
+
+        features.append(feature)
+        thresholds.append(threshold)
+        lefts.append(left)
+        rights.append(right)
+        values.append(proba)
+        roots.append(offset)
+        offset += n
+        max_depth = max(max_depth, tree.max_depth)
+
+    return CompiledForest(
+        feature=np.concatenate(features),
+        threshold=np.concatenate(thresholds),
+        left=np.concatenate(lefts),
+        right=np.concatenate(rights),
+        value=np.concatenate(values),
+        roots=np.asarray(roots, dtype=np.int32),
+        classes=np.asarray(model.classes_),
+        max_depth=max_depth,
+    )
+
+
+def compiled_path(model_path):
+    return os.path.splitext(model_path)[0] + COMPILED_SUFFIX
+
+
+def file_sha256(path):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def load_compiled(model_path):
+    """The compiled forest exported from `model_path`, or None if missing or out of date."""
+    path = compiled_path(model_path)
+    if not os.path.exists(path):
+        return None
+    compiled = CompiledForest.load(path)
+    if compiled.source_sha256 != file_sha256(model_path):
+        print(f"⚠️ {os.path.basename(path)} is out of date for its model; run 'python -m sayable.forest'")
+        return None
+    return compiled
+
+
+def check_equivalent(model, compiled, n_features, samples=2000, seed=0):
+    """Largest |sklearn - compiled| probability over random and near-threshold inputs."""
+    rng = np.random.default_rng(seed)
+    X = rng.random((samples, n_features))
+    # Also probe exactly on split thresholds, where <= vs < would show up
+    picks = rng.integers(0, len(compiled.threshold), size=samples)
+    usable = np.isfinite(compiled.threshold[picks])
+    X[usable, compiled.feature[picks][usable]] = compiled.threshold[picks][usable]
+    return float(np.abs(model.predict_proba(X) - compiled.predict_proba(X)).max())
+
+
+def export(model_path):
+    with open(model_path, 'rb') as f:
+        model = pickle.load(f)['model']
+    compiled = compile_forest(model)
+    compiled.source_sha256 = file_sha256(model_path)
+    diff = check_equivalent(model, compiled, model.n_features_in_)
+    if diff != 0.0:
+        raise ValueError(f"{model_path}: compiled forest differs from sklearn by {diff}")
+
+    out_path = compiled_path(model_path)
+    compiled.save(out_path)
+    return out_path
+
+
+def main():
+    for spec in MODES.values():
+        out_path = export(spec.model_path)
+        print(
+            f"✅ {spec.key}: {os.path.basename(spec.model_path)} "
+            f"({os.path.getsize(spec.model_path) / 1e6:.1f} MB) -> {os.path.basename(out_path)} "
+            f"({os.path.getsize(out_path) / 1e6:.1f} MB)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+# sayable/frame.py
+#
+# One captured frame as it travels through the pipeline. A Frame carries the
+# mirrored BGR image and computes its RGB version the first time someone asks
+# for it, so MediaPipe and the preview share a single colour conversion (and a
+# frame nobody looks at is never converted). A FramePool mirrors captures into
+# recycled buffers: once the last reference to a Frame goes away its buffers are
+# handed to the next capture, so the hot loop stops allocating full-size arrays.
+#
+# Hold on to the Frame, not to its arrays: a bare .bgr or .rgb kept past the
+# Frame's lifetime will be overwritten by a later capture.
+
+import threading
+import weakref
+from collections import deque
+
+import cv2
+import numpy as np
+
+
+class Frame:
+    __slots__ = ("bgr", "_rgb", "_pool", "_lock", "__weakref__")
+
+    def __init__(self, bgr, pool=None):
+        self.bgr = bgr            # mirrored, as the signer sees themself
+        self._rgb = None
+        self._pool = pool
+        self._lock = threading.Lock()  # the inference thread and the GUI may both ask for rgb
+        if pool is not None:
+            weakref.finalize(self, pool.recycle, bgr)
+
+    @property
+    def shape(self):
+        return self.bgr.shape
+
+    @property
+    def rgb(self):
+        if self._rgb is None:
+            with self._lock:
+                if self._rgb is None:
+                    out = self._pool.buffer(self.bgr.shape) if self._pool is not None else None
+                    self._rgb = cv2.cvtColor(self.bgr, cv2.COLOR_BGR2RGB, dst=out)
+                    if self._pool is not None:
+                        weakref.finalize(self, self._pool.recycle, out)
+        return self._rgb
+
+
+def as_frame(frame):
+    """A Frame for a Frame or an already mirrored BGR array (wrapped, not copied)."""
+    return frame if isinstance(frame, Frame) else Frame(frame)
+
+
+class FramePool:
+    """Recycles the full-size buffers of Frames nobody references any more."""
+
+    def __init__(self):
+        self._free = deque()
+        self.allocated = 0
+
+    def buffer(self, shape):
+        while self._free:
+            try:
+                buf = self._free.pop()
+            except IndexError:
+                break  # another thread took the last one
+            if buf.shape == shape:
+                return buf
+            # the source changed size: let buffers of the old size go
+        self.allocated += 1
+        return np.empty(shape, np.uint8)
+
+    def recycle(self, buf):
+        self._free.append(buf)
+
+    def mirror(self, raw):
+        """A Frame holding raw flipped left-right, written straight into a pooled buffer."""
+        return Frame(cv2.flip(raw, 1, dst=self.buffer(raw.shape)), self)
@@ -0,0 +1,78 @@
+# sayable/gate.py
+#
+# Idle gating for unattended kiosks. Running MediaPipe on an empty scene costs as
+# much as on a signer, so MotionGate puts the detector to sleep once nothing has
+# moved and no hand has been seen for idle_after seconds. While idle it only
+# diffs a small grayscale thumbnail against the previous one (well under a
+# millisecond), still runs the detector idle_rate times a second in case someone
+# holds perfectly still, and wakes up on the first frame that shows motion.
+
+import time
+
+import cv2
+
+
+class MotionGate:
+    def __init__(self, idle_after=5.0, idle_rate=1.0, threshold=12, min_changed=0.005,
+                 size=(80, 60), clock=time.monotonic):
+        self.idle_after = idle_after
+        self.idle_rate = idle_rate        # detector runs per second while idle
+        self.threshold = threshold        # grey-level change that counts as a changed pixel
+        self.min_changed = min_changed    # fraction of changed pixels that counts as motion
+        self.size = size
+        self.clock = clock
+
+        self.idle = False
+        self._previous = None
+        self._last_activity = clock()
+        self._last_probe = 0.0
+
+        self.detector_runs = 0
+        self.skipped = 0
+        self.wakeups = 0
+
+    def motion(self, frame):
+        """True if this frame differs enough from the previous one."""
+        small = cv2.resize(frame, self.size, interpolation=cv2.INTER_AREA)
+        gray = cv2.cvtColor(small, cv2.COLOR_BGR2GRAY)
+        previous, self._previous = self._previous, gray
+        if previous is None:
+            return True
+        changed = cv2.countNonZero(cv2.threshold(cv2.absdiff(gray, previous), self.threshold, 255,
+                                                 cv2.THRESH_BINARY)[1])
+        return changed >= self.min_changed * gray.size
+
+    def should_detect(self, frame):
+        """Whether to run the hand detector on this frame."""
+        now = self.clock()
+        if self.motion(frame):
+            self._last_activity = now
+            if self.idle:
+                self.idle = False
+                self.wakeups += 1
+        elif not self.idle and now - self._last_activity >= self.idle_after:
+            self.idle = True
+            self._last_probe = now
+
+        if self.idle:
+            if now - self._last_probe < 1.0 / self.idle_rate:
+                self.skipped += 1
+                return False
+            self._last_probe = now
+        self.detector_runs += 1
+        return True
+
+    def hands_seen(self):
+        # A hand in view keeps the detector awake even if it is not moving
+        self._last_activity = self.clock()
+        self.idle = False
+
+    def stats(self):
+        total = self.detector_runs + self.skipped
+        return {
+            "idle": self.idle,
+            "detector_runs": self.detector_runs,
+            "skipped": self.skipped,
+            "skipped_share": self.skipped / total if total else 0.0,
+            "wakeups": self.wakeups,
+        }
@@ -0,0 +1,132 @@
+# sayable/governor.py
+#
+# Adaptive quality for slow machines. QualityGovernor watches how long each frame
+# takes (hand detection and classification, measured separately) against the
+# frame budget of the mode's target fps, and steps down a ladder of cheaper
+# settings while the budget is blown: the lite Hands model, a smaller detector
+# input, detecting on every k-th frame only, then a lower-rate preview. When the
+# frames fit comfortably in the budget again it steps back up, one rung at a
+# time; a step up that has to be undone right away doubles the wait before the
+# next one, so a machine sitting on the edge does not flip-flop.
+
+import time
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class QualityLevel:
+    name: str
+    model_complexity: int = 1   # Hands model: 1 = full, 0 = lite
+    input_scale: float = 1.0    # frames are resized by this before detection
+    stride: int = 1             # detect on every stride-th frame, reuse the landmarks in between
+    preview_fps: float = 0.0    # cap on the GUI preview rate (0 = every frame)
+
+
+LADDER = (
+    QualityLevel("Full quality"),
+    QualityLevel("Lite model", model_complexity=0),
+    QualityLevel("Low resolution", model_complexity=0, input_scale=0.5),
+    QualityLevel("Every 2nd frame", model_complexity=0, input_scale=0.5, stride=2),
+    QualityLevel("Every 3rd frame", model_complexity=0, input_scale=0.5, stride=3),
+    QualityLevel("Cheap preview", model_complexity=0, input_scale=0.5, stride=3, preview_fps=10.0),
+)
+
+
+class QualityGovernor:
+    def __init__(self, target_fps=None, window=1.0, headroom=0.6, hold=3.0, max_hold=60.0,
+                 settle=0.5, clock=time.monotonic):
+        self.target_fps = target_fps  # None: use the mode's target_fps
+        self.window = window          # seconds of frames averaged per decision
+        self.headroom = headroom      # step up once frames take less than this share of the budget
+        self.hold = hold              # seconds of headroom needed before stepping up
+        self.base_hold = hold
+        self.max_hold = max_hold
+        self.settle = settle          # ignore this long after a change (the tracker is rebuilt)
+        self.clock = clock
+
+        self.level = 0
+        self._frame = 0
+        self._window_start = None
+        self._detect_ms = 0.0
+        self._classify_ms = 0.0
+        self._frames = 0
+        self._ignore_until = 0.0
+        self._headroom_since = None
+        self._last_up = None
+
+        self.detect_ms = 0.0      # per-frame means over the last window
+        self.classify_ms = 0.0
+        self.budget_ms = 0.0
+        self.changes = 0
+
+    @property
+    def quality(self):
+        return LADDER[self.level]
+
+    def skip_detection(self):
+        """True on the frames between detections at the current stride."""
+        self._frame += 1
+        return self._frame % self.quality.stride != 0
+
+    def observe(self, detect_ms, classify_ms, target_fps):
+        """Record one frame; returns the new QualityLevel if the level changed, else None."""
+        now = self.clock()
+        if now < self._ignore_until:
+            return None
+        if self._window_start is None:
+            self._window_start = now
+        self._detect_ms += detect_ms
+        self._classify_ms += classify_ms
+        self._frames += 1
+        if now - self._window_start < self.window:
+            return None
+
+        self.detect_ms = self._detect_ms / self._frames
+        self.classify_ms = self._classify_ms / self._frames
+        self.budget_ms = 1000.0 / (self.target_fps or target_fps)
+        self._reset_window()
+        frame_ms = self.detect_ms + self.classify_ms
+
+        if frame_ms > self.budget_ms:
+            self._headroom_since = None
+            if self.level == len(LADDER) - 1:
+                return None
+            if self._last_up is not None and now - self._last_up < 2 * self.hold:
+                # The level above was already too slow: wait longer before trying it again
+                self.hold = min(self.hold * 2, self.max_hold)
+            return self._change(self.level + 1, now)
+
+        if frame_ms < self.headroom * self.budget_ms and self.level > 0:
+            if self._headroom_since is None:
+                self._headroom_since = now
+            elif now - self._headroom_since >= self.hold:
+                self._last_up = now
+                return self._change(self.level - 1, now)
+        else:
+            self._headroom_since = None
+            if self._last_up is not None and now - self._last_up > self.max_hold:
+                self.hold = self.base_hold  # settled for a long while: be eager again
+        return None
+
+    def _change(self, level, now):
+        self.level = level
+        self.changes += 1
+        self._headroom_since = None
+        self._ignore_until = now + self.settle
+        return self.quality
+
+    def _reset_window(self):
+        self._window_start = None
+        self._detect_ms = 0.0
+        self._classify_ms = 0.0
+        self._frames = 0
+
+    def stats(self):
+        return {
+            "level": self.level,
+            "quality": self.quality.name,
+            "changes": self.changes,
+            "detect_ms": self.detect_ms,
+            "classify_ms": self.classify_ms,
+            "budget_ms": self.budget_ms,
+        }
@@ -0,0 +1,168 @@
+# sayable/journal.py
+#
+# Append-only session journal. Every confirmed sign is one JSON object per line
+# (the same fields the headless CLI prints), so a kiosk keeps a record of the
+# whole day without holding it in memory. Lines are handed to a writer thread
+# and written, flushed and fsync'ed in batches — at most every flush_every
+# seconds — so the GUI never waits on the disk and a crash loses at most the last
+# batch. A journal can be replayed (printed, optionally spoken, at its original
+# pace) or exported to CSV or plain text:
+#
+#   python -m sayable.journal replay session.ndjson --speed 4
+#   python -m sayable.journal export session.ndjson --format csv -o session.csv
+
+import argparse
+import csv
+import datetime
+import json
+import os
+import sys
+import threading
+import time
+
+from sayable.speech import Speaker
+
+FIELDS = ("time", "mode", "camera", "label", "text", "confidence")
+
+
+class SessionJournal:
+    def __init__(self, path, flush_every=1.0, fsync=True):
+        self.path = path
+        self.flush_every = flush_every
+        self.fsync = fsync
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        self._file = open(path, "a", encoding="utf-8")
+        self._pending = []
+        self._cond = threading.Condition()
+        self._write_lock = threading.Lock()   # flush() runs on the GUI thread and the writer
+        self._closed = False
+        self._closing = threading.Event()
+        self.written = 0
+        self.syncs = 0
+        self._thread = threading.Thread(target=self._run, name="sayable-journal", daemon=True)
+        self._thread.start()
+
+    def append(self, record):
+        line = json.dumps(record, ensure_ascii=False) + "\n"
+        with self._cond:
+            if self._closed:
+                return
+            self._pending.append(line)
+            self._cond.notify()
+
+    def _run(self):
+        while True:
+            with self._cond:
+                while not self._pending and not self._closed:
+                    self._cond.wait()
+            if self._closed:
+                return  # close() writes what is left
+            # Let a batch collect before touching the disk
+            self._closing.wait(self.flush_every)
+            self.flush()
+
+    def flush(self):
+        # Taking the batch inside the write lock keeps batches on disk in order
+        with self._write_lock:
+            with self._cond:
+                lines, self._pending = self._pending, []
+            if not lines:
+                return
+            self._file.writelines(lines)
+            self._file.flush()
+            if self.fsync:
+                os.fsync(self._file.fileno())
+                self.syncs += 1
+            self.written += len(lines)
+
+    def close(self):
+        with self._cond:
+            self._closed = True
+            self._cond.notify()
+        self._closing.set()
+        self._thread.join()
+        self.flush()
+        self._file.close()
+
+
+def read_journal(path):
+    """Records of a journal in order; a line cut short by a crash is skipped."""
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                yield json.loads(line)
+            except json.JSONDecodeError:
+                print(f"⚠️ Skipping damaged journal line: {line[:60]}", file=sys.stderr)
+
+
+def replay(path, speed=1.0, speaker=None, out=sys.stdout):
+    """Print (and optionally speak) a journal at its original pace divided by speed."""
+    previous = None
+    for record in read_journal(path):
+        if previous is not None and speed > 0:
+            time.sleep(max(0.0, (record["time"] - previous) / speed))
+        previous = record["time"]
+        stamp = datetime.datetime.fromtimestamp(record["time"]).strftime("%H:%M:%S")
+        out.write(f"[{stamp}] {record.get('camera', '')}  {record['text']}\n")
+        out.flush()
+        if speaker is not None:
+            speaker.speak(record["label"])
+
+
+def export(path, out, fmt="csv"):
+    count = 0
+    if fmt == "csv":
+        writer = csv.DictWriter(out, fieldnames=FIELDS, extrasaction="ignore")
+        writer.writeheader()
+    for record in read_journal(path):
+        if fmt == "csv":
+            writer.writerow(record)
+        else:
+            stamp = datetime.datetime.fromtimestamp(record["time"]).strftime("%Y-%m-%d %H:%M:%S")
+            out.write(f"[{stamp}] {record['text']}\n")
+        count += 1
+    return count
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Replay or export a SayAble session journal")
+    commands = parser.add_subparsers(dest="command", required=True)
+    play = commands.add_parser("replay", help="print the session at its original pace")
+    play.add_argument("journal")
+    play.add_argument("--speed", type=float, default=1.0, help="pace multiplier (0 = no waiting)")
+    play.add_argument("--speak", action="store_true", help="also speak every sign")
+    dump = commands.add_parser("export", help="write the session as CSV or plain text")
+    dump.add_argument("journal")
+    dump.add_argument("--format", choices=("csv", "txt"), default="csv")
+    dump.add_argument("-o", "--output", help="output file (default: stdout)")
+    args = parser.parse_args()
+    if not os.path.isfile(args.journal):
+        raise SystemExit(f"❌ No journal at {args.journal}")
+
+    if args.command == "replay":
+        speaker = Speaker() if args.speak else None
+        try:
+            replay(args.journal, args.speed, speaker)
+            if speaker is not None:
+                speaker.drain()  # let the last signs finish before the engine goes
+        except KeyboardInterrupt:
+            pass
+        finally:
+            if speaker is not None:
+                speaker.close()
+        return
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8", newline="") as out:
+            count = export(args.journal, out, args.format)
+        print(f"✅ Exported {count} signs to {args.output}", file=sys.stderr)
+    else:
+        export(args.journal, sys.stdout, args.format)
+
+
+if __name__ == "__main__":
+    main()
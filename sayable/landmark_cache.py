@@ -0,0 +1,66 @@
+# sayable/landmark_cache.py
+#
+# Content-addressed cache of what MediaPipe produced for one dataset file. The key
+# is a SHA-256 of the file bytes plus the tracker settings (detection confidence,
+# max hands, flip, ...) and the feature layout version, so renaming or moving a clip
+# still hits and changing a setting misses. Every entry is its own file, written
+# atomically as soon as the file is processed, which makes an interrupted build
+# resumable for free.
+
+import hashlib
+import json
+import os
+import pickle
+
+# Bump when sayable.features changes what a record contains
+FEATURE_VERSION = 1
+
+
+class LandmarkCache:
+    def __init__(self, cache_dir, settings):
+        self.cache_dir = cache_dir
+        self.settings = dict(settings, feature_version=FEATURE_VERSION)
+        self._settings_blob = json.dumps(self.settings, sort_keys=True).encode()
+        os.makedirs(cache_dir, exist_ok=True)
+
+        self.hits = 0
+        self.misses = 0
+        self.seconds_saved = 0.0
+
+    def key(self, path):
+        digest = hashlib.sha256(self._settings_blob)
+        with open(path, 'rb') as f:
+            for chunk in iter(lambda: f.read(1 << 20), b''):
+                digest.update(chunk)
+        return digest.hexdigest()
+
+    def path(self, key):
+        return os.path.join(self.cache_dir, key[:2], key + ".pkl")
+
+    def load(self, key):
+        """The cached record, or None (and a miss is counted)."""
+        try:
+            with open(self.path(key), 'rb') as f:
+                entry = pickle.load(f)
+        except (OSError, EOFError, pickle.UnpicklingError):
+            self.misses += 1
+            return None
+        self.hits += 1
+        self.seconds_saved += entry["elapsed"]
+        return entry["record"]
+
+    @staticmethod
+    def write(cache_path, record, elapsed):
+        # Write to a temp file and rename so a crash never leaves a half-written entry
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'wb') as f:
+            pickle.dump({"record": record, "elapsed": elapsed}, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, cache_path)
+
+    def report(self, extract_seconds):
+        total = self.hits + self.misses
+        print(
+            f"🗃️ Landmark cache: {self.hits}/{total} hits, {self.misses} misses, "
+            f"extracted in {extract_seconds:.1f}s, saved ~{self.seconds_saved:.1f}s of MediaPipe time"
+        )
@@ -0,0 +1,146 @@
+# sayable/modes.py
+#
+# One entry per recognition mode: which model to load, how its features are built
+# and what the GUI should say. Everything mode-specific lives here so switching
+# modes never needs to re-import or re-initialize anything heavy.
+
+import os
+from dataclasses import dataclass
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+MODEL_DIR = os.path.join(PROJECT_ROOT, "ModelFiles")
+
+# Feature layouts used by the trained models
+STATIC = "static"        # single frame, first hand only -> 42 floats
+SEQUENCE = "sequence"    # mean of a sliding window of both hands -> 84 floats
+
+
+@dataclass(frozen=True)
+class ModeSpec:
+    key: str
+    label: str
+    model_file: str
+    kind: str
+    vocabulary: tuple
+    window_title: str
+    header_title: str
+    instructions: str
+    required_consistency: int
+    data_dir: str = ""
+    confidence_threshold: float = 0.0
+    sequence_length: int = 20
+    target_fps: float = 15.0   # frame rate the adaptive quality governor aims for
+
+    @property
+    def model_path(self):
+        return os.path.join(MODEL_DIR, self.model_file)
+
+    @property
+    def data_path(self):
+        """Recorded training images/clips for this mode (not shipped with the repo)."""
+        return os.path.join(PROJECT_ROOT, self.data_dir)
+
+
+ALPHABET_CLASSES = tuple(chr(i) for i in range(ord('A'), ord('Z') + 1))
+DIGIT_CLASSES = tuple(str(i) for i in range(10))
+
+TRAVEL_EMERGENCY_WORDS = (
+    "where", "go", "come", "bus", "car",
+    "location", "ticket", "city", "ride", "lost",
+    "help", "sick", "doctor", "medicine",
+    "pain", "hurt", "emergency", "police", "No Gesture Detected", "call"
+)
+
+EVERYDAY_COMMUNICATION_WORDS = (
+    "hello", "goodbye", "thank_you", "sorry", "please",
+    "welcome", "fine", "excuse", "sign", "language",
+    "understand", "not", "again", "slow", "write",
+    "talk", "maybe", "phone", "yes", "no", "No Gesture Detected"
+)
+
+FOOD_SHOPPING_WORDS = (
+    "hungry", "thirsty", "water", "food",
+    "drink", "vegetarian", "spicy", "allergic", "billing",
+    "money", "buy", "pay", "price",
+    "card", "expensive", "cheap", "want", "sell", "No Gesture Detected"
+)
+
+MODES = {
+    "alphabet": ModeSpec(
+        key="alphabet",
+        label="🅰️ Alphabet",
+        model_file="model.p",
+        kind=STATIC,
+        vocabulary=ALPHABET_CLASSES,
+        window_title="SayAble - Gesture-based Speech Assistant",
+        header_title="SayAble - Personal Assistant for the Speech Impaired",
+        instructions="Show a sign to the webcam and SayAble will detect it!",
+        data_dir="AlphabetDetection/data",
+        required_consistency=7,
+    ),
+    "number": ModeSpec(
+        key="number",
+        label="🔢 Number",
+        model_file="digit_model.p",
+        kind=STATIC,
+        vocabulary=DIGIT_CLASSES,
+        window_title="SayAble - Gesture-based Speech Assistant",
+        header_title="SayAble - Personal Assistant for the Speech Impaired",
+        instructions="Show a digit (0–9) to the webcam and SayAble will detect it!",
+        data_dir="NumberDetection/digit_data",
+        required_consistency=7,
+    ),
+    "travel": ModeSpec(
+        key="travel",
+        label="🧳 Travel & Emergency",
+        model_file="video_travel_emergency_model.p",
+        kind=SEQUENCE,
+        vocabulary=TRAVEL_EMERGENCY_WORDS,
+        window_title="SayAble - Travel & Emergency Assistant",
+        header_title="SayAble - Travel & Emergency Assistant",
+        instructions="Perform a travel or emergency gesture. SayAble will recognize and speak it!",
+        data_dir="Travel&Emergency/data_travel_emergency_videos",
+        required_consistency=5,
+        confidence_threshold=0.4,
+        target_fps=20.0,
+    ),
+    "greetings": ModeSpec(
+        key="greetings",
+        label="💬 Greetings & Communication",
+        model_file="video_communication_model.p",
+        kind=SEQUENCE,
+        vocabulary=EVERYDAY_COMMUNICATION_WORDS,
+        window_title="SayAble - Greetings & Communication Assistant",
+        header_title="SayAble - Greetings & Communication Assistant",
+        instructions="Perform a communication gesture. SayAble will recognize and speak it!",
+        data_dir="Greetings&Communication/data_communication_videos",
+        required_consistency=5,
+        confidence_threshold=0.4,
+        target_fps=20.0,
+    ),
+    "food": ModeSpec(
+        key="food",
+        label="🍔 Food & Shopping",
+        model_file="video_food_shopping_model.p",
+        kind=SEQUENCE,
+        vocabulary=FOOD_SHOPPING_WORDS,
+        window_title="SayAble - Food & Shopping Assistant",
+        header_title="SayAble - Food & Shopping Assistant",
+        instructions="Perform a food or shopping gesture. SayAble will recognize and speak it!",
+        data_dir="Food&Shopping/data_food_shopping_videos",
+        required_consistency=5,
+        confidence_threshold=0.4,
+        target_fps=20.0,
+    ),
+}
+
+
+def get_mode(key):
+    if key not in MODES:
+        raise KeyError(f"Unknown mode '{key}'. Choose one of: {', '.join(MODES)}")
+    return MODES[key]
+
+
+def format_prediction(prediction):
+    # Format prediction: replace underscores with spaces and capitalize
+    return str(prediction).replace('_', ' ').capitalize()
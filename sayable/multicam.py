@@ -0,0 +1,97 @@
+# sayable/multicam.py
+#
+# Several cameras (or replayed sources) in one process. Each camera gets its own
+# SharedRuntime: its own capture thread, inference thread, Hands tracker, window
+# and stability state, so the expensive MediaPipe step of one camera never waits
+# for another (MediaPipe releases the GIL while it runs). The classifier is the
+# only thing they share: a BatchedModel wraps each loaded model so that calls that
+# arrive while another camera's prediction is running are answered together in
+# one predict_proba.
+
+import threading
+
+import numpy as np
+
+from sayable.recognizer import ModelStore
+from sayable.runtime import SharedRuntime
+from sayable.sources import open_source
+from sayable.speech import Speaker
+
+
+class BatchedModel:
+    """Thread-safe predict_proba front that merges concurrent calls into one batch.
+
+    The first caller to find the model idle evaluates every row queued so far;
+    callers arriving meanwhile wait and are served by the next batch. There is no
+    timer, so a single camera pays nothing extra.
+    """
+
+    def __init__(self, model):
+        self.model = model
+        self.classes_ = model.classes_
+        self.batches = 0
+        self.rows = 0
+        self._cond = threading.Condition()
+        self._pending = []
+        self._busy = False
+
+    def predict_proba(self, X):
+        X = np.asarray(X).reshape(-1, np.shape(X)[-1])
+        slot = {"X": X, "proba": None, "error": None}
+        with self._cond:
+            self._pending.append(slot)
+            while slot["proba"] is None and slot["error"] is None:
+                if not self._busy:
+                    self._busy = True
+                    batch, self._pending = self._pending, []
+                    break
+                self._cond.wait()
+            else:
+                return self._result(slot)
+
+        # Leader: evaluate everything that was waiting, outside the lock
+        try:
+            proba = self.model.predict_proba(np.vstack([s["X"] for s in batch]))
+            start = 0
+            for s in batch:
+                s["proba"] = proba[start:start + len(s["X"])]
+                start += len(s["X"])
+        except Exception as e:
+            for s in batch:
+                s["error"] = e
+        with self._cond:
+            self.batches += 1
+            self.rows += sum(len(s["X"]) for s in batch)
+            self._busy = False
+            self._cond.notify_all()
+        return self._result(slot)
+
+    @staticmethod
+    def _result(slot):
+        if slot["error"] is not None:
+            raise slot["error"]
+        return slot["proba"]
+
+    def predict(self, X):
+        return self.classes_.take(np.argmax(self.predict_proba(X), axis=1), axis=0)
+
+
+class BatchingModelStore(ModelStore):
+    """A ModelStore whose models are shared through one BatchedModel per mode."""
+
+    def _load(self, key):
+        model, classes = super()._load(key)
+        return BatchedModel(model), classes
+
+
+def create_runtimes(mode, sources, speaker=None, verbose=True, realtime=True, loop=False, roi=False,
+                    idle_after=0, adaptive=False, target_fps=None):
+    """One SharedRuntime per source, all sharing a BatchingModelStore and one speaker."""
+    models = BatchingModelStore()
+    speaker = speaker or Speaker()
+    return [
+        SharedRuntime(mode, source=open_source(source, realtime=realtime, loop=loop),
+                      speaker=speaker, verbose=verbose, models=models, roi=roi, idle_after=idle_after,
+                      adaptive=adaptive, target_fps=target_fps)
+        for source in sources
+    ]
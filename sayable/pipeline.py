@@ -0,0 +1,271 @@
+# sayable/pipeline.py
+#
+# Capture, inference and rendering run at their own pace. A capture thread reads the
+# frame source, an inference worker runs MediaPipe + the classifier, and the GUI only
+# renders whatever is newest. The hand-off slots hold a single item and the newest
+# one wins, so a slow stage drops stale frames instead of queueing them up. Both
+# consumers get the same Frame (see sayable/frame.py): one mirrored buffer, one
+# shared RGB conversion. Whenever there is something new to show, on_update is
+# called so a GUI can wake up on frame arrival instead of polling.
+
+import statistics
+import threading
+import time
+from collections import deque
+
+from sayable.frame import FramePool
+
+
+class LatestQueue:
+    """Single-slot queue: put() replaces whatever has not been consumed yet."""
+
+    def __init__(self):
+        self._item = None
+        self._has_item = False
+        self._cond = threading.Condition()
+        self.dropped = 0
+
+    def put(self, item):
+        with self._cond:
+            if self._has_item:
+                self.dropped += 1
+            self._item = item
+            self._has_item = True
+            self._cond.notify_all()
+
+    def get(self, timeout=None):
+        """Block until an item arrives; returns None on timeout."""
+        with self._cond:
+            if not self._has_item:
+                self._cond.wait(timeout)
+            return self._take()
+
+    def get_nowait(self):
+        with self._cond:
+            return self._take()
+
+    def wait_empty(self, timeout=None):
+        """Block until the current item has been taken; True if the slot is empty."""
+        with self._cond:
+            if self._has_item:
+                self._cond.wait(timeout)
+            return not self._has_item
+
+    def clear(self):
+        with self._cond:
+            self._item = None
+            self._has_item = False
+            self._cond.notify_all()
+
+    def _take(self):
+        if not self._has_item:
+            return None
+        item = self._item
+        self._item = None
+        self._has_item = False
+        self._cond.notify_all()
+        return item
+
+
+class FpsMeter:
+    """Frames per second over a sliding time window."""
+
+    def __init__(self, window=1.0):
+        self.window = window
+        self._ticks = deque()
+        self._lock = threading.Lock()
+
+    def tick(self, now=None):
+        now = time.perf_counter() if now is None else now
+        with self._lock:
+            self._ticks.append(now)
+            self._trim(now)
+
+    @property
+    def fps(self):
+        with self._lock:
+            self._trim(time.perf_counter())
+            return len(self._ticks) / self.window
+
+    def _trim(self, now):
+        while self._ticks and now - self._ticks[0] > self.window:
+            self._ticks.popleft()
+
+
+class JitterMeter:
+    """Mean and spread (standard deviation) of the intervals between recent events."""
+
+    def __init__(self, size=120):
+        self._intervals = deque(maxlen=size)
+        self._last = None
+        self._lock = threading.Lock()
+
+    def tick(self, now=None):
+        now = time.perf_counter() if now is None else now
+        with self._lock:
+            if self._last is not None:
+                self._intervals.append(now - self._last)
+            self._last = now
+
+    def reset(self):
+        with self._lock:
+            self._intervals.clear()
+            self._last = None
+
+    @property
+    def mean_ms(self):
+        with self._lock:
+            return statistics.fmean(self._intervals) * 1000 if self._intervals else 0.0
+
+    @property
+    def jitter_ms(self):
+        with self._lock:
+            return statistics.pstdev(self._intervals) * 1000 if len(self._intervals) > 1 else 0.0
+
+
+class RecognitionPipeline:
+    def __init__(self, runtime, cap, on_result=None):
+        self.runtime = runtime
+        self.cap = cap
+        # Called on the inference thread for every processed frame with
+        # (prediction, source timestamp, perf_counter time the frame was captured)
+        self.on_result = on_result
+        # Called (no arguments) from the worker threads when a new preview frame or
+        # result is waiting; must not block
+        self.on_update = None
+
+        self.inference_frames = LatestQueue()   # capture -> inference worker
+        self.preview_frames = LatestQueue()     # capture -> renderer
+        self.results = LatestQueue()            # inference worker -> renderer
+        self.pool = FramePool()
+
+        self.capture_fps = FpsMeter()
+        self.preview_fps = FpsMeter()
+        self.inference_fps = FpsMeter()
+        self.capture_jitter = JitterMeter()
+        self.read_failures = 0
+        self.inference_errors = 0
+        self.inference_ms = 0.0
+        self.latency_ms = 0.0   # capture -> prediction, including time spent waiting
+
+        self._stop = threading.Event()
+        self._source_ended = threading.Event()
+        self._threads = []
+
+    @property
+    def running(self):
+        return any(thread.is_alive() for thread in self._threads)
+
+    def start(self, timeout=1.0):
+        if self.running and not self._stop.is_set():
+            return
+        # Threads from the last run that outlived stop() would share the slots with
+        # the new ones: give them a little longer, then refuse
+        for thread in self._threads:
+            thread.join(timeout)
+        self._threads = [thread for thread in self._threads if thread.is_alive()]
+        if self._threads:
+            names = ", ".join(thread.name for thread in self._threads)
+            raise RuntimeError(f"cannot restart: {names} from the last run still running")
+        self._stop.clear()
+        self._source_ended.clear()
+        self._threads = [
+            threading.Thread(target=self._capture_loop, name="sayable-capture", daemon=True),
+            threading.Thread(target=self._inference_loop, name="sayable-inference", daemon=True),
+        ]
+        for thread in self._threads:
+            thread.start()
+
+    def stop(self, timeout=1.0):
+        self._stop.set()
+        for thread in self._threads:
+            thread.join(timeout)
+        # One stuck in a read is kept, so start() knows it is still there
+        self._threads = [thread for thread in self._threads if thread.is_alive()]
+        for slot in (self.inference_frames, self.preview_frames, self.results):
+            slot.clear()
+
+    # === Capture thread ===
+    def _capture_loop(self):
+        # A file replayed at max speed has no clock to keep up with: wait for the
+        # worker instead of decoding frames only to drop them
+        lossless = getattr(self.cap, "realtime", True) is False
+        backoff = 0.01
+        self.capture_jitter.reset()
+        while not self._stop.is_set():
+            if lossless and not self.inference_frames.wait_empty(timeout=0.1):
+                continue
+            try:
+                ret, frame = self.cap.read()
+            except OSError as e:
+                print(f"❌ {e}")
+                self._source_ended.set()  # nothing more will come from this source
+                break
+            if not ret:
+                if getattr(self.cap, "exhausted", False):
+                    self._source_ended.set()  # a replayed file or folder has ended
+                    break
+                # Camera hiccup or unplugged: back off, longer each time, instead of spinning
+                self.read_failures += 1
+                self._stop.wait(backoff)
+                backoff = min(backoff * 2, 0.5)
+                continue
+            backoff = 0.01
+            captured_at = time.perf_counter()
+            frame = self.pool.mirror(frame)
+            self.capture_fps.tick(captured_at)
+            self.capture_jitter.tick(captured_at)
+            self.inference_frames.put((frame, getattr(self.cap, "timestamp", captured_at), captured_at))
+            self.preview_frames.put(frame)
+            self._notify()
+
+    # === Inference worker ===
+    def _inference_loop(self):
+        last_prediction = None
+        while not self._stop.is_set():
+            item = self.inference_frames.get(timeout=0.1)
+            if item is None:
+                if self._source_ended.is_set():
+                    break  # the last frame of a finite source has been handled
+                continue
+            frame, timestamp, captured_at = item
+            start = time.perf_counter()
+            try:
+                prediction = self.runtime.process_frame(frame)
+            except Exception as e:
+                # One bad frame must not end recognition for the rest of the session
+                self.inference_errors += 1
+                if self.inference_errors == 1:
+                    print(f"⚠️ Frame skipped: {type(e).__name__}: {e} (further failures are only counted)")
+                continue
+            done = time.perf_counter()
+            self.inference_ms = (done - start) * 1000
+            self.latency_ms = (done - captured_at) * 1000
+            self.inference_fps.tick(done)
+            self.results.put((prediction,))
+            if prediction != last_prediction:
+                # An unchanged result can wait for the next preview frame's wakeup
+                last_prediction = prediction
+                self._notify()
+            if self.on_result is not None:
+                self.on_result(prediction, timestamp, captured_at)
+
+    def _notify(self):
+        if self.on_update is not None:
+            self.on_update()
+
+    @property
+    def dropped_previews(self):
+        """Captured frames replaced before the renderer took them."""
+        return self.preview_frames.dropped
+
+    # === Render step (called from the GUI thread) ===
+    def next_preview_frame(self):
+        frame = self.preview_frames.get_nowait()
+        if frame is not None:
+            self.preview_fps.tick()
+        return frame
+
+    def next_result(self):
+        """Latest inference result as a 1-tuple, or None if nothing new arrived."""
+        return self.results.get_nowait()
@@ -0,0 +1,80 @@
+# sayable/preview.py
+#
+# Preview rendering without per-frame allocations. The straightforward path
+# (cvtColor -> Image.fromarray -> ImageTk.PhotoImage) builds a new RGB array, a new
+# PIL image and a new Tk image for every frame, and Tk has to free the old one.
+# PreviewRenderer works out the display size once, resizes and converts into two
+# preallocated buffers, wraps the colour one in a PIL image that shares its memory
+# (RGBA: PIL only shares buffers whose layout matches its own 4-byte pixels), and
+# pastes that into the same PhotoImage every time. Given a pipeline Frame it
+# starts from the RGB view MediaPipe already computed instead of converting the
+# BGR image a second time. It also caps how often it renders, independently of
+# how fast frames arrive or are classified.
+
+import time
+
+import cv2
+import numpy as np
+from PIL import Image, ImageTk
+
+from sayable.frame import Frame
+
+
+class PreviewRenderer:
+    def __init__(self, label, width=None, max_fps=30.0):
+        self.label = label
+        self.width = width        # display width; None keeps the frame's own size
+        self.max_fps = max_fps    # 0 = render every frame handed in
+        self.size = None          # (width, height), fixed by the first frame
+        self.photo = None
+        self.last_render = 0.0
+        self.frames = 0
+
+    def wait(self, max_fps=0.0, now=None):
+        """Seconds until the next frame may be rendered; max_fps can lower the cap further."""
+        caps = [f for f in (self.max_fps, max_fps) if f]
+        if not caps:
+            return 0.0
+        now = time.perf_counter() if now is None else now
+        return max(0.0, self.last_render + 1.0 / min(caps) - now)
+
+    def due(self, max_fps=0.0, now=None):
+        return self.wait(max_fps, now) == 0.0
+
+    def _allocate(self, frame):
+        height, width = frame.shape[:2]
+        if self.width and self.width != width:
+            height, width = height * self.width // width, self.width
+        self.size = (width, height)
+        self._source_shape = frame.shape
+        resize = (width, height) != frame.shape[1::-1]
+        self._resized = np.empty((height, width, 3), np.uint8) if resize else None
+        self._rgba = np.empty((height, width, 4), np.uint8)
+        # Shares self._rgba's memory: converting into the buffer updates the image
+        self._image = Image.frombuffer("RGBA", self.size, self._rgba, "raw", "RGBA", 0, 1)
+        self.photo = None  # a new size needs a new PhotoImage
+
+    def prepare(self, frame):
+        """Resize and convert a Frame or BGR array into the display buffer; returns its PIL image."""
+        if self.size is None or frame.shape != self._source_shape:
+            self._allocate(frame)
+        if isinstance(frame, Frame):
+            image, code = frame.rgb, cv2.COLOR_RGB2RGBA
+        else:
+            image, code = frame, cv2.COLOR_BGR2RGBA
+        if self._resized is not None:
+            image = cv2.resize(image, self.size, dst=self._resized, interpolation=cv2.INTER_AREA)
+        cv2.cvtColor(image, code, dst=self._rgba)
+        return self._image
+
+    def render(self, frame, now=None):
+        """Draw a Frame or BGR array into the label."""
+        image = self.prepare(frame)
+        if self.photo is None:
+            self.photo = ImageTk.PhotoImage(image=image)
+            self.label.configure(image=self.photo)
+            self.label.imgtk = self.photo  # Tk does not keep its own reference
+        else:
+            self.photo.paste(image)
+        self.last_render = time.perf_counter() if now is None else now
+        self.frames += 1
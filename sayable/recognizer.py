@@ -0,0 +1,401 @@
+# sayable/recognizer.py
+#
+# One recognition stream. A Recognizer owns everything that belongs to a single
+# camera or client: its MediaPipe Hands tracker, sliding landmark window and
+# stability (debounce) counters. The classifiers are read-only, so they live in a
+# ModelStore that any number of Recognizers share; one process can then run many
+# streams side by side, each on its own thread or connection.
+
+import pickle
+import threading
+import time
+
+import cv2
+import mediapipe as mp
+import numpy as np
+
+from sayable.features import FeatureExtractor
+from sayable.forest import load_compiled
+from sayable.frame import FramePool, as_frame
+from sayable.gate import MotionGate
+from sayable.governor import QualityGovernor
+from sayable.modes import MODES, STATIC, get_mode
+from sayable.roi import HandRoi
+from sayable.sources import open_source
+from sayable.speech import SIGN, Speaker
+from sayable.window import SlidingWindow
+
+mp_hands = mp.solutions.hands
+
+# Two hands for the word-level modes; see tracker_hands() for the static ones
+TRACKER_SETTINGS = {
+    "static_image_mode": False,
+    "max_num_hands": 2,
+    "min_detection_confidence": 0.5,
+    "min_tracking_confidence": 0.5,
+}
+
+
+def tracker_hands(kind):
+    # Static modes only read the first hand, and tracked with 1 as the mode scripts did
+    return 1 if kind == STATIC else TRACKER_SETTINGS["max_num_hands"]
+
+
+def create_tracker(model_complexity=1, max_num_hands=None):
+    settings = dict(TRACKER_SETTINGS, model_complexity=model_complexity)
+    if max_num_hands is not None:
+        settings["max_num_hands"] = max_num_hands
+    return mp_hands.Hands(**settings)
+
+
+def warm_up_tracker(hands, shape=(480, 640, 3)):
+    """Run a tracker once on a blank frame: MediaPipe builds its graph on the first process()."""
+    hands.process(np.zeros(shape, dtype=np.uint8))
+
+
+def load_mode_model(key):
+    """(model, classes) for a mode."""
+    spec = get_mode(key)
+    # Prefer the flat-array export (python -m sayable.forest): same
+    # probabilities, a fraction of sklearn's per-call overhead
+    model = load_compiled(spec.model_path)
+    if model is not None:
+        return model, list(model.classes_)
+    with open(spec.model_path, 'rb') as f:
+        model_dict = pickle.load(f)
+    model = model_dict['model']
+    return model, model_dict.get('classes', list(getattr(model, 'classes_', [])))
+
+
+class ModelStore:
+    """Every mode's classifier, loaded once and shared read-only between Recognizers."""
+
+    def __init__(self):
+        self._models = {}
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        if key in self._models:
+            return self._models[key]
+        with self._lock:
+            if key not in self._models:
+                self._models[key] = self._load(key)
+        return self._models[key]
+
+    def _load(self, key):
+        return load_mode_model(key)
+
+    def preload(self):
+        # Warm the cache in the background so the first switch to each mode is instant too
+        def _load_all():
+            for key in MODES:
+                try:
+                    self.get(key)
+                except (OSError, pickle.UnpicklingError) as e:
+                    print(f"⚠️ Could not preload '{key}' model: {e}")
+
+        thread = threading.Thread(target=_load_all, daemon=True)
+        thread.start()
+        return thread
+
+
+# Used by every Recognizer that is not given a store of its own
+default_models = ModelStore()
+
+
+class Recognizer:
+    def __init__(self, mode="alphabet", models=None, speaker=None, verbose=True, roi=False, idle_after=0,
+                 adaptive=False, target_fps=None):
+        self.models = models or default_models
+        self.speaker = speaker or Speaker()
+        self.verbose = verbose  # print every word-level prediction, as the mode scripts always did
+        self.features = FeatureExtractor()
+        self._hands = None
+        self.max_num_hands = None   # set by set_mode()
+        self._retrack = False       # the hand count changed; process_frame() rebuilds the tracker
+        # Crop around the previous frame's hands before running MediaPipe (see sayable/roi.py)
+        self.roi = HandRoi() if roi else None
+        # Put the detector to sleep after this many seconds without motion or hands (0 = never)
+        self.gate = MotionGate(idle_after) if idle_after > 0 else None
+        # Trade tracker quality for frame rate when frames blow the budget (see sayable/governor.py)
+        self.governor = QualityGovernor(target_fps) if adaptive else None
+        self.model_complexity = 1
+        self.input_scale = 1.0
+        self._last_results = None
+
+        # Every frame is pushed here whatever the mode, so a word-level mode can
+        # predict straight away after a switch from another word-level mode
+        self.sequence_length = max(spec.sequence_length for spec in MODES.values())
+        self.landmark_queue = SlidingWindow(self.sequence_length)
+
+        # Held while a frame is classified so a mode switch from another thread
+        # never lands halfway through a prediction
+        self.lock = threading.RLock()
+
+        self.spec = None
+        self.model = None
+        self.classes = None
+        self.last_switch_ms = 0.0
+        # Classifier confidence of the latest frame and a running count of confirmed
+        # predictions, so a consumer can tell a new confirmation from a repeated one
+        self.last_confidence = 0.0
+        self.confirmations = 0
+        self.reset_stability()
+        self.set_mode(mode)
+
+    # === Models ===
+    def load_model(self, key):
+        return self.models.get(key)
+
+    def set_mode(self, key):
+        start = time.perf_counter()
+        spec = get_mode(key)
+        model, classes = self.load_model(key)
+        with self.lock:
+            self.model, self.classes = model, classes
+            self.spec = spec
+            if spec.kind != STATIC:
+                self.landmark_queue.resize(spec.sequence_length)
+            hands = tracker_hands(spec.kind)
+            if hands != self.max_num_hands:
+                self.max_num_hands = hands
+                # The tracker may be mid-process() on the inference thread: only flag it
+                self._retrack = True
+            self.reset_stability()
+        self.last_switch_ms = (time.perf_counter() - start) * 1000
+        return spec
+
+    # === Text-to-Speech ===
+    def speak(self, text, priority=SIGN):
+        self.speaker.speak(text, priority)
+
+    def repeat_last(self):
+        self.speaker.repeat_last()
+
+    def set_voice(self, index):
+        self.speaker.set_voice(index)
+
+    # === Stability check ===
+    def reset_stability(self):
+        self.previous_prediction = None
+        self.prediction_count = 0
+        self.confirmed_prediction = None
+
+    def go_idle(self):
+        # Nobody is signing: drop the half-filled window so a later sign starts clean
+        with self.lock:
+            self.landmark_queue.clear()
+            self.reset_stability()
+        self._last_results = None
+        if self.roi is not None:
+            self.roi.reset()
+
+    # === Landmark Extraction ===
+    @property
+    def hands(self):
+        # Created on first use: a session fed precomputed landmarks never needs one
+        if self._hands is None:
+            self._hands = create_tracker(self.model_complexity, self.max_num_hands)
+        return self._hands
+
+    @hands.setter
+    def hands(self, tracker):
+        # A tracker built (and warmed up) elsewhere for this mode, see sayable/startup.py
+        if self._hands is not None and self._hands is not tracker:
+            self._hands.close()
+        self._hands = tracker
+        self._retrack = False
+
+    def retrack(self):
+        """Rebuild the tracker for max_num_hands; called on the thread that runs it."""
+        self._retrack = False
+        if self._hands is not None:
+            self._hands.close()
+            self._hands = None  # rebuilt on first use
+        # Frames tracked with one hand would stand in for two-hand frames
+        with self.lock:
+            self.landmark_queue.clear()
+        self._last_results = None
+        if self.roi is not None:
+            self.roi.reset()
+
+    def detect(self, frame):
+        """hands.process() on a Frame or a mirrored BGR array."""
+        image = as_frame(frame).rgb  # shared with the preview when it is a pipeline Frame
+        if self.input_scale < 1.0:
+            # Landmarks are normalized, so a smaller input needs no mapping back
+            image = cv2.resize(image, None, fx=self.input_scale, fy=self.input_scale,
+                               interpolation=cv2.INTER_AREA)
+        if self.roi is not None:
+            return self.roi.process(self.hands, image)
+        return self.hands.process(image)
+
+    def track(self, frame):
+        # Between strided detections the previous frame's hands stand in, so the
+        # window and stability counters keep advancing at the frame rate
+        if self.governor is not None and self._last_results is not None and self.governor.skip_detection():
+            return self._last_results
+        self._last_results = self.detect(frame)
+        return self._last_results
+
+    # === Adaptive quality ===
+    def apply_quality(self, level):
+        if level.model_complexity != self.model_complexity:
+            self.model_complexity = level.model_complexity
+            if self._hands is not None:
+                self._hands.close()
+                self._hands = None  # rebuilt with the new model on the next frame
+        self.input_scale = level.input_scale
+        self._last_results = None
+        if self.roi is not None:
+            self.roi.reset()  # its box is in pixels of the old input size
+
+    def observe_quality(self, detect_ms, classify_ms):
+        level = self.governor.observe(detect_ms, classify_ms, self.spec.target_fps)
+        if level is None:
+            return
+        self.apply_quality(level)
+        stats = self.governor.stats()
+        print(f"⚙️ {getattr(self, 'name', self.spec.key)}: quality level {stats['level']} ({level.name}) "
+              f"after detect {stats['detect_ms']:.1f} ms + classify {stats['classify_ms']:.1f} ms "
+              f"per frame on a {stats['budget_ms']:.0f} ms budget")
+
+    def landmarks_from_results(self, results):
+        return self.features.two_hands(results)  # (84,), reused buffer
+
+    def extract_landmarks_from_frame(self, frame):
+        return self.landmarks_from_results(self.detect(frame))
+
+    # === Inference ===
+    def process_frame(self, frame):
+        """Run one Frame (or already flipped BGR array) through the active mode."""
+        frame = as_frame(frame)
+        if self._retrack:
+            self.retrack()
+        if self.gate is not None:
+            was_idle = self.gate.idle
+            run = self.gate.should_detect(frame.bgr)
+            if self.gate.idle and not was_idle:
+                self.go_idle()
+            if not run:
+                return None
+
+        start = time.perf_counter()
+        results = self.track(frame)
+        detected = time.perf_counter()
+        if self.gate is not None:
+            if results.multi_hand_landmarks:
+                self.gate.hands_seen()
+            elif self.gate.idle:
+                return None  # idle probe: still nobody there
+        with self.lock:
+            self.landmark_queue.append(self.landmarks_from_results(results))
+            if self.spec.kind == STATIC:
+                prediction = self.predict_from_results(results)
+            else:
+                prediction = self.predict_from_sequence()
+        if self.governor is not None:
+            self.observe_quality((detected - start) * 1000, (time.perf_counter() - detected) * 1000)
+        return prediction
+
+    def predictions(self, source):
+        """(timestamp, prediction) for every frame of a source, without a GUI.
+
+        Frames are mirrored like the live preview. For files and arrays the
+        timestamp is frame index / fps, so a replay is fully deterministic.
+        """
+        source = open_source(source, realtime=False)
+        pool = FramePool()
+        try:
+            for frame in source:
+                yield source.timestamp, self.process_frame(pool.mirror(frame))
+        finally:
+            source.release()
+
+    def predict_and_speak_from_frame(self, frame):
+        results = self.detect(frame)
+        with self.lock:
+            self.landmark_queue.append(self.landmarks_from_results(results))
+            return self.predict_from_results(results)
+
+    def predict_from_results(self, results):
+        data_aux = self.features.single_hand(results)
+        if data_aux is None:
+            self.reset_stability()
+            return None
+        return self.confirm_static(self.classify_static(data_aux))
+
+    def classify_static(self, data_aux):
+        # argmax of predict_proba is exactly what predict() returns, and keeps the confidence
+        try:
+            proba = self.model.predict_proba(data_aux.reshape(1, -1))[0]
+            index = np.argmax(proba)
+            self.last_confidence = float(proba[index])
+            return self.model.classes_[index]
+        except AttributeError:
+            self.last_confidence = 1.0
+            return self.model.predict(data_aux.reshape(1, -1))[0]
+
+    def confirm_static(self, predicted_character):
+        if predicted_character == self.previous_prediction:
+            self.prediction_count += 1
+        else:
+            self.prediction_count = 1
+            self.previous_prediction = predicted_character
+
+        if self.prediction_count == self.spec.required_consistency:
+            if self.confirmed_prediction != predicted_character:
+                self.confirmed_prediction = predicted_character
+                self.confirmations += 1
+                self.speak(self.confirmed_prediction)
+
+        return self.confirmed_prediction  # For GUI display
+
+    def predict_from_sequence(self):
+        if len(self.landmark_queue) < self.spec.sequence_length:
+            return None
+
+        # Running mean of the ring buffer, same values as np.mean over the window
+        prediction, max_confidence = self.classify_sequence(self.landmark_queue.mean())
+        return self.confirm_sequence(prediction, max_confidence)
+
+    def classify_sequence(self, feature_vector):
+        try:
+            proba = self.model.predict_proba(feature_vector)[0]
+            max_confidence = np.max(proba)
+            prediction = self.model.classes_[np.argmax(proba)]
+        except AttributeError:
+            # fallback if model doesn’t support predict_proba
+            prediction = self.model.predict(feature_vector)[0]
+            max_confidence = 1.0
+        self.last_confidence = float(max_confidence)
+
+        if self.verbose:
+            print(f"🧠 Predicted: {prediction} | 🔢 Confidence: {max_confidence:.2f}")
+        return prediction, max_confidence
+
+    def confirm_sequence(self, prediction, max_confidence):
+        # Ignore low-confidence predictions
+        if max_confidence < self.spec.confidence_threshold:
+            return None
+
+        # Stability logic
+        if prediction == self.previous_prediction:
+            self.prediction_count += 1
+        else:
+            self.prediction_count = 1
+            self.previous_prediction = prediction
+
+        if self.prediction_count >= self.spec.required_consistency:
+            if self.confirmed_prediction != prediction:
+                self.confirmed_prediction = prediction
+                self.confirmations += 1
+                self.speak(self.confirmed_prediction)
+            return self.confirmed_prediction
+
+        return None
+
+    def close(self):
+        if self._hands is not None:
+            self._hands.close()
+            self._hands = None
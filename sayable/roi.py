@@ -0,0 +1,127 @@
+# sayable/roi.py
+#
+# Hand region-of-interest tracking. At 720p/1080p most of what hands.process is
+# given is background: the copy into the MediaPipe graph and its own crops and
+# resizes all scale with the full frame. HandRoi instead hands
+# MediaPipe a crop around where the hands were on the previous frame (plus a
+# margin, downsized to at most max_side pixels) and maps the landmarks back, so
+# everything downstream still sees full-frame normalized coordinates.
+#
+# It falls back to the full frame whenever the crop loses the hands (re-running
+# that same frame, so no detection is missed), and every refresh_every frames so
+# a second hand entering outside the crop is still picked up.
+#
+# The tracker is in tracking mode: it carries each hand over from the previous
+# input. So the crop stays anchored while the hands are well inside it. It moves
+# only when they come near its edge or it is twice the size they need. Every
+# time the input changes (a new crop, crop to full frame, or back) the tracker
+# is reset, so it never follows a hand by its position in a different image.
+
+import cv2
+
+
+class HandRoi:
+    def __init__(self, margin=0.5, max_side=320, refresh_every=15, max_fraction=0.8):
+        self.margin = margin              # added on each side, relative to the hand box size
+        self.max_side = max_side          # crops are downsized to at most this many pixels
+        self.refresh_every = refresh_every
+        self.max_fraction = max_fraction  # a crop this close to the frame size is not worth it
+        self.box = None                   # (x0, y0, x1, y1) in full-frame pixels, or None
+        self._anchor = None               # what the tracker last saw: a box, or None for the full frame
+
+        self.roi_frames = 0
+        self.full_frames = 0
+        self.fallbacks = 0
+        self.resets = 0
+        self._since_full = 0
+
+    def reset(self):
+        self.box = None
+
+    def process(self, hands, frame):
+        """hands.process() on an RGB frame, through the ROI when there is one."""
+        height, width = frame.shape[:2]
+        if self.box is not None and self._since_full < self.refresh_every:
+            x0, y0, x1, y1 = self.box
+            self._feed(hands, self.box)
+            crop = frame[y0:y1, x0:x1]
+            scale = self.max_side / max(x1 - x0, y1 - y0)
+            if scale < 1.0:
+                crop = cv2.resize(crop, None, fx=scale, fy=scale, interpolation=cv2.INTER_AREA)
+            results = hands.process(crop)
+            if results.multi_hand_landmarks:
+                to_full_frame(results, x0 / width, y0 / height, (x1 - x0) / width, (y1 - y0) / height)
+                self.roi_frames += 1
+                self._since_full += 1
+                self.box = self.keep_or_move(results, width, height)
+                return results
+            # Lost the hands inside the crop: look at the whole frame again
+            self.fallbacks += 1
+
+        self._feed(hands, None)
+        results = hands.process(frame)
+        self.full_frames += 1
+        self._since_full = 0
+        self.box = self.box_from(results, width, height)
+        return results
+
+    def _feed(self, hands, box):
+        # A tracker following hands in one image must not carry them into another
+        if box != self._anchor:
+            hands.reset()
+            self.resets += 1
+            self._anchor = box
+
+    def keep_or_move(self, results, width, height):
+        """The current box while it still fits the hands comfortably, else a new one."""
+        x_min, y_min, x_max, y_max = hand_extent(results, width, height)
+        x0, y0, x1, y1 = self.box
+        inset = (x1 - x0) * self.margin / (1 + 2 * self.margin) / 2   # half the margin
+        needed = max(x_max - x_min, y_max - y_min) * (1 + 2 * self.margin)
+        inside = x_min - x0 >= inset and y_min - y0 >= inset and x1 - x_max >= inset and y1 - y_max >= inset
+        if inside and 2 * needed > x1 - x0:
+            return self.box
+        return self.box_from(results, width, height)
+
+    def box_from(self, results, width, height):
+        """Square pixel box around every detected landmark plus margin, or None."""
+        if not results.multi_hand_landmarks:
+            return None
+        x_min, y_min, x_max, y_max = hand_extent(results, width, height)
+
+        side = max(x_max - x_min, y_max - y_min) * (1 + 2 * self.margin)
+        if side >= self.max_fraction * min(width, height):
+            return None
+        side = max(int(side), 32)
+        # Centre on the hands, then slide (not shrink) the box back inside the frame
+        x0 = int((x_min + x_max) / 2 - side / 2)
+        y0 = int((y_min + y_max) / 2 - side / 2)
+        x0 = min(max(x0, 0), width - side)
+        y0 = min(max(y0, 0), height - side)
+        return x0, y0, x0 + side, y0 + side
+
+    def stats(self):
+        total = self.roi_frames + self.full_frames
+        return {
+            "roi_frames": self.roi_frames,
+            "full_frames": self.full_frames,
+            "fallbacks": self.fallbacks,
+            "resets": self.resets,
+            "roi_share": self.roi_frames / total if total else 0.0,
+        }
+
+
+def hand_extent(results, width, height):
+    """(x_min, y_min, x_max, y_max) of every detected landmark, in pixels."""
+    xs = [lm.x for hand in results.multi_hand_landmarks for lm in hand.landmark]
+    ys = [lm.y for hand in results.multi_hand_landmarks for lm in hand.landmark]
+    return min(xs) * width, min(ys) * height, max(xs) * width, max(ys) * height
+
+
+def to_full_frame(results, offset_x, offset_y, scale_x, scale_y):
+    """Rewrite crop-normalized landmarks in place as full-frame normalized ones."""
+    for hand in results.multi_hand_landmarks:
+        for lm in hand.landmark:
+            lm.x = offset_x + lm.x * scale_x
+            lm.y = offset_y + lm.y * scale_y
+            lm.z = lm.z * scale_x  # MediaPipe scales z like x
@@ -0,0 +1,35 @@
+# sayable/runtime.py
+#
+# The long-lived part of SayAble: one Recognizer session (Hands tracker, window,
+# stability state), one TTS engine and one frame source (the webcam unless told
+# otherwise), with every mode's classifier loaded once. Switching modes only swaps
+# the classifier and its stability settings, so it costs a dictionary lookup
+# instead of a fresh interpreter.
+
+from sayable.recognizer import Recognizer
+from sayable.sources import open_source
+
+
+class SharedRuntime(Recognizer):
+    def __init__(self, mode="alphabet", source=0, speaker=None, verbose=True, models=None, roi=False,
+                 idle_after=0, adaptive=False, target_fps=None):
+        super().__init__(mode, models=models, speaker=speaker, verbose=verbose, roi=roi, idle_after=idle_after,
+                         adaptive=adaptive, target_fps=target_fps)
+        # Camera index, video/image path, folder or FrameSource (see sayable/sources.py)
+        self.source = source
+        self.name = getattr(source, "name", f"camera:{source}" if isinstance(source, int) else str(source))
+        self.cap = None
+
+    def preload_models(self):
+        return self.models.preload()
+
+    # === Frame source ===
+    def open_source(self):
+        if self.cap is None or not self.cap.isOpened():
+            self.cap = open_source(self.source)
+        return self.cap
+
+    def release(self):
+        if self.cap is not None:
+            self.cap.release()
+            self.cap = None
@@ -0,0 +1,335 @@
+# sayable/server.py
+#
+# One recognition host for many thin clients. Each WebSocket connection is its own
+# Recognizer session (sliding window, stability counters), so it behaves like its
+# own copy of the GUI's predict_from_sequence / predict_and_speak_from_frame
+# (without speaking). Clients connect to ws://host:port/<mode> and send either
+#
+#   - precomputed landmarks: binary float32 (84 values for word modes, 42 for
+#     alphabet/number) or text {"landmarks": [...]}
+#   - camera frames: any other binary message, as JPEG/PNG bytes; the server runs
+#     MediaPipe on them with a tracker owned by that session
+#   - {"reset": true} to clear the window and stability state
+#
+# and get one JSON reply per message:
+#   {"seq": 12, "label": "help", "confidence": 0.81, "prediction": "help"}
+# where label/confidence are the raw classifier output and prediction is what the
+# GUI would show (null until the stability rule confirms a sign).
+#
+# Classifier calls from all sessions of a mode go through a MicroBatcher, which
+# evaluates whatever rows are waiting as one predict_proba call. Each session
+# reads at most --max-pending messages ahead; past that the server stops reading
+# its socket, so a client that sends faster than it is served is slowed down by
+# TCP instead of growing a queue. GET /stats returns the counters as JSON.
+#
+#   python -m sayable.server --port 8765
+
+import argparse
+import asyncio
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import cv2
+import numpy as np
+
+from sayable.features import HAND_SIZE, TWO_HAND_SIZE
+from sayable.modes import MODES, STATIC
+from sayable.recognizer import Recognizer, default_models
+from sayable.speech import SilentSpeaker
+from sayable.websocket import ProtocolError, accept, read_http_head
+
+
+class MicroBatcher:
+    """Collects predict_proba rows from concurrent sessions into one forest evaluation."""
+
+    def __init__(self, model, max_batch=64, max_wait=0.0):
+        self.model = model
+        self.max_batch = max_batch
+        self.max_wait = max_wait
+        self.batches = 0
+        self.rows = 0
+        self._queue = asyncio.Queue()
+        # One batch in flight per model; new rows pile up meanwhile and form the next
+        # one, so batches grow with load without delaying a lone client
+        self._executor = ThreadPoolExecutor(1, thread_name_prefix="sayable-batch")
+        self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def predict_proba(self, row):
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((row, future))
+        return await future
+
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._queue.get()]
+            deadline = loop.time() + self.max_wait
+            while len(batch) < self.max_batch:
+                if not self._queue.empty():
+                    batch.append(self._queue.get_nowait())
+                    continue
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+
+            X = np.vstack([row for row, _ in batch])
+            try:
+                proba = await loop.run_in_executor(self._executor, self.model.predict_proba, X)
+            except Exception as e:
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+                continue
+            self.batches += 1
+            self.rows += len(batch)
+            for row_proba, (_, future) in zip(proba, batch):
+                if not future.done():
+                    future.set_result(row_proba)
+
+    def close(self):
+        self._task.cancel()
+        self._executor.shutdown(wait=False)
+
+
+class ClientSession(Recognizer):
+    """One connection: a Recognizer with its own window, stability state and
+    (only if it uploads frames) Hands tracker. Classification goes through the
+    server's MicroBatcher instead of the session's own model call."""
+
+    def __init__(self, key, models):
+        super().__init__(key, models=models, speaker=SilentSpeaker(), verbose=False)
+        self.static = self.spec.kind == STATIC
+        self.n_features = HAND_SIZE if self.static else TWO_HAND_SIZE
+        self.messages = 0
+
+    def landmarks_from_image(self, data):
+        """Landmark features of an encoded image (runs on a worker thread), or None."""
+        if not data:
+            raise ValueError("empty image")
+        try:
+            frame = cv2.imdecode(np.frombuffer(data, np.uint8), cv2.IMREAD_COLOR)
+        except cv2.error:
+            frame = None  # bytes OpenCV refuses outright
+        if frame is None:
+            raise ValueError("could not decode image")
+        results = self.detect(cv2.flip(frame, 1, dst=frame))  # decoded just for us: mirror in place
+        if self.static:
+            features = self.features.single_hand(results)
+            return None if features is None else features.copy()
+        return self.landmarks_from_results(results).copy()
+
+
+class RecognitionServer:
+    def __init__(self, max_batch=64, max_wait=0.0, max_pending=8, frame_workers=4):
+        self.max_batch = max_batch
+        self.max_wait = max_wait
+        self.max_pending = max_pending
+        self.models = default_models
+        self.batchers = {}
+        self.frame_executor = ThreadPoolExecutor(frame_workers, thread_name_prefix="sayable-frames")
+
+        self.started = time.time()
+        self.sessions_active = 0
+        self.sessions_total = 0
+        self.messages = 0
+        self.frames_decoded = 0
+        self.backpressure_waits = 0
+        self.errors = 0
+
+    def batcher(self, key):
+        if key not in self.batchers:
+            model, _ = self.models.get(key)
+            self.batchers[key] = MicroBatcher(model, self.max_batch, self.max_wait)
+        return self.batchers[key]
+
+    def stats(self):
+        rows = sum(b.rows for b in self.batchers.values())
+        batches = sum(b.batches for b in self.batchers.values())
+        return {
+            "uptime_s": round(time.time() - self.started, 1),
+            "sessions_active": self.sessions_active,
+            "sessions_total": self.sessions_total,
+            "messages": self.messages,
+            "frames_decoded": self.frames_decoded,
+            "batches": batches,
+            "rows": rows,
+            "mean_batch": round(rows / batches, 2) if batches else 0.0,
+            "backpressure_waits": self.backpressure_waits,
+            "errors": self.errors,
+        }
+
+    # === Connections ===
+    async def handle(self, reader, writer):
+        try:
+            request, headers = await read_http_head(reader)
+            method, path = request.split()[:2]
+        except (asyncio.IncompleteReadError, asyncio.LimitOverrunError, ValueError, ConnectionError):
+            writer.close()
+            return
+
+        key = path.strip("/")
+        if headers.get("upgrade", "").lower() == "websocket" and key in MODES:
+            try:
+                ws = await accept(reader, writer, headers)
+            except ProtocolError:
+                await self._respond(writer, "400 Bad Request", {"error": "bad websocket handshake"})
+                return
+            await self.serve_session(ws, key)
+        elif method == "GET" and key == "stats":
+            await self._respond(writer, "200 OK", self.stats())
+        else:
+            await self._respond(writer, "404 Not Found", {"error": f"use /stats or a websocket on /<mode> ({', '.join(MODES)})"})
+
+    async def _respond(self, writer, status, body):
+        payload = json.dumps(body).encode()
+        writer.write(
+            f"HTTP/1.1 {status}\r\nContent-Type: application/json\r\n"
+            f"Content-Length: {len(payload)}\r\nConnection: close\r\n\r\n".encode() + payload
+        )
+        try:
+            await writer.drain()
+        finally:
+            writer.close()
+
+    async def serve_session(self, ws, key):
+        session = ClientSession(key, self.models)
+        batcher = self.batcher(key)
+        pending = asyncio.Queue(maxsize=self.max_pending)
+        worker = asyncio.get_running_loop().create_task(self._work(ws, session, batcher, pending))
+        self.sessions_active += 1
+        self.sessions_total += 1
+        try:
+            while not worker.done():
+                message = await ws.recv()
+                if message is None:
+                    break
+                if pending.full():
+                    self.backpressure_waits += 1
+                # Blocks (and so stops reading the socket) while this client is too far ahead
+                await pending.put(message)
+        except (ProtocolError, ConnectionError):
+            self.errors += 1
+        finally:
+            if not worker.done():
+                await pending.put(None)
+                await asyncio.gather(worker, return_exceptions=True)
+            self.sessions_active -= 1
+            session.close()
+            await ws.close()
+
+    async def _work(self, ws, session, batcher, pending):
+        loop = asyncio.get_running_loop()
+        while True:
+            message = await pending.get()
+            if message is None:
+                return
+            try:
+                reply = await self.handle_message(loop, session, batcher, message)
+            except (ValueError, KeyError, TypeError, json.JSONDecodeError) as e:
+                self.errors += 1
+                reply = {"seq": session.messages, "error": str(e)}
+            try:
+                await ws.send(json.dumps(reply))
+            except ConnectionError:
+                return
+
+    async def handle_message(self, loop, session, batcher, message):
+        session.messages += 1
+        self.messages += 1
+        reply = {"seq": session.messages, "label": None, "confidence": None, "prediction": None}
+
+        if isinstance(message, str):
+            request = json.loads(message)
+            if not isinstance(request, dict):
+                raise ValueError("expected a JSON object")
+            if request.get("reset"):
+                session.landmark_queue.clear()
+                session.reset_stability()
+                return reply
+            features = np.asarray(request["landmarks"], dtype=np.float32)
+        elif len(message) == session.n_features * 4:
+            features = np.frombuffer(message, dtype=np.float32)
+        else:
+            features = await loop.run_in_executor(self.frame_executor, session.landmarks_from_image, message)
+            self.frames_decoded += 1
+
+        if session.static:
+            if features is None:
+                session.reset_stability()
+                return reply
+            row = features.reshape(1, -1)
+        else:
+            if features.shape != (TWO_HAND_SIZE,):
+                raise ValueError(f"expected {TWO_HAND_SIZE} landmark values, got {features.size}")
+            session.landmark_queue.append(features)
+            if len(session.landmark_queue) < session.spec.sequence_length:
+                return reply
+            row = session.landmark_queue.mean().copy()  # mean() reuses its buffer
+
+        if row.shape[1] != session.n_features:
+            raise ValueError(f"expected {session.n_features} landmark values, got {row.shape[1]}")
+        proba = await batcher.predict_proba(row)
+        index = int(np.argmax(proba))
+        label = batcher.model.classes_[index]
+        confidence = float(proba[index])
+
+        if session.static:
+            prediction = session.confirm_static(label)
+        else:
+            prediction = session.confirm_sequence(label, confidence)
+
+        reply.update(label=str(label), confidence=round(confidence, 4),
+                     prediction=None if prediction is None else str(prediction))
+        return reply
+
+    def close(self):
+        for batcher in self.batchers.values():
+            batcher.close()
+        self.frame_executor.shutdown(wait=False)
+
+
+async def serve(host="127.0.0.1", port=8765, ready=None, **options):
+    """Run a RecognitionServer until cancelled; `ready` (an asyncio.Event) is set once listening."""
+    server = RecognitionServer(**options)
+    for key in MODES:
+        server.batcher(key)  # load every model before the first client arrives
+    listener = await asyncio.start_server(server.handle, host, port, backlog=1024)
+    if ready is not None:
+        ready.set()
+    try:
+        async with listener:
+            await listener.serve_forever()
+    finally:
+        server.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="SayAble recognition server (WebSocket + /stats)")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--max-batch", type=int, default=64, help="most rows per predict_proba call")
+    parser.add_argument("--max-wait-ms", type=float, default=0.0,
+                        help="extra time a batch waits for more rows before it is evaluated (default: none)")
+    parser.add_argument("--max-pending", type=int, default=8,
+                        help="messages read ahead per client before its socket is no longer read")
+    parser.add_argument("--frame-workers", type=int, default=4, help="threads running MediaPipe on uploaded frames")
+    args = parser.parse_args()
+
+    print(f"🌐 SayAble server on ws://{args.host}:{args.port}/<mode>  (stats: http://{args.host}:{args.port}/stats)")
+    try:
+        asyncio.run(serve(
+            args.host, args.port,
+            max_batch=args.max_batch, max_wait=args.max_wait_ms / 1000,
+            max_pending=args.max_pending, frame_workers=args.frame_workers,
+        ))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,237 @@
+# sayable/sources.py
+#
+# Where frames come from. Every source has the same read() -> (ret, frame) /
+# isOpened() / release() surface as cv2.VideoCapture, so the GUI, the capture
+# thread and the benchmarks take any of them in place of the webcam:
+#
+#   CameraSource       live webcam (the old hard-coded cv2.VideoCapture(0))
+#   VideoFileSource    a recorded clip, paced at its own fps or as fast as possible
+#   FolderSource       every image/clip under a folder, in sorted order
+#   ArraySource        frames already in memory (tests, soak runs, synthetic input)
+#
+# Non-camera sources also expose a deterministic `timestamp` (frame index / fps)
+# for the last frame read, so timing-sensitive logic can be replayed exactly.
+
+import os
+import time
+
+import cv2
+
+VIDEO_EXTENSIONS = ('.avi', '.mp4', '.mov', '.mkv')
+IMAGE_EXTENSIONS = ('.jpg', '.jpeg', '.png', '.bmp')
+
+
+class FrameSource:
+    """Base class: a cv2.VideoCapture look-alike."""
+
+    name = "source"
+    fps = 30.0
+
+    def __init__(self):
+        self.frame_index = -1
+        self.timestamp = 0.0
+        self.exhausted = False   # True once a finite source has nothing left
+
+    def isOpened(self):
+        return True
+
+    def read(self):
+        raise NotImplementedError
+
+    def release(self):
+        pass
+
+    def __iter__(self):
+        while True:
+            ret, frame = self.read()
+            if not ret:
+                if self.exhausted:
+                    return
+                continue
+            yield frame
+
+    def _advance(self):
+        self.frame_index += 1
+        self.timestamp = self.frame_index / self.fps
+
+
+class CameraSource(FrameSource):
+    def __init__(self, index=0):
+        super().__init__()
+        self.name = f"camera:{index}"
+        self.cap = cv2.VideoCapture(index)
+        self.fps = self.cap.get(cv2.CAP_PROP_FPS) or 30.0
+
+    def isOpened(self):
+        return self.cap.isOpened()
+
+    def read(self):
+        ret, frame = self.cap.read()
+        if ret:
+            self.frame_index += 1
+            self.timestamp = time.monotonic()
+        return ret, frame
+
+    def release(self):
+        self.cap.release()
+
+
+class _PacedSource(FrameSource):
+    """Finite source that can be replayed at its nominal fps or as fast as possible."""
+
+    def __init__(self, realtime=True, loop=False):
+        super().__init__()
+        self.realtime = realtime
+        self.loop = loop
+        self._start = None
+
+    def _pace(self):
+        if not self.realtime:
+            return
+        if self._start is None:
+            self._start = time.perf_counter()
+        delay = self._start + self.frame_index / self.fps - time.perf_counter()
+        if delay > 0:
+            time.sleep(delay)
+
+
+class VideoFileSource(_PacedSource):
+    def __init__(self, path, realtime=True, loop=False):
+        super().__init__(realtime, loop)
+        self.name = path
+        self.path = path
+        self.cap = cv2.VideoCapture(path)
+        self.fps = self.cap.get(cv2.CAP_PROP_FPS) or 30.0
+
+    def isOpened(self):
+        return self.cap.isOpened()
+
+    def read(self):
+        ret, frame = self.cap.read()
+        if not ret and self.loop and self.frame_index >= 0:
+            self.cap.set(cv2.CAP_PROP_POS_FRAMES, 0)
+            ret, frame = self.cap.read()
+        if not ret:
+            self.exhausted = True
+            return False, None
+        self._advance()
+        self._pace()
+        return True, frame
+
+    def release(self):
+        self.cap.release()
+
+
+class ArraySource(_PacedSource):
+    def __init__(self, frames, fps=30.0, realtime=False, loop=False, name="array"):
+        super().__init__(realtime, loop)
+        self.name = name
+        self.frames = frames
+        self.fps = fps
+        self._position = 0
+
+    def read(self):
+        if self._position >= len(self.frames):
+            if not self.loop or len(self.frames) == 0:
+                self.exhausted = True
+                return False, None
+            self._position = 0
+        frame = self.frames[self._position]
+        self._position += 1
+        self._advance()
+        self._pace()
+        return True, frame
+
+
+class FolderSource(_PacedSource):
+    """Images and clips under a folder (recursively, sorted), read one after another."""
+
+    def __init__(self, path, fps=30.0, realtime=False, loop=False):
+        super().__init__(realtime, loop)
+        self.name = path
+        self.fps = fps
+        self.files = []
+        for folder, dirs, files in os.walk(path):
+            dirs.sort()
+            for filename in sorted(files):
+                if filename.lower().endswith(VIDEO_EXTENSIONS + IMAGE_EXTENSIONS):
+                    self.files.append(os.path.join(folder, filename))
+        self._file_index = 0
+        self._clip = None
+        self._pass_frames = 0   # frames read since the folder was last started over
+
+    def isOpened(self):
+        return bool(self.files)
+
+    def read(self):
+        while True:
+            frame = self._next_frame()
+            if frame is not None:
+                self._advance()
+                self._pace()
+                return True, frame
+            if self.exhausted:
+                return False, None
+
+    def _next_frame(self):
+        if self._clip is not None:
+            ret, frame = self._clip.read()
+            if ret:
+                self._pass_frames += 1
+                return frame
+            self._clip.release()
+            self._clip = None
+
+        if self._file_index >= len(self.files):
+            if not self.loop or not self.files:
+                self.exhausted = True
+                return None
+            if not self._pass_frames:
+                # Looping over a folder where nothing is readable would spin forever
+                raise OSError(f"Cannot read any image or clip in {self.name}")
+            self._file_index = 0
+            self._pass_frames = 0
+
+        path = self.files[self._file_index]
+        self._file_index += 1
+        if path.lower().endswith(IMAGE_EXTENSIONS):
+            image = cv2.imread(path)  # None for unreadable images -> try the next file
+            if image is not None:
+                self._pass_frames += 1
+            return image
+        self._clip = cv2.VideoCapture(path)
+        return None
+
+    def release(self):
+        if self._clip is not None:
+            self._clip.release()
+            self._clip = None
+
+
+def open_source(source=0, realtime=True, loop=False):
+    """Build a frame source from a camera index, a path, or a list/array of frames.
+
+    "0", "1", ... and "camera:1" open webcams; a video file or image replays it;
+    a folder replays every image/clip in it.
+    """
+    if isinstance(source, FrameSource):
+        return source
+    if isinstance(source, str):
+        if source.startswith("camera:"):
+            source = source.split(":", 1)[1]
+        if source.isdigit():
+            source = int(source)
+    if isinstance(source, int):
+        return CameraSource(source)
+    if isinstance(source, str):
+        if os.path.isdir(source):
+            return FolderSource(source, realtime=realtime, loop=loop)
+        if not os.path.exists(source):
+            raise FileNotFoundError(f"Frame source not found: {source}")
+        if source.lower().endswith(IMAGE_EXTENSIONS):
+            image = cv2.imread(source)
+            if image is None:
+                raise OSError(f"Cannot read image: {source}")
+            return ArraySource([image], realtime=realtime, loop=loop, name=source)
+        return VideoFileSource(source, realtime=realtime, loop=loop)
+    return ArraySource(source, realtime=realtime, loop=loop)
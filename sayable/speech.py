@@ -0,0 +1,297 @@
+# sayable/speech.py
+#
+# One pyttsx3 engine per process, owned by one long-lived worker thread. Every mode
+# used to call pyttsx3.init() on import, and later every utterance got a thread of
+# its own; now speak() only puts the text on a small priority queue and returns.
+# The worker drives the engine's own event loop (startLoop(False) + iterate()), so
+# it can also stop it mid-sentence:
+#
+#   coalescing  text already waiting is not queued again, and neither is a sign
+#               that started within coalesce_window seconds (two cameras
+#               confirming the same sign)
+#   barge-in    a newly confirmed sign cuts off speech that was queued more than
+#               stale_after seconds ago: old news is not worth waiting for
+#   speed-up    the speech rate goes up with the number of utterances waiting
+#   bounded     at most max_pending utterances wait; when full, the oldest
+#               least urgent one is dropped
+#
+# With a VoiceCache (see sayable/voice_cache.py) text that was rendered ahead of
+# time is played from its WAV clip instead, which skips synthesis altogether; the
+# engine only speaks text that has no clip.
+#
+# stats() reports queue depth and the delay from speak() to the audio starting.
+
+import heapq
+import itertools
+import statistics
+import threading
+import time
+from collections import deque
+
+from sayable.modes import format_prediction
+
+# Priorities: lower is more urgent
+SIGN = 0       # a newly confirmed sign
+REPEAT = 1     # "Repeat Last Phrase" and other replays
+
+
+class Utterance:
+    __slots__ = ("text", "priority", "name", "queued_at")
+
+    def __init__(self, text, priority, name):
+        self.text = text
+        self.priority = priority
+        self.name = name              # matches the engine's callbacks to this utterance
+        self.queued_at = time.perf_counter()
+
+
+class Speaker:
+    def __init__(self, rate=150, volume=1.0, voice_index=0, max_pending=8, coalesce_window=1.5,
+                 stale_after=1.0, speedup=0.15, max_rate=240, engine_factory=None, cache=None, player=None):
+        self.rate = rate
+        self.volume = volume
+        self.max_pending = max_pending
+        self.coalesce_window = coalesce_window
+        self.stale_after = stale_after
+        self.speedup = speedup        # extra rate per waiting utterance, as a share of rate
+        self.max_rate = max_rate
+        self._engine_factory = engine_factory
+        self.cache = cache
+        if cache is not None and player is None:
+            from sayable.voice_cache import ClipPlayer
+            player = ClipPlayer(cache)
+            if not player.available:
+                print("⚠️ No audio player for cached clips (install simpleaudio); speaking everything live")
+                self.cache = None
+        self.player = player
+        self.current_voice_index = voice_index  # 0 for male (typically), 1 for female
+        self.voices = []
+
+        self._queue = []              # heap of (priority, sequence, Utterance)
+        self._sequence = itertools.count()
+        self._cond = threading.Condition()
+        self._closed = False
+        self._ready = threading.Event()
+        self._error = None
+        self._current = None          # the Utterance being spoken
+        self._interrupt = False
+        self._playback = None         # handle of the cached clip being played, if any
+        self._last_sign = None         # what repeat_last() says, in display form
+        self._last_started = {}       # text -> perf_counter when it last started
+
+        self.spoken = 0
+        self.coalesced = 0
+        self.dropped = 0
+        self.interrupted = 0
+        self.cached = 0               # utterances played from a pre-synthesized clip
+        self.max_depth = 0
+        self.delays = deque(maxlen=500)   # speak() -> audio start, seconds
+
+        self._thread = threading.Thread(target=self._run, name="sayable-tts", daemon=True)
+        self._thread.start()
+        # The voice list comes from the engine, which the worker creates
+        self._ready.wait(5.0)
+        if self._error is not None:
+            raise self._error
+
+    # === Called from any thread ===
+    def set_voice(self, index):
+        if 0 <= index < len(self.voices):
+            self.current_voice_index = index  # applied by the worker before the next utterance
+
+    def speak(self, text, priority=SIGN):
+        text = str(text)
+        now = time.perf_counter()
+        with self._cond:
+            if self._closed:
+                return
+            if priority == SIGN:
+                self._last_sign = text
+            recent = priority == SIGN and now - self._last_started.get(text, -1e9) < self.coalesce_window
+            if recent or any(item[2].text == text for item in self._queue):
+                self.coalesced += 1
+                return
+            if len(self._queue) >= self.max_pending:
+                # Full: the least urgent, oldest utterance makes room
+                victim = max(self._queue, key=lambda item: (item[0], -item[1]))
+                self._queue.remove(victim)
+                heapq.heapify(self._queue)
+                self.dropped += 1
+            sequence = next(self._sequence)
+            heapq.heappush(self._queue, (priority, sequence, Utterance(text, priority, str(sequence))))
+            self.max_depth = max(self.max_depth, len(self._queue))
+            current = self._current
+            if priority == SIGN and current is not None and now - current.queued_at > self.stale_after:
+                self._interrupt = True
+            self._cond.notify_all()  # drain() waits on this condition too
+
+    def repeat_last(self):
+        # Said the way the history shows it ("Thank you"), as "Repeat" always did
+        with self._cond:
+            text = self._last_sign
+        if text is not None:
+            self.speak(format_prediction(text), REPEAT)
+
+    def close(self, timeout=2.0):
+        with self._cond:
+            self._closed = True
+            self._interrupt = True
+            self._cond.notify_all()
+        self._thread.join(timeout)
+
+    def drain(self, timeout=None):
+        """Wait until the queue is empty and the last utterance has finished; False on timeout."""
+        deadline = None if timeout is None else time.perf_counter() + timeout
+        with self._cond:
+            while (self._queue or self._current is not None) and self._thread.is_alive():
+                remaining = None if deadline is None else deadline - time.perf_counter()
+                if remaining is not None and remaining <= 0:
+                    return False
+                # _on_finished() wakes this; the cap covers a worker that died
+                self._cond.wait(0.1 if remaining is None else min(remaining, 0.1))
+            return True
+
+    @property
+    def depth(self):
+        with self._cond:
+            return len(self._queue)
+
+    def stats(self):
+        with self._cond:
+            delays = sorted(self.delays)
+            depth = len(self._queue)
+        return {
+            "depth": depth,
+            "max_depth": self.max_depth,
+            "spoken": self.spoken,
+            "coalesced": self.coalesced,
+            "dropped": self.dropped,
+            "interrupted": self.interrupted,
+            "cached": self.cached,
+            "delay_p50_ms": statistics.median(delays) * 1000 if delays else 0.0,
+            "delay_p95_ms": delays[round(0.95 * (len(delays) - 1))] * 1000 if delays else 0.0,
+        }
+
+    # === TTS worker ===
+    def _create_engine(self):
+        if self._engine_factory is not None:
+            return self._engine_factory()
+        # Imported here so headless runs with a SilentSpeaker do not need pyttsx3
+        import pyttsx3
+        return pyttsx3.init()
+
+    def _run(self):
+        try:
+            engine = self._create_engine()
+            engine.setProperty('volume', self.volume)
+            self.voices = engine.getProperty('voices') or []
+        except (ImportError, RuntimeError, OSError) as e:
+            self._error = e  # raised by the constructor
+            return
+        finally:
+            self._ready.set()
+        if self.cache is not None:
+            self.cache.preload()  # clips are played from memory
+        engine.connect('started-utterance', self._on_started)
+        engine.connect('finished-utterance', self._on_finished)
+        engine.startLoop(False)
+        try:
+            while True:
+                with self._cond:
+                    if self._closed:
+                        break
+                    if self._current is None:
+                        if not self._queue:
+                            self._cond.wait()  # nothing to say: sleep until speak() or close()
+                            continue
+                        utterance = heapq.heappop(self._queue)[2]
+                        backlog = len(self._queue)
+                        self._current = utterance
+                    else:
+                        utterance = None
+                        if self._interrupt:
+                            self._interrupt = False
+                            self.interrupted += 1
+                            self._stop_current(engine)
+                            self._current = None
+                            continue
+
+                if utterance is not None:
+                    self._say(engine, utterance, backlog)
+                elif self._playback is not None and not self._playback.is_playing():
+                    self._on_finished(self._current.name, True)
+                engine.iterate()
+                with self._cond:
+                    self._cond.wait(0.005)  # speak() and close() cut this short
+        finally:
+            if self._playback is not None:
+                self._playback.stop()
+            try:
+                engine.endLoop()
+            except RuntimeError:
+                pass
+
+    def _say(self, engine, utterance, backlog):
+        voice = self.voices[self.current_voice_index].id if self.voices else None
+        # Catch up on a backlog by talking faster rather than falling further behind
+        rate = min(self.max_rate, self.rate * (1 + self.speedup * backlog))
+        if self.cache is not None:
+            path = self.cache.lookup(utterance.text, voice, rate)
+            if path is not None:
+                try:
+                    self._playback = self.player.play(path)
+                except (OSError, RuntimeError) as e:
+                    print(f"⚠️ Could not play cached clip, speaking live instead: {e}")
+                    self._playback = None
+                else:
+                    self.cached += 1
+                    self._on_started(utterance.name)
+                    return
+        if voice is not None:
+            engine.setProperty('voice', voice)
+        engine.setProperty('rate', rate)
+        engine.say(utterance.text, name=utterance.name)
+
+    def _stop_current(self, engine):
+        if self._playback is not None:
+            self._playback.stop()
+            self._playback = None
+        else:
+            engine.stop()
+
+    def _on_started(self, name):
+        now = time.perf_counter()
+        with self._cond:
+            current = self._current
+            if current is not None and current.name == name:
+                self.delays.append(now - current.queued_at)
+                self._last_started[current.text] = now
+                self.spoken += 1
+
+    def _on_finished(self, name, completed):
+        with self._cond:
+            # An interrupted utterance may report in after the next one has begun
+            if self._current is not None and self._current.name == name:
+                self._current = None
+                self._interrupt = False
+                self._playback = None
+                self._cond.notify_all()
+
+
+class SilentSpeaker:
+    """Stand-in for headless runs and benchmarks where nothing should be spoken."""
+
+    voices = []
+    current_voice_index = 0
+
+    def set_voice(self, index):
+        self.current_voice_index = index
+
+    def speak(self, text, priority=SIGN):
+        pass
+
+    def repeat_last(self):
+        pass
+
+    def close(self, timeout=None):
+        pass
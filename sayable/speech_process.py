@@ -0,0 +1,187 @@
+# sayable/speech_process.py
+#
+# Speech in a child process. pyttsx3/espeak synthesis is Python and C work that, on
+# a thread, shares the interpreter (and its GIL) with MediaPipe and the Tk loop, so
+# frame times spike whenever an utterance starts. ProcessSpeaker has the Speaker
+# interface but runs the real Speaker (queue, coalescing, voice cache and all) in a
+# spawned process at a lower CPU priority, reached over a multiprocessing Pipe:
+#
+#   app  ->  ("speak", text, priority) | ("voice", index) | ("repeat",) | ("stats",) | ("close",)
+#   app  <-  ("ready", voice ids, stats) | ("error", message) | ("stats", stats)
+#
+# Sending is a small pickle into a pipe, so speak() never waits on synthesis. A
+# watcher thread reads replies and, if the process dies, starts a new one (backing
+# off while it keeps failing) with the same voice; messages sent while it was down
+# are counted as lost.
+
+import multiprocessing
+import os
+import threading
+import time
+
+from sayable.speech import SIGN, Speaker
+
+
+def _serve(conn, options, voice_cache):
+    """Child process: one Speaker, driven by messages on conn."""
+    try:
+        os.nice(5)  # recognition wins when both want the CPU
+    except (AttributeError, OSError):
+        pass  # no nice() on Windows
+    try:
+        cache = None
+        if voice_cache:
+            from sayable.voice_cache import VoiceCache
+            cache = VoiceCache(voice_cache)
+        speaker = Speaker(cache=cache, **options)
+    except (ImportError, RuntimeError, OSError) as e:
+        conn.send(("error", f"{type(e).__name__}: {e}"))
+        return
+    conn.send(("ready", [getattr(v, "id", str(v)) for v in speaker.voices], speaker.stats()))
+    try:
+        while True:
+            message = conn.recv()
+            command = message[0]
+            if command == "speak":
+                speaker.speak(message[1], message[2])
+            elif command == "voice":
+                speaker.set_voice(message[1])
+            elif command == "repeat":
+                speaker.repeat_last()
+            elif command == "stats":
+                conn.send(("stats", speaker.stats()))
+            elif command == "close":
+                break
+    except (EOFError, OSError):
+        pass  # the app is gone
+    finally:
+        speaker.close()
+
+
+class ProcessSpeaker:
+    def __init__(self, voice_cache=None, start_timeout=10.0, max_backoff=5.0, **options):
+        self.voice_cache = voice_cache
+        self.options = options        # passed on to Speaker in the child
+        self.start_timeout = start_timeout
+        self.max_backoff = max_backoff
+        self.current_voice_index = options.get("voice_index", 0)
+        self.voices = []
+        self.restarts = 0
+        self.lost = 0                 # messages sent while the process was down
+
+        # spawn, not fork: the app has MediaPipe and Tk threads that must not be forked
+        self._context = multiprocessing.get_context("spawn")
+        self._send_lock = threading.Lock()
+        self._stats_lock = threading.Lock()
+        self._stats_ready = threading.Event()
+        self._stats = {}
+        self._conn = None
+        self._process = None
+        self._closed = False
+
+        self._start()  # the first start raises, so a broken TTS setup shows up immediately
+        self._watcher = threading.Thread(target=self._watch, name="sayable-tts-ipc", daemon=True)
+        self._watcher.start()
+
+    # === Speaker interface ===
+    def speak(self, text, priority=SIGN):
+        self._send(("speak", str(text), priority))
+
+    def set_voice(self, index):
+        if 0 <= index < len(self.voices):
+            self.current_voice_index = index
+            self._send(("voice", index))
+
+    def repeat_last(self):
+        self._send(("repeat",))
+
+    @property
+    def depth(self):
+        return self.stats()["depth"]
+
+    def stats(self, timeout=1.0):
+        """The child's Speaker.stats() plus restarts and lost messages."""
+        with self._stats_lock:
+            self._stats_ready.clear()
+            self._send(("stats",))
+            self._stats_ready.wait(timeout)  # on timeout (restarting) the last known stats are used
+            stats = dict(self._stats)
+        stats["restarts"] = self.restarts
+        stats["lost"] = self.lost
+        return stats
+
+    def close(self, timeout=2.0):
+        self._closed = True
+        self._send(("close",))
+        process = self._process
+        if process is not None:
+            process.join(timeout)
+            if process.is_alive():
+                process.terminate()
+        with self._send_lock:
+            if self._conn is not None:
+                self._conn.close()
+
+    # === Process management ===
+    def _send(self, message):
+        with self._send_lock:
+            try:
+                self._conn.send(message)
+            except (OSError, ValueError, AttributeError):
+                # Down or restarting: the watcher brings it back
+                if message[0] != "close":
+                    self.lost += 1
+
+    def _start(self):
+        conn, child_conn = self._context.Pipe()
+        process = self._context.Process(target=_serve, args=(child_conn, self.options, self.voice_cache),
+                                        name="sayable-tts", daemon=True)
+        process.start()
+        child_conn.close()
+        try:
+            if not conn.poll(self.start_timeout):
+                raise RuntimeError(f"TTS process did not start within {self.start_timeout:.0f}s")
+            message = conn.recv()
+        except (EOFError, OSError, RuntimeError) as e:
+            process.terminate()
+            conn.close()
+            raise RuntimeError(f"TTS process failed to start: {e}") from e
+        if message[0] == "error":
+            process.join()
+            conn.close()
+            raise RuntimeError(message[1])
+        _, self.voices, self._stats = message
+        with self._send_lock:
+            self._conn, self._process = conn, process
+        if self.current_voice_index:
+            self._send(("voice", self.current_voice_index))
+
+    def _watch(self):
+        while not self._closed:
+            try:
+                message = self._conn.recv()
+            except (EOFError, OSError):
+                if self._closed:
+                    return
+                self._restart()
+                continue
+            if message[0] == "stats":
+                self._stats = message[1]
+                self._stats_ready.set()
+
+    def _restart(self):
+        self._process.join(0.5)
+        print(f"⚠️ TTS process exited (code {self._process.exitcode}); restarting it")
+        with self._send_lock:
+            self._conn.close()
+        backoff = 0.5
+        while not self._closed:
+            try:
+                self._start()
+            except RuntimeError as e:
+                print(f"⚠️ TTS process restart failed: {e}; retrying in {backoff:.1f}s")
+                time.sleep(backoff)
+                backoff = min(backoff * 2, self.max_backoff)
+                continue
+            self.restarts += 1
+            return
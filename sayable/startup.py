@@ -0,0 +1,193 @@
+# sayable/startup.py
+#
+# Startup in concurrent phases. Opening a mode used to do everything one step after
+# another before any window appeared: import MediaPipe, unpickle the classifier,
+# start the TTS engine, open the camera, and build the Hands tracker on the first
+# frame. None of these depend on each other, so Startup runs them side by side on
+# threads while the GUI shows a loading screen:
+#
+#   speech    the Speaker (or ProcessSpeaker) with its engine
+#   model     the mode's classifier, plus one prediction on a blank feature vector
+#   camera    each frame source, plus the first read of a webcam (the slow one)
+#   tracker   a Hands tracker per source, plus one process() on a blank frame
+#
+# runtimes() then assembles SharedRuntimes from the parts. The warm-up runs mean the
+# first real frame pays no start-up cost. StartupTimeline records when each phase
+# ran; report() prints it once the first frame is through.
+#
+# MediaPipe and the classifiers are imported inside the phases, so importing this
+# module (and the GUI) stays cheap and the window can appear straight away.
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+from sayable.features import HAND_SIZE, TWO_HAND_SIZE
+from sayable.modes import STATIC, get_mode
+from sayable.sources import CameraSource, open_source
+from sayable.speech import Speaker
+
+
+class StartupTimeline:
+    def __init__(self, clock=time.perf_counter):
+        self.clock = clock
+        self.started_at = clock()
+        self.phases = {}   # name -> [start, end] in seconds since started_at
+        self.marks = {}    # milestone -> seconds since started_at
+        self._lock = threading.Lock()
+
+    def now(self):
+        return self.clock() - self.started_at
+
+    def begin(self, name):
+        with self._lock:
+            self.phases[name] = [self.now(), None]
+
+    def end(self, name):
+        with self._lock:
+            self.phases[name][1] = self.now()
+
+    def mark(self, name):
+        with self._lock:
+            self.marks.setdefault(name, self.now())
+
+    def duration_ms(self, name):
+        start, end = self.phases.get(name, (None, None))
+        return (end - start) * 1000 if end is not None else None
+
+    def report(self, width=40):
+        with self._lock:
+            phases = sorted(self.phases.items(), key=lambda item: item[1][0])
+            marks = dict(self.marks)
+        span = max([end or 0 for _, (_, end) in phases] + list(marks.values()) + [1e-3])
+        milestones = ", ".join(f"{name} at {at * 1000:.0f} ms" for name, at in sorted(marks.items(), key=lambda m: m[1]))
+        lines = [f"🚀 Startup timeline: {milestones}"]
+        for name, (start, end) in phases:
+            end = end if end is not None else span
+            first = int(start / span * width)
+            bar = " " * first + "█" * max(1, int(end / span * width) - first)
+            lines.append(f"   {name:<12}{start * 1000:>6.0f} → {end * 1000:>6.0f} ms  {bar}")
+        serial = sum((end or span) - start for _, (start, end) in phases)
+        lines.append(f"   one after another the phases would take {serial * 1000:.0f} ms")
+        return "\n".join(lines)
+
+
+def _warm_up_classifier(model, kind):
+    features = np.zeros((1, HAND_SIZE if kind == STATIC else TWO_HAND_SIZE))
+    try:
+        model.predict_proba(features)
+    except AttributeError:
+        model.predict(features)
+
+
+def _release_phase(name, future):
+    if future.cancelled() or future.exception() is not None:
+        return
+    part = future.result()
+    if name.startswith("camera"):
+        part.release()
+    elif name.startswith("tracker") or name == "speech":
+        part.close()
+
+
+class Startup:
+    """Builds the SharedRuntimes for a mode and its sources; every phase on its own thread."""
+
+    def __init__(self, mode, sources, make_speaker=None, realtime=True, loop=False, warm_up=True,
+                 timeline=None, **options):
+        self.mode = mode
+        self.sources = list(sources)
+        self.options = options          # passed on to SharedRuntime (roi, idle_after, ...)
+        self.warm_up = warm_up
+        self.timeline = timeline or StartupTimeline()
+        self._runtimes = None
+        self._cancelled = False
+
+        cameras = len(self.sources)
+        self._executor = ThreadPoolExecutor(max_workers=2 + 2 * cameras, thread_name_prefix="sayable-startup")
+        self.futures = {"speech": self._submit("speech", make_speaker or Speaker),
+                        "model": self._submit("model", self._load_model)}
+        for i, source in enumerate(self.sources):
+            suffix = f" {i + 1}" if cameras > 1 else ""
+            self.futures["camera" + suffix] = self._submit("camera" + suffix, self._open_source, source,
+                                                           realtime, loop)
+            self.futures["tracker" + suffix] = self._submit("tracker" + suffix, self._create_tracker)
+        self._executor.shutdown(wait=False)
+
+    def _submit(self, name, fn, *args):
+        def run():
+            self.timeline.begin(name)
+            try:
+                return fn(*args)
+            finally:
+                self.timeline.end(name)
+        return self._executor.submit(run)
+
+    # === Phases ===
+    def _load_model(self):
+        from sayable.multicam import BatchingModelStore
+        models = BatchingModelStore()
+        model, _ = models.get(self.mode)
+        if self.warm_up:
+            _warm_up_classifier(model, get_mode(self.mode).kind)
+        return models
+
+    def _open_source(self, source, realtime, loop):
+        cap = open_source(source, realtime=realtime, loop=loop)
+        if self.warm_up and isinstance(cap, CameraSource):
+            cap.read()  # a webcam's first frame takes longest; do not make the preview wait for it
+        return cap
+
+    def _create_tracker(self):
+        from sayable.recognizer import create_tracker, tracker_hands, warm_up_tracker
+        hands = create_tracker(max_num_hands=tracker_hands(get_mode(self.mode).kind))
+        if self.warm_up:
+            warm_up_tracker(hands)
+        return hands
+
+    # === Results ===
+    def status(self):
+        """(phase, state, ms) for the loading screen; state is "running", "done" or "failed"."""
+        rows = []
+        for name, future in self.futures.items():
+            if not future.done():
+                rows.append((name, "running", None))
+            else:
+                failed = future.exception() is not None
+                rows.append((name, "failed" if failed else "done", self.timeline.duration_ms(name)))
+        return rows
+
+    def cancel(self):
+        """Give up on this start: phases not begun are dropped, what the others acquire is released."""
+        if self._cancelled:
+            return
+        self._cancelled = True
+        for name, future in self.futures.items():
+            if not future.cancel():
+                future.add_done_callback(lambda future, name=name: _release_phase(name, future))
+
+    @property
+    def done(self):
+        return all(future.done() for future in self.futures.values())
+
+    def runtimes(self):
+        """Wait for every phase and assemble one SharedRuntime per source; re-raises a failed phase."""
+        if self._runtimes is not None:
+            return self._runtimes
+        results = {name: future.result() for name, future in self.futures.items()}
+        from sayable.runtime import SharedRuntime
+        self.timeline.begin("assemble")
+        runtimes = []
+        trackers = [value for name, value in results.items() if name.startswith("tracker")]
+        cameras = [value for name, value in results.items() if name.startswith("camera")]
+        for cap, hands in zip(cameras, trackers):
+            runtime = SharedRuntime(self.mode, source=cap, speaker=results["speech"], models=results["model"],
+                                    **self.options)
+            runtime.hands = hands
+            runtimes.append(runtime)
+        self.timeline.end("assemble")
+        self.timeline.mark("ready")
+        self._runtimes = runtimes
+        return runtimes
@@ -0,0 +1,306 @@
+# sayable/voice_cache.py
+#
+# Pre-synthesized speech. Every vocabulary is small and fixed (26 letters, 10
+# digits, about 20 words per category), so each sign can be rendered to a WAV clip
+# once, per voice and speech rate, and played straight from memory when it is
+# confirmed instead of waiting for pyttsx3 to synthesize it again. The Speaker
+# falls back to live synthesis only for text that has no clip.
+#
+# Clips are keyed by a SHA-256 of (text, voice id, rate), one file per clip,
+# written atomically, so an interrupted build resumes where it stopped. Rendering
+# is spread over a process pool with one pyttsx3 engine per worker (engines are
+# not thread-safe). index.json lists which rates exist for each (text, voice).
+#
+#   python -m sayable.voice_cache build --out voice_cache --voices 0 1 --rates 150 190 240
+
+import argparse
+import hashlib
+import io
+import json
+import os
+import subprocess
+import sys
+import time
+import wave
+from multiprocessing import Pool
+
+from sayable.modes import MODES, format_prediction
+
+# Bump when the way clips are rendered changes
+CACHE_VERSION = 1
+
+
+def clip_key(text, voice, rate):
+    blob = json.dumps([CACHE_VERSION, str(text), voice, int(rate)]).encode()
+    return hashlib.sha256(blob).hexdigest()
+
+
+def phrases(modes=None):
+    """Every text a mode speaks: each class label, plus its display form (what "Repeat" says)."""
+    texts = set()
+    for key in modes or MODES:
+        for label in MODES[key].vocabulary:
+            texts.add(str(label))
+            texts.add(format_prediction(label))
+    return sorted(texts)
+
+
+class VoiceCache:
+    def __init__(self, cache_dir):
+        self.cache_dir = cache_dir
+        self.index_path = os.path.join(cache_dir, "index.json")
+        self._rates = {}   # (text, voice) -> sorted rates with a clip
+        self._clips = {}   # path -> WAV bytes, read on first use
+        self.hits = 0
+        self.misses = 0
+        try:
+            with open(self.index_path, encoding="utf-8") as f:
+                entries = json.load(f)
+        except (OSError, ValueError):
+            entries = []
+        for entry in entries:
+            self.add(entry["text"], entry["voice"], entry["rate"])
+
+    def __len__(self):
+        return sum(len(rates) for rates in self._rates.values())
+
+    def path(self, key):
+        return os.path.join(self.cache_dir, key[:2], key + ".wav")
+
+    def add(self, text, voice, rate):
+        rates = self._rates.setdefault((text, voice), [])
+        if rate not in rates:
+            rates.append(rate)
+            rates.sort()
+
+    def lookup(self, text, voice, rate):
+        """Path of the clip closest to rate for this text and voice, or None."""
+        rates = self._rates.get((str(text), voice))
+        if not rates:
+            self.misses += 1
+            return None
+        self.hits += 1
+        nearest = min(rates, key=lambda r: abs(r - rate))
+        return self.path(clip_key(text, voice, nearest))
+
+    def load(self, path):
+        """The clip's WAV bytes, kept in memory after the first read."""
+        data = self._clips.get(path)
+        if data is None:
+            with open(path, "rb") as f:
+                data = self._clips[path] = f.read()
+        return data
+
+    def preload(self):
+        for (text, voice), rates in self._rates.items():
+            for rate in rates:
+                try:
+                    self.load(self.path(clip_key(text, voice, rate)))
+                except OSError:
+                    pass
+
+    def write_index(self):
+        entries = [{"text": text, "voice": voice, "rate": rate}
+                   for (text, voice), rates in self._rates.items() for rate in rates]
+        tmp_path = f"{self.index_path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(entries, f, ensure_ascii=False, indent=1)
+        os.replace(tmp_path, self.index_path)
+
+
+def wav_duration(data_or_path):
+    source = io.BytesIO(data_or_path) if isinstance(data_or_path, bytes) else data_or_path
+    with wave.open(source, "rb") as clip:
+        return clip.getnframes() / float(clip.getframerate())
+
+
+# === Playback ===
+class _TimedPlayback:
+    """A clip handed to a player we cannot poll: done once its duration has passed."""
+
+    def __init__(self, duration, stop):
+        self._ends_at = time.perf_counter() + duration
+        self._stop = stop
+
+    def is_playing(self):
+        return time.perf_counter() < self._ends_at
+
+    def stop(self):
+        if self.is_playing():
+            self._stop()
+        self._ends_at = 0.0
+
+
+class _ProcessPlayback:
+    def __init__(self, process):
+        self._process = process
+
+    def is_playing(self):
+        return self._process.poll() is None
+
+    def stop(self):
+        if self.is_playing():
+            self._process.terminate()
+
+
+class ClipPlayer:
+    """Plays cached clips without blocking; play() returns a handle with is_playing() and stop().
+
+    Uses simpleaudio if it is installed (plays from memory), winsound on Windows,
+    and otherwise the platform's command-line player.
+    """
+
+    COMMANDS = (["aplay", "-q"], ["paplay"], ["afplay"])
+
+    def __init__(self, cache):
+        self.cache = cache
+        try:
+            import simpleaudio
+            self._simpleaudio = simpleaudio
+        except ImportError:
+            self._simpleaudio = None
+        self._command = None
+        if self._simpleaudio is None and sys.platform != "win32":
+            from shutil import which
+            self._command = next((c for c in self.COMMANDS if which(c[0])), None)
+
+    @property
+    def available(self):
+        return self._simpleaudio is not None or sys.platform == "win32" or self._command is not None
+
+    def play(self, path):
+        if self._simpleaudio is not None:
+            data = self.cache.load(path)
+            return self._simpleaudio.WaveObject.from_wave_read(wave.open(io.BytesIO(data), "rb")).play()
+        if sys.platform == "win32":
+            import winsound
+            # winsound cannot play from memory asynchronously, so it reads the file
+            winsound.PlaySound(path, winsound.SND_FILENAME | winsound.SND_ASYNC | winsound.SND_NODEFAULT)
+            return _TimedPlayback(wav_duration(self.cache.load(path)), lambda: winsound.PlaySound(None, 0))
+        if self._command is None:
+            raise RuntimeError("No audio player for cached clips (install simpleaudio)")
+        return _ProcessPlayback(subprocess.Popen(self._command + [path], stdout=subprocess.DEVNULL,
+                                                 stderr=subprocess.DEVNULL))
+
+
+# === Build (one pyttsx3 engine per worker process) ===
+_engine = None
+
+
+def _init_worker():
+    global _engine
+    import pyttsx3
+    _engine = pyttsx3.init()
+
+
+def _render(task):
+    text, voice, rate, path = task
+    start = time.perf_counter()
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.tmp.wav"
+    if voice is not None:
+        _engine.setProperty("voice", voice)
+    _engine.setProperty("rate", rate)
+    _engine.save_to_file(text, tmp_path)
+    _engine.runAndWait()
+    try:
+        duration = wav_duration(tmp_path)
+    except (OSError, EOFError, wave.Error):
+        # Some drivers (macOS) write AIFF whatever the extension; those clips are not cached
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        return None
+    os.replace(tmp_path, path)
+    return duration, time.perf_counter() - start
+
+
+def voice_ids(indexes):
+    """pyttsx3 voice ids for the given indexes (the order the voice toggle uses)."""
+    import pyttsx3
+    engine = pyttsx3.init()
+    voices = engine.getProperty("voices") or []
+    ids = []
+    for index in indexes:
+        if index < len(voices):
+            ids.append(voices[index].id)
+        else:
+            print(f"⚠️ No voice {index} on this system ({len(voices)} installed)")
+    engine.stop()
+    return ids or [None]
+
+
+def build(cache_dir, texts, voices, rates, workers=1):
+    """Render every missing (text, voice, rate) clip; returns the number rendered."""
+    os.makedirs(cache_dir, exist_ok=True)
+    cache = VoiceCache(cache_dir)
+    tasks = []
+    for voice in voices:
+        for rate in rates:
+            for text in texts:
+                path = cache.path(clip_key(text, voice, rate))
+                if os.path.exists(path):
+                    cache.add(text, voice, rate)
+                else:
+                    tasks.append((text, voice, rate, path))
+
+    total = len(texts) * len(voices) * len(rates)
+    workers = max(1, min(workers, len(tasks) or 1))
+    print(f"🔊 {total} clips: {total - len(tasks)} cached, {len(tasks)} to render with {workers} worker(s)")
+
+    pool = None
+    if not tasks:
+        iterator = iter(())
+    elif workers == 1:
+        _init_worker()
+        iterator = map(_render, tasks)
+    else:
+        pool = Pool(workers, initializer=_init_worker)
+        iterator = pool.imap(_render, tasks, chunksize=1)
+
+    start = time.perf_counter()
+    rendered = failed = 0
+    audio = 0.0
+    try:
+        for done, (task, result) in enumerate(zip(tasks, iterator), 1):
+            if result is None:
+                failed += 1
+            else:
+                rendered += 1
+                audio += result[0]
+                cache.add(task[0], task[1], task[2])
+            sys.stdout.write(f"\r🔊 {done}/{len(tasks)}  {task[0][:24]:<24}")
+            sys.stdout.flush()
+    finally:
+        if pool is not None:
+            pool.close()
+            pool.join()
+        cache.write_index()
+
+    if tasks:
+        print()
+        print(f"✅ Rendered {rendered} clips ({audio:.0f}s of speech) in {time.perf_counter() - start:.1f}s"
+              + (f", {failed} not WAV and skipped" if failed else ""))
+    return rendered
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Pre-synthesize every sign of each vocabulary to WAV")
+    commands = parser.add_subparsers(dest="command", required=True)
+    make = commands.add_parser("build", help="render missing clips")
+    make.add_argument("--out", default="./voice_cache", help="cache folder (default: ./voice_cache)")
+    make.add_argument("--mode", action="append", choices=list(MODES),
+                      help="only this mode's vocabulary (repeatable; default: every mode)")
+    make.add_argument("--voices", type=int, nargs="+", default=[0, 1],
+                      help="voice indexes to render, as used by the voice toggle (default: 0 1)")
+    make.add_argument("--rates", type=int, nargs="+", default=[150],
+                      help="speech rates in words per minute (default: 150, the Speaker's rate)")
+    make.add_argument("--workers", type=int, default=os.cpu_count() or 1,
+                      help="processes rendering speech (default: all cores, 1 = serial)")
+    args = parser.parse_args()
+
+    texts = phrases(args.mode)
+    build(args.out, texts, voice_ids(args.voices), args.rates, args.workers)
+
+
+if __name__ == "__main__":
+    main()
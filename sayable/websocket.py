@@ -0,0 +1,203 @@
+# sayable/websocket.py
+#
+# Just enough of RFC 6455 on top of asyncio streams for the recognition server and
+# its load generator: the HTTP upgrade handshake, masked/unmasked frames,
+# fragmentation, ping/pong and close. Kept dependency-free so the server runs
+# anywhere the rest of SayAble does.
+
+import asyncio
+import base64
+import hashlib
+import os
+import struct
+
+GUID = "258EAFA5-E914-47DA-95CA-C5AB0DC85B11"
+
+CONTINUATION, TEXT, BINARY, CLOSE, PING, PONG = 0x0, 0x1, 0x2, 0x8, 0x9, 0xA
+
+MAX_MESSAGE = 16 * 1024 * 1024  # a 1080p JPEG is well under this
+
+
+class ProtocolError(Exception):
+    def __init__(self, message, code=1002):
+        super().__init__(message)
+        self.code = code   # close code sent to the peer
+
+
+def accept_key(key):
+    digest = hashlib.sha1((key + GUID).encode()).digest()
+    return base64.b64encode(digest).decode()
+
+
+async def read_http_head(reader):
+    """(request or status line, {lower-case header: value}) of an HTTP message head."""
+    head = await reader.readuntil(b"\r\n\r\n")
+    lines = head.decode("latin-1").split("\r\n")
+    headers = {}
+    for line in lines[1:]:
+        if ":" in line:
+            name, value = line.split(":", 1)
+            headers[name.strip().lower()] = value.strip()
+    return lines[0], headers
+
+
+def encode_frame(opcode, payload, mask=False):
+    header = bytearray([0x80 | opcode])
+    mask_bit = 0x80 if mask else 0
+    length = len(payload)
+    if length < 126:
+        header.append(mask_bit | length)
+    elif length < 1 << 16:
+        header.append(mask_bit | 126)
+        header += struct.pack("!H", length)
+    else:
+        header.append(mask_bit | 127)
+        header += struct.pack("!Q", length)
+    if mask:
+        key = os.urandom(4)
+        header += key
+        payload = _apply_mask(payload, key)
+    return bytes(header) + payload
+
+
+def _apply_mask(payload, key):
+    # XOR with the repeating 4-byte key, done as one big-integer operation
+    n = len(payload)
+    if n == 0:
+        return b""
+    repeated = (key * (n // 4 + 1))[:n]
+    return (int.from_bytes(payload, "little") ^ int.from_bytes(repeated, "little")).to_bytes(n, "little")
+
+
+class WebSocket:
+    def __init__(self, reader, writer, client=False):
+        self.reader = reader
+        self.writer = writer
+        self.client = client   # clients mask what they send, servers must not
+        self.closed = False
+
+    async def recv(self):
+        """Next text (str) or binary (bytes) message, or None once the connection closes."""
+        opcode = None
+        parts = []
+        size = 0
+        while True:
+            try:
+                fin, frame_opcode, payload = await self._read_frame()
+            except (asyncio.IncompleteReadError, ConnectionError):
+                self.closed = True
+                return None
+            except ProtocolError as e:
+                await self._fail(e)
+
+            if frame_opcode == CLOSE:
+                if not self.closed:
+                    await self._send_frame(CLOSE, payload[:2])
+                self.closed = True
+                return None
+            if frame_opcode == PING:
+                await self._send_frame(PONG, payload)
+                continue
+            if frame_opcode == PONG:
+                continue
+
+            if frame_opcode != CONTINUATION:
+                opcode = frame_opcode
+            parts.append(payload)
+            size += len(payload)
+            if size > MAX_MESSAGE:
+                await self._fail(ProtocolError("message too large", 1009))
+            if fin:
+                data = b"".join(parts)
+                if opcode != TEXT:
+                    return data
+                try:
+                    return data.decode()
+                except UnicodeDecodeError:
+                    await self._fail(ProtocolError("text message is not valid UTF-8", 1007))
+
+    async def send(self, data):
+        if isinstance(data, str):
+            await self._send_frame(TEXT, data.encode())
+        else:
+            await self._send_frame(BINARY, bytes(data))
+
+    async def close(self):
+        if not self.closed:
+            self.closed = True
+            try:
+                await self._send_frame(CLOSE, struct.pack("!H", 1000))
+            except ConnectionError:
+                pass
+        self.writer.close()
+
+    async def _read_frame(self):
+        first, second = await self.reader.readexactly(2)
+        fin = bool(first & 0x80)
+        opcode = first & 0x0F
+        masked = bool(second & 0x80)
+        if masked == self.client:
+            # RFC 6455 5.1: every client frame is masked, no server frame is
+            raise ProtocolError("masked frame from server" if self.client else "unmasked frame from client")
+        length = second & 0x7F
+        if length == 126:
+            length, = struct.unpack("!H", await self.reader.readexactly(2))
+        elif length == 127:
+            length, = struct.unpack("!Q", await self.reader.readexactly(8))
+        if length > MAX_MESSAGE:
+            raise ProtocolError("frame too large", 1009)
+        key = await self.reader.readexactly(4) if masked else None
+        payload = await self.reader.readexactly(length)
+        if key is not None:
+            payload = _apply_mask(payload, key)
+        return fin, opcode, payload
+
+    async def _fail(self, error):
+        """Close with the error's code, then raise it."""
+        if not self.closed:
+            self.closed = True
+            try:
+                await self._send_frame(CLOSE, struct.pack("!H", error.code))
+            except ConnectionError:
+                pass
+        raise error
+
+    async def _send_frame(self, opcode, payload):
+        self.writer.write(encode_frame(opcode, payload, mask=self.client))
+        # Waits while the peer is not reading, which is what pushes back on a fast sender
+        await self.writer.drain()
+
+
+async def accept(reader, writer, headers):
+    """Finish the server side of the upgrade for an already-read request head."""
+    key = headers.get("sec-websocket-key")
+    if not key:
+        raise ProtocolError("missing Sec-WebSocket-Key")
+    writer.write((
+        "HTTP/1.1 101 Switching Protocols\r\n"
+        "Upgrade: websocket\r\n"
+        "Connection: Upgrade\r\n"
+        f"Sec-WebSocket-Accept: {accept_key(key)}\r\n\r\n"
+    ).encode())
+    await writer.drain()
+    return WebSocket(reader, writer)
+
+
+async def connect(host, port, path="/"):
+    """Client side: open a connection and perform the upgrade handshake."""
+    reader, writer = await asyncio.open_connection(host, port)
+    key = base64.b64encode(os.urandom(16)).decode()
+    writer.write((
+        f"GET {path} HTTP/1.1\r\n"
+        f"Host: {host}:{port}\r\n"
+        "Upgrade: websocket\r\n"
+        "Connection: Upgrade\r\n"
+        f"Sec-WebSocket-Key: {key}\r\n"
+        "Sec-WebSocket-Version: 13\r\n\r\n"
+    ).encode())
+    await writer.drain()
+    status, headers = await read_http_head(reader)
+    if status.split()[1:2] != ["101"] or headers.get("sec-websocket-accept") != accept_key(key):
+        writer.close()
+        raise ProtocolError(f"handshake failed: {status}")
+    return WebSocket(reader, writer, client=True)
@@ -0,0 +1,73 @@
+# sayable/window.py
+#
+# Sliding window over the per-frame landmark vectors used by the word-level modes.
+# The models were trained on the mean of the window, so instead of rebuilding a
+# (20, 84) array and averaging it on every frame we keep a preallocated ring buffer
+# and a running column sum: each new frame costs one subtract and one add.
+
+import numpy as np
+
+
+class SlidingWindow:
+    def __init__(self, length, width=84):
+        self.width = width
+        self._allocate(length)
+
+    def _allocate(self, length):
+        self.length = length
+        self._buffer = np.zeros((length, self.width), dtype=np.float64)
+        self._sum = np.zeros(self.width, dtype=np.float64)
+        self._mean = np.zeros((1, self.width), dtype=np.float64)
+        self._head = 0      # next slot to overwrite
+        self._count = 0
+
+    @property
+    def maxlen(self):
+        return self.length
+
+    def __len__(self):
+        return self._count
+
+    def __iter__(self):
+        # Oldest to newest, like the deque this replaces
+        start = (self._head - self._count) % self.length
+        for i in range(self._count):
+            yield self._buffer[(start + i) % self.length]
+
+    def append(self, row):
+        slot = self._buffer[self._head]
+        if self._count == self.length:
+            self._sum -= slot
+        else:
+            self._count += 1
+        slot[:] = row
+        self._sum += slot
+
+        self._head = (self._head + 1) % self.length
+        if self._head == 0 and self._count == self.length:
+            # Once per lap the buffer is in chronological order again; re-add it the
+            # way np.mean does so rounding from the add/subtract updates never builds up
+            np.add.reduce(self._buffer, axis=0, out=self._sum)
+
+    def clear(self):
+        self._buffer.fill(0.0)
+        self._sum.fill(0.0)
+        self._head = 0
+        self._count = 0
+
+    def resize(self, length):
+        """Change the window length in place, keeping the newest frames."""
+        if length == self.length:
+            return
+        rows = list(self)[-length:]
+        self._allocate(length)
+        for row in rows:
+            self.append(row)
+
+    def mean(self):
+        """Window mean as a (1, width) row, ready for predict_proba.
+
+        The returned array is reused by the next call; copy it to keep it.
+        """
+        np.divide(self._sum, max(self._count, 1), out=self._mean[0])
+        return self._mean
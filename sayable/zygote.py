@@ -0,0 +1,92 @@
+# sayable/zygote.py
+#
+# Prefork launcher for running each mode in a process of its own (main_window.py
+# --separate-processes). Starting a mode cold means a fresh interpreter importing
+# cv2, MediaPipe, numpy, sklearn and ttkbootstrap before it can even open a window,
+# which takes seconds. ModeLauncher instead keeps a zygote: multiprocessing's fork
+# server, started as soon as the launcher opens, imports all of that once and then
+# forks every mode process from itself, so a child starts with everything loaded.
+#
+# Children are tracked per mode: clicking a mode that is already running sends its
+# window a "show" over a Pipe instead of starting a duplicate, and closing the
+# launcher sends every child "quit". Windows has no fork, so there every child is
+# spawned cold, but the tracking and reuse still apply. Two modes are two processes:
+# they cannot share one webcam, which is why the in-process launcher is the default.
+
+import multiprocessing
+import sys
+
+# Imported once by the zygote; a module that is not installed is skipped
+PRELOAD = [
+    "numpy", "cv2", "mediapipe", "sklearn.ensemble", "PIL.ImageTk", "tkinter", "ttkbootstrap",
+    "sayable.app", "sayable.recognizer", "sayable.runtime", "sayable.startup",
+]
+
+
+def run_mode(mode, control):
+    """Body of a mode process: the usual recognition window, taking commands from control."""
+    from sayable.app import main
+    main(mode, argv=[], control=control)
+
+
+class ModeLauncher:
+    def __init__(self, preload=PRELOAD, method=None):
+        # method="spawn" starts every child cold, as launching a mode script would
+        if method in (None, "forkserver") and "forkserver" in multiprocessing.get_all_start_methods():
+            self.method = "forkserver"
+            self._context = multiprocessing.get_context("forkserver")
+            self._context.set_forkserver_preload(list(preload))
+        else:
+            self.method = "spawn"
+            self._context = multiprocessing.get_context("spawn")
+        self.children = {}   # mode -> (Process, control Connection)
+        self.launches = 0
+        self.reuses = 0
+
+    def warm(self):
+        """Start the zygote now, so its imports are done by the time a mode is clicked."""
+        if self.method == "forkserver":
+            from multiprocessing import forkserver
+            forkserver.ensure_running()
+
+    def running(self):
+        """Modes whose process is still alive; finished ones are forgotten."""
+        for mode, (process, conn) in list(self.children.items()):
+            if not process.is_alive():
+                process.join()
+                conn.close()
+                del self.children[mode]
+        return list(self.children)
+
+    def launch(self, mode, target=run_mode, args=()):
+        """Bring a running mode to the front, or fork a new process for it."""
+        if mode in self.running():
+            process, conn = self.children[mode]
+            try:
+                conn.send("show")
+                self.reuses += 1
+                return process
+            except OSError:
+                pass  # exiting right now: start a fresh one
+        conn, child_conn = self._context.Pipe()
+        process = self._context.Process(target=target, args=(mode, child_conn) + tuple(args),
+                                        name=f"sayable-{mode}")
+        process.start()
+        child_conn.close()
+        self.children[mode] = (process, conn)
+        self.launches += 1
+        return process
+
+    def shutdown(self, timeout=3.0):
+        for process, conn in self.children.values():
+            try:
+                conn.send("quit")
+            except OSError:
+                pass
+        for process, conn in self.children.values():
+            process.join(timeout)
+            if process.is_alive():
+                print(f"⚠️ {process.name} did not quit; terminating it", file=sys.stderr)
+                process.terminate()
+            conn.close()
+        self.children.clear()